@@ -13,6 +13,8 @@ import sys
 import os
 import json
 import asyncio
+import importlib.util
+import threading
 import time
 import aiohttp
 from datetime import datetime
@@ -31,6 +33,21 @@ limiter = Limiter(key_func=get_remote_address)
 # Add SKG core to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'skg-core'))
 
+# One SKGCore per process, created by the first request that needs it: a
+# warm start replays every persisted triple, far too slow to do per request
+_skg = None
+_skg_lock = threading.Lock()
+
+def get_skg():
+    """The shared SKGCore (import and warm start happen on first call)"""
+    global _skg
+    if _skg is None:
+        with _skg_lock:
+            if _skg is None:
+                from skg.core import SKGCore
+                _skg = SKGCore()
+    return _skg
+
 from caleon.routers.ingest_clusters import router as ingest_router
 
 # Worker registry
@@ -128,15 +145,16 @@ class PredicateModel(BaseModel):
 async def health_check():
     """Comprehensive system health check"""
     try:
-        # Try to import and check SKG core
-        from skg.core import SKGCore
+        # Check SKG core is installed without importing it (no cold start here)
+        if importlib.util.find_spec("skg") is None:
+            raise ImportError("skg-core not found")
         
         return {
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
             "services": {
                 "main_api": "operational",
-                "skg_core": "available",
+                "skg_core": "loaded" if _skg is not None else "available",
                 "file_system": "accessible"
             },
             "system_info": {
@@ -271,12 +289,17 @@ async def sign_cali():
     
     return html_path.read_text()
 
+def _bulk_add(skg, triples):
+    """One bulk session – the flush (rebuild, repair, expansion) runs here,
+    so call it off the event loop."""
+    with skg.bulk_load():
+        skg.add_triples(triples)
+
 @app.post("/knowledge/upload")
 async def upload_knowledge(upload: KnowledgeUpload):
     """Upload knowledge files in various formats"""
     try:
-        from skg.core import SKGCore
-        skg = SKGCore()
+        skg = await asyncio.to_thread(get_skg)
         
         triples_added = 0
         bootstrap_triggered = False
@@ -292,7 +315,7 @@ async def upload_knowledge(upload: KnowledgeUpload):
                     if len(parts) >= 3:
                         triples.append((parts[0].strip(), parts[1].strip(), parts[2].strip()))
             
-            skg.add_triples(triples)
+            await asyncio.to_thread(_bulk_add, skg, triples)
             triples_added = len(triples)
             
         elif upload.format.lower() == "json":
@@ -300,13 +323,14 @@ async def upload_knowledge(upload: KnowledgeUpload):
             data = json.loads(upload.data)
             if "triples" in data:
                 triples = [(t["s"], t["p"], t["o"]) for t in data["triples"]]
-                skg.add_triples(triples)
+                await asyncio.to_thread(_bulk_add, skg, triples)
                 triples_added = len(triples)
         
         # Check if bootstrap was triggered
-        total_facts = sum(level.number_of_edges() for level in skg.levels.values())
+        state = skg.state()
+        total_facts = sum(state.shape(k)[1] for k in state.levels)
         if total_facts >= 50 and not skg.bootstrap_triggered:
-            skg.expand_recursive()
+            await asyncio.to_thread(skg.expand_recursive)
             bootstrap_triggered = True
             new_predicates = list(skg.invented_predicates)
         
@@ -325,8 +349,16 @@ async def upload_knowledge(upload: KnowledgeUpload):
 async def query_knowledge(q: str, format: str = "json", limit: int = 50):
     """Natural language knowledge querying with pattern recognition"""
     try:
-        from skg.core import SKGCore
-        skg = SKGCore()
+        skg = await asyncio.to_thread(get_skg)
+        from skg.cache import dependencies
+
+        # Dashboards poll the same questions: serve them from the SKG's query
+        # cache until a write lands (a term can match any triple of any level)
+        version = skg.version
+        key = ("knowledge", tuple(sorted(set(q.lower().split()))), limit)
+        body = skg.cache.get(key, version)
+        if body is not None:
+            return {"query": q, **body, "cached": True}
         
         # Simple pattern matching for demo (in production use NLP)
         results = []
@@ -335,9 +367,12 @@ async def query_knowledge(q: str, format: str = "json", limit: int = 50):
         # Search for patterns in query
         query_lower = q.lower()
         
-        # Look through all levels for relevant information
-        for level_num, graph in skg.levels.items():
-            for u, v, data in graph.edges(data=True):
+        # Look through all levels of one pinned version – the nx views in
+        # skg.levels are edited in place by the ingest and scheduler threads
+        state = skg.state()
+        levels = sorted(set(state.levels) | {0})
+        for level_num in levels:
+            for u, v, data in skg.edges(level_num, state):
                 predicate = data.get('predicate', '')
                 
                 # Check if query terms match any part of the triple
@@ -363,22 +398,29 @@ async def query_knowledge(q: str, format: str = "json", limit: int = 50):
                         "density": data.get('density', 0.0)
                     })
         
-        return {
-            "query": q,
+        body = {
             "results": results[:limit],
             "invented_connections": invented_connections,
             "total_matches": len(results)
         }
+        deps = set().union(*(dependencies([None, None, None], k) for k in levels))
+        skg.cache.put(key, body, deps, version)
+        return {"query": q, **body, "cached": False}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/knowledge/cache")
+async def knowledge_cache():
+    """Hit/miss counters of the SKG query result cache"""
+    skg = await asyncio.to_thread(get_skg)
+    return skg.cache.stats()
+
 @app.get("/curiosity/goals")
 async def get_curiosity_goals():
     """Retrieve current autonomous research goals"""
     try:
-        from skg.core import SKGCore
-        skg = SKGCore()
+        skg = await asyncio.to_thread(get_skg)
         
         # Initialize curiosity if not already active
         if not hasattr(skg, 'curiosity_goals'):
@@ -389,7 +431,7 @@ async def get_curiosity_goals():
         return {
             "active_goals": goals,
             "goal_count": len(goals),
-            "daemon_status": "active" if hasattr(skg, '_curiosity_daemon') else "inactive",
+            "daemon_status": "active" if "curiosity" in skg.scheduler else "inactive",
             "last_update": datetime.now().isoformat()
         }
         
@@ -400,8 +442,7 @@ async def get_curiosity_goals():
 async def seed_curiosity(seeding: CuriositySeeding):
     """Seed curiosity daemon with unknown entities for exploration"""
     try:
-        from skg.core import SKGCore
-        skg = SKGCore()
+        skg = await asyncio.to_thread(get_skg)
         
         # Add unknown entities to trigger curiosity
         unknown_triples = []
@@ -432,8 +473,7 @@ async def seed_curiosity(seeding: CuriositySeeding):
 async def system_info():
     """Get comprehensive system information and capabilities"""
     try:
-        from skg.core import SKGCore
-        skg = SKGCore()
+        skg = await asyncio.to_thread(get_skg)
 
         vault_info = {}
         if vault_integrator is not None:
@@ -469,7 +509,7 @@ async def system_info():
                 "bootstrap_triggered": getattr(skg, 'bootstrap_triggered', False),
                 "invented_predicates": len(getattr(skg, 'invented_predicates', [])),
                 "curiosity_goals": len(getattr(skg, 'curiosity_goals', [])),
-                "total_facts": sum(level.number_of_edges() for level in skg.levels.values()),
+                "total_facts": sum(skg.state().shape(k)[1] for k in skg.state().levels),
                 "vault_system": vault_info
             },
             "patent_status": "PATENT PENDING - Multiple applications filed Q1 2025",
@@ -514,7 +554,7 @@ async def root():
         "key_endpoints": {
             "signature": "GET /sign-cali - AGI demonstration page",
             "health": "GET /health - System health check",
-            "knowledge": "POST /knowledge/upload, GET /knowledge/query",
+            "knowledge": "POST /knowledge/upload, GET /knowledge/query, GET /knowledge/cache",
             "curiosity": "GET /curiosity/goals, POST /curiosity/seed",
             "system": "GET /system/info - Comprehensive system information",
             "vault": "GET /vault/status, POST /vault/reasoning/*, GET /vault/reflections - Advanced consciousness framework"
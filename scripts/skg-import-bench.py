@@ -0,0 +1,53 @@
+"""Cold-start import benchmark for skg-core.
+
+Each run imports the target in a fresh interpreter and reports wall time,
+peak RSS and which heavy optional dependencies it dragged in:
+
+    python scripts/skg-import-bench.py                 # skg.core, 5 runs
+    python scripts/skg-import-bench.py skg skg_api -n 10
+    python scripts/skg-import-bench.py --max-ms 500    # exit 1 over budget (CI)
+"""
+import argparse, json, os, statistics, subprocess, sys
+from pathlib import Path
+
+SKG_CORE = Path(__file__).resolve().parent.parent / "skg-core"
+HEAVY = ["torch", "torch_geometric", "networkx", "flask", "scipy.sparse.linalg", "fastapi"]
+
+PROBE = """
+import json, resource, sys, time
+t = time.perf_counter()
+import {module}
+wall = time.perf_counter() - t
+print(json.dumps({{
+    "ms": wall * 1000,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+def probe(module):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SKG_CORE), os.environ.get("PYTHONPATH")])))
+    out = subprocess.run([sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY)],
+                         capture_output=True, text=True, env=env, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=["skg.core"])
+    parser.add_argument("-n", "--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if a median exceeds this")
+    args = parser.parse_args()
+
+    over = False
+    for module in args.modules:
+        runs = [probe(module) for _ in range(args.runs)]
+        ms = statistics.median(r["ms"] for r in runs)
+        rss = max(r["rss_mb"] for r in runs)
+        loaded = runs[-1]["loaded"]
+        print(f"{module:<20} median {ms:8.1f} ms   peak rss {rss:7.1f} MB   "
+              f"heavy: {', '.join(loaded) or '-'}")
+        over |= args.max_ms is not None and ms > args.max_ms
+    sys.exit(1 if over else 0)
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,13 @@ setup(
     name="skg-core",
     version="0.1.0",
     packages=find_packages(),
-    install_requires=["torch", "networkx", "torch-geometric", "flask"],
+    # minimal install is torch-free: heuristic edge proposers, queries, snapshots
+    install_requires=["numpy", "scipy", "networkx"],
+    extras_require={
+        "gnn": ["torch", "torch-geometric"],        # propose="gcn"
+        "service": ["flask"],                       # SKGService / `skg` daemon
+        "full": ["torch", "torch-geometric", "flask"],
+    },
     entry_points={"console_scripts":["skg=skg.daemon:main"]},
     python_requires=">=3.9",
-)
\ No newline at end of file
+)
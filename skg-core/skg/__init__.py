@@ -1,7 +1,23 @@
 # cognition/skg/__init__.py  –  clean, final version (Dec 2025)
+# Names resolve on first access (PEP 562): `import skg` loads nothing heavy,
+# and the GCN backend (torch) and Flask only load when something uses them.
+import importlib
 
-from .core import SKGCore
-from .core import SKGService
-from .core import Knowledge   # if you use the client class directly
+_EXPORTS = {
+    "SKGCore": ".core",
+    "SKGService": ".core",
+    "Knowledge": ".core",   # if you use the client class directly
+}
 
-__all__ = ["SKGCore", "SKGService", "Knowledge"]
\ No newline at end of file
+__all__ = ["SKGCore", "SKGService", "Knowledge"]
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,189 @@
+# cognition/skg/bgp.py  –  conjunctive basic-graph-pattern queries over the K⁰ triple store
+from collections import defaultdict
+from itertools import islice
+
+POSITIONS = "spo"
+
+def is_var(term):
+    return isinstance(term, str) and len(term) > 1 and term.startswith("?")
+
+class Pattern:
+    """One `[s, p, o]` of a query.  `?name` terms are variables, None is an
+    anonymous variable that is never returned."""
+
+    def __init__(self, terms, index):
+        terms = list(terms) + [None] * (3 - len(terms))
+        if len(terms) != 3:
+            raise ValueError(f"pattern {index} has more than three terms: {terms!r}")
+        self.index = index
+        self.terms = tuple(f"?_{index}{POSITIONS[i]}" if t is None else t for i, t in enumerate(terms))
+        self.vars  = [t for t in dict.fromkeys(self.terms) if is_var(t)]
+
+    def consts(self):
+        """Label pattern with every variable as a wildcard (for estimates)."""
+        return tuple(None if is_var(t) else t for t in self.terms)
+
+    def position(self, var):
+        return POSITIONS[self.terms.index(var)]
+
+    def __repr__(self):
+        return "[" + ", ".join(map(str, self.terms)) + "]"
+
+class Step:
+    """Join `pattern` into the solutions so far by `method`:
+
+    scan   first pattern – read its index range
+    index  per solution, look the pattern up with the shared variables bound
+    hash   scan the pattern once into a table keyed by the shared variables, probe
+    merge  both inputs sorted on the one shared variable, walked in step"""
+
+    def __init__(self, pattern, method, shared, estimate, rows):
+        self.pattern, self.method, self.shared = pattern, method, shared
+        self.estimate, self.rows = estimate, rows
+
+    def explain(self):
+        return {"pattern": list(self.pattern.terms), "method": self.method,
+                "join_on": self.shared, "estimate": self.estimate, "rows": round(self.rows, 1)}
+
+class Plan:
+    def __init__(self, store, patterns):
+        self.store = store
+        self.patterns = [Pattern(p, i) for i, p in enumerate(patterns)]
+        if not self.patterns:
+            raise ValueError("a query needs at least one pattern")
+        self.vars = list(dict.fromkeys(v for p in self.patterns for v in p.vars))
+        self.slot = {v: i for i, v in enumerate(self.vars)}
+        self.space = {}             # var → "node" | "pred" (separate id spaces)
+        for p in self.patterns:
+            for i, t in enumerate(p.terms):
+                if is_var(t):
+                    kind = "pred" if i == 1 else "node"
+                    if self.space.setdefault(t, kind) != kind:
+                        raise ValueError(f"{t} is used both as a predicate and as a node")
+        self.steps = self._order()
+
+    # ---- planning ----
+    def _order(self):
+        """Greedy left-deep order: the cheapest pattern connected to what is
+        already bound (no cartesian products while a connected one is left),
+        each joined by whichever method the cardinality estimates favour."""
+        store, remaining, bound, steps, rows = self.store, list(self.patterns), set(), [], 1.0
+        while remaining:
+            connected = [p for p in remaining if bound & set(p.vars)] or remaining
+            best = min(connected, key=lambda p: (store.estimate(*p.consts()), p.index))
+            est = store.estimate(*best.consts())
+            shared = [v for v in best.vars if v in bound]
+            if not steps:
+                method, out = "scan", float(est)
+            elif not shared:
+                method, out = "hash", rows * est        # cartesian product
+            else:
+                distinct = max(max(store.distinct(best.position(v)) for v in shared), 1)
+                out = max(rows * est / distinct, 1.0)
+                if rows <= est:
+                    method = "index"                    # few probes beat one big scan
+                elif len(steps) == 1 and len(shared) == 1:
+                    method = "merge"
+                else:
+                    method = "hash"
+            steps.append(Step(best, method, shared, est, out))
+            remaining.remove(best)
+            bound |= set(best.vars)
+            rows = out
+        return steps
+
+    def explain(self):
+        return [s.explain() for s in self.steps]
+
+    # ---- execution ----
+    def _ids(self, pattern, solution=None):
+        """Id pattern with constants (and vars bound in `solution`) resolved;
+        None if a constant is not in the store."""
+        store, out = self.store, []
+        for i, t in enumerate(pattern.terms):
+            if is_var(t):
+                out.append(None if solution is None else solution[self.slot[t]])
+                continue
+            tid = (store.preds if i == 1 else store.nodes).id(t)
+            if tid is None:
+                return None
+            out.append(tid)
+        return out
+
+    def _rows(self, pattern, ids):
+        """(var values…) for every stored triple matching `ids`, in
+        `pattern.vars` order; repeated variables must agree."""
+        if ids is None:
+            return
+        where = [[i for i, t in enumerate(pattern.terms) if t == v] for v in pattern.vars]
+        for triple in self.store.match_ids(*ids):
+            if all(triple[i] == triple[pos[0]] for pos in where for i in pos[1:]):
+                yield tuple(triple[pos[0]] for pos in where)
+
+    def _extend(self, solution, pattern, values):
+        out = list(solution)
+        for v, x in zip(pattern.vars, values):
+            out[self.slot[v]] = x
+        return tuple(out)
+
+    def _index(self, step, stream):
+        for sol in stream:
+            for values in self._rows(step.pattern, self._ids(step.pattern, sol)):
+                yield self._extend(sol, step.pattern, values)
+
+    def _hash(self, step, stream):
+        pattern = step.pattern
+        keys = [pattern.vars.index(v) for v in step.shared]
+        table = defaultdict(list)
+        for values in self._rows(pattern, self._ids(pattern)):
+            table[tuple(values[i] for i in keys)].append(values)
+        slots = [self.slot[v] for v in step.shared]
+        for sol in stream:
+            for values in table.get(tuple(sol[i] for i in slots), ()):
+                yield self._extend(sol, pattern, values)
+
+    def _merge(self, step, stream):
+        pattern, var = step.pattern, step.shared[0]
+        key, slot = pattern.vars.index(var), self.slot[var]
+        left = sorted(stream, key=lambda sol: sol[slot])
+        right = sorted(self._rows(pattern, self._ids(pattern)), key=lambda values: values[key])
+        i = j = 0
+        while i < len(left) and j < len(right):
+            a, b = left[i][slot], right[j][key]
+            if a < b:
+                i += 1
+            elif b < a:
+                j += 1
+            else:
+                j_end = j
+                while j_end < len(right) and right[j_end][key] == a:
+                    j_end += 1
+                while i < len(left) and left[i][slot] == a:
+                    for values in right[j:j_end]:
+                        yield self._extend(left[i], pattern, values)
+                    i += 1
+                j = j_end
+
+    def solutions(self):
+        """Id tuples (one slot per variable), produced lazily – stop pulling and
+        no further work is done beyond the build side of a hash or merge join."""
+        stream = iter([(None,) * len(self.vars)])
+        for step in self.steps:
+            join = {"scan": self._index, "index": self._index,
+                    "hash": self._hash, "merge": self._merge}[step.method]
+            stream = join(step, stream)
+        return stream
+
+    def run(self, limit=None):
+        """Up to `limit` solutions as {var name: label}; anonymous vars dropped."""
+        nodes, preds = self.store.nodes, self.store.preds
+        named = [(v[1:], self.slot[v], preds if self.space[v] == "pred" else nodes)
+                 for v in self.vars if not v.startswith("?_")]
+        return [{name: table.label(sol[i]) for name, i, table in named}
+                for sol in islice(self.solutions(), limit)]
+
+def plan(store, patterns):
+    return Plan(store, patterns)
+
+def select(store, patterns, limit=None):
+    return Plan(store, patterns).run(limit)
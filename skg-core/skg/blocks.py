@@ -0,0 +1,104 @@
+# cognition/skg/blocks.py  –  lazy block operator over the SKG levels
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator
+
+class BlockOperator(LinearOperator):
+    """The depth×depth SKG block matrix without materialising it.
+
+    Block (i, j) is level min(i, j) when |i - j| ≤ 1 and empty otherwise, so
+    the operator only holds references to the level CSR matrices.  Products
+    (matvec / matmat / rmatvec) run block-wise, rows and slices are assembled
+    from the touched block rows only, and `to_dense()` / `tocsr()` build the
+    full matrix explicitly when a caller really wants it."""
+
+    def __init__(self, levels):
+        self.levels = [sp.csr_matrix(adj, dtype=float) for adj in levels]
+        self.depth  = len(self.levels)
+        self.n      = self.levels[0].shape[0] if self.levels else 0
+        if any(adj.shape != (self.n, self.n) for adj in self.levels):
+            raise ValueError("block levels must share one square shape")
+        super().__init__(dtype=np.dtype(float), shape=(self.depth * self.n,) * 2)
+
+    def block(self, i, j):
+        """Level matrix at block (i, j), or None for an empty block."""
+        return self.levels[min(i, j)] if abs(i - j) <= 1 else None
+
+    def _neighbours(self, i):
+        return range(max(i - 1, 0), min(i + 2, self.depth))
+
+    # ---- products ----
+    def _matmat(self, X):
+        X = np.asarray(X, dtype=float).reshape(self.shape[1], -1)
+        n, Y = self.n, np.zeros((self.shape[0], X.shape[1]))
+        for i in range(self.depth):
+            for j in self._neighbours(i):
+                Y[i*n:(i+1)*n] += self.block(i, j) @ X[j*n:(j+1)*n]
+        return Y
+
+    def _matvec(self, x):
+        return self._matmat(x).ravel()
+
+    def _rmatvec(self, x):
+        x = np.asarray(x, dtype=float).ravel()
+        n, y = self.n, np.zeros(self.shape[1])
+        for i in range(self.depth):
+            for j in self._neighbours(i):
+                y[j*n:(j+1)*n] += self.block(i, j).T @ x[i*n:(i+1)*n]
+        return y
+
+    def _adjoint(self):
+        return _Transposed(self)
+
+    # ---- rows and slices ----
+    def rows(self, index):
+        """CSR of the requested global rows (int, slice or array), built from
+        the block rows they fall in – never the whole matrix."""
+        index = np.atleast_1d(np.arange(self.shape[0])[index])
+        if not index.size:
+            return sp.csr_matrix((0, self.shape[1]))
+        block_row, local = np.divmod(index, self.n)
+        pieces, order = [], []
+        for i in np.unique(block_row).tolist():
+            sel = np.flatnonzero(block_row == i)
+            pieces.append(sp.hstack([self._piece(i, j, local[sel]) for j in range(self.depth)],
+                                    format="csr"))
+            order.append(sel)
+        out = sp.vstack(pieces, format="csr")
+        return out[np.argsort(np.concatenate(order), kind="stable")]
+
+    def _piece(self, i, j, local):
+        blk = self.block(i, j)
+        return sp.csr_matrix((len(local), self.n)) if blk is None else blk[local]
+
+    def getrow(self, r):
+        return self.rows(int(r))
+
+    def __getitem__(self, key):
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+        out = self.rows(rows)
+        if not (isinstance(cols, slice) and cols == slice(None)):
+            out = out[:, cols]
+        if np.isscalar(rows) and np.isscalar(cols):
+            return out[0, 0]
+        return out
+
+    # ---- explicit materialisation ----
+    def tocsr(self):
+        if not self.depth:
+            return sp.csr_matrix((0, 0))
+        return sp.bmat([[self.block(i, j) for j in range(self.depth)]
+                        for i in range(self.depth)], format="csr")
+
+    def to_dense(self):
+        """Full ndarray – (depth·V)² floats, only sensible for small graphs."""
+        return self.tocsr().toarray()
+
+class _Transposed(LinearOperator):
+    def __init__(self, op):
+        self.op = op
+        super().__init__(dtype=op.dtype, shape=op.shape[::-1])
+    def _matvec(self, x):
+        return self.op._rmatvec(x)
+    def _rmatvec(self, x):
+        return self.op._matvec(x)
@@ -0,0 +1,113 @@
+# cognition/skg/cache.py  –  LRU of query results, dropped by the index keys a write touches
+import threading
+from collections import OrderedDict, defaultdict
+
+QUERY_CACHE_SIZE = 1024     # cached results per core
+EVERYTHING = (0, None, None, None)   # index key every K⁰ write touches
+
+def pattern_key(pat):
+    """K⁰ index key of a [s, p, o] pattern, padded to three terms (None =
+    wildcard).  Terms are kept exactly as the store will see them, so the
+    key matches the `index_keys` of every triple the pattern can return."""
+    return (0,) + tuple((list(pat) + [None] * 3)[:3])
+
+def index_keys(triple):
+    """Every index key a write of `triple` touches: each of its eight
+    (s | *, p | *, o | *) prefixes, i.e. the patterns it can match."""
+    s, p, o = triple
+    return [(0, a, b, c) for a in (s, None) for b in (p, None) for c in (o, None)]
+
+def dependencies(pat, level):
+    """What a query result depends on: its own K⁰ pattern, or a whole derived
+    level (rebuilt as one matrix)."""
+    return {pattern_key(pat)} if level == 0 else {("level", level)}
+
+class QueryCache:
+    """Bounded LRU of query results.  An entry is stored with the graph
+    version it was computed at and the index keys it depends on; a write
+    drops exactly the entries whose keys it touched, so an entry stays valid
+    across every version whose writes never came near it.
+
+    A result computed at a version older than the newest invalidation is
+    refused – the write may have landed mid-computation.  Cached values are
+    shared between callers and must be treated as read-only."""
+
+    def __init__(self, size=QUERY_CACHE_SIZE):
+        self.size     = size
+        self.version  = 0               # newest version an invalidation ran for
+        self._entries = OrderedDict()   # key → (version, value, deps)
+        self._deps    = defaultdict(set)   # index key → cache keys depending on it
+        self._lock    = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = self.rejected = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, version=None):
+        """Cached value for `key`, or None.  A reader pinned at `version` never
+        sees a result computed at a later version."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (version is not None and entry[0] > version):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value, deps, version):
+        """Store `value`, computed at `version`; False if refused."""
+        with self._lock:
+            if version < self.version:
+                self.rejected += 1
+                return False
+            self._drop(key)
+            self._entries[key] = (version, value, frozenset(deps))
+            for dep in deps:
+                self._deps[dep].add(key)
+            while len(self._entries) > self.size:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+            return True
+
+    def invalidate(self, triples=(), levels=(), version=None):
+        """Drop every entry depending on an index key of the written `triples`
+        or on one of the rebuilt derived `levels`.  Returns how many."""
+        with self._lock:
+            if version is not None:
+                self.version = max(self.version, version)
+            if not self._deps:
+                return 0
+            touched = {("level", k) for k in levels}
+            for t in triples:
+                touched.update(index_keys(t))
+            stale = {key for dep in touched & self._deps.keys() for key in self._deps[dep]}
+            for key in stale:
+                self._drop(key)
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._deps.clear()
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for dep in entry[2]:
+            keys = self._deps.get(dep)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._deps[dep]
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"size": len(self._entries), "capacity": self.size, "version": self.version,
+                    "hits": self.hits, "misses": self.misses,
+                    "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                    "evictions": self.evictions, "invalidations": self.invalidations,
+                    "rejected": self.rejected}
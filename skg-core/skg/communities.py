@@ -0,0 +1,105 @@
+# cognition/skg/communities.py  –  incremental label propagation over a level matrix
+import hashlib
+import numpy as np
+import scipy.sparse as sp
+
+MAX_ROUNDS = 20             # label-propagation sweeps per update
+TIE_BONUS  = 1e-9           # a node's own label wins ties → stable partitions
+
+def fingerprint(members):
+    """Stable id of a community: digest of its sorted member labels
+    (unlike hash(), identical across processes and restarts)."""
+    h = hashlib.blake2b(digest_size=8)
+    for label in sorted(map(str, members)):
+        h.update(label.encode()); h.update(b"\x1f")
+    return h.hexdigest()
+
+class CommunityIndex:
+    """Cached partition of one level, refreshed by label propagation seeded
+    from the previous partition.  Only nodes whose edges changed – and the
+    neighbours their new labels reach – are re-evaluated, so a small edit to a
+    large level costs a few sparse row sweeps, not a fresh clustering."""
+
+    def __init__(self):
+        self.labels = np.zeros(0, dtype=np.int64)   # node id → community label
+        self._adj   = None          # symmetrised matrix the partition belongs to
+        self._sizes = None
+
+    def update(self, adj):
+        """Bring the partition in line with `adj`; returns the touched labels."""
+        adj = sp.csr_matrix(adj, dtype=float)
+        sym = (abs(adj) + abs(adj).T).tocsr()
+        n = sym.shape[0]
+        old = self.labels
+        labels = np.arange(n, dtype=np.int64)       # unseen nodes start alone
+        labels[:len(old)] = old[:n]
+        if self._adj is None:
+            active = np.arange(n)
+        else:
+            prev = _pad(self._adj, n)
+            diff = (sym - prev).tocoo()
+            active = np.unique(np.concatenate([diff.row, diff.col, np.arange(len(old), n)]))
+        touched = set(labels[active].tolist())
+        pending = np.zeros(n, dtype=bool)
+        pending[active] = True
+        for rnd in range(MAX_ROUNDS):
+            active = np.flatnonzero(pending)
+            if not active.size:
+                break
+            # alternate parity halves – synchronous LPA oscillates on bipartite parts
+            half = active[active % 2 == rnd % 2]
+            touched.update(labels[half].tolist())
+            moved = self._sweep(sym, labels, half)
+            touched.update(labels[moved].tolist())
+            # a move can change its neighbours' votes – they go back on the list
+            pending[half] = False
+            pending[sym[moved].indices] = True
+        self.labels, self._adj = labels, sym
+        self._sizes = np.bincount(labels, minlength=n)
+        return touched
+
+    @staticmethod
+    def _sweep(sym, labels, rows):
+        """One synchronous vote over `rows`: each adopts its heaviest neighbour label."""
+        if not rows.size:
+            return rows
+        sub = sym[rows].tocoo()
+        votes = sp.csr_matrix((sub.data, (sub.row, labels[sub.col])),
+                              shape=(len(rows), len(labels)))
+        votes = votes + sp.csr_matrix((np.full(len(rows), TIE_BONUS),
+                                       (np.arange(len(rows)), labels[rows])),
+                                      shape=votes.shape)
+        votes.sum_duplicates()              # canonical: sorted labels per row
+        # row-wise argmax without a Python loop; ties go to the smallest label
+        counts = np.diff(votes.indptr)
+        top = np.maximum.reduceat(votes.data, votes.indptr[:-1])
+        hit = np.flatnonzero(votes.data == np.repeat(top, counts))
+        _, first = np.unique(np.repeat(np.arange(len(rows)), counts)[hit], return_index=True)
+        best = votes.indices[hit[first]]
+        moved = best != labels[rows]
+        labels[rows[moved]] = best[moved]
+        return rows[moved]
+
+    def members(self, label):
+        return np.flatnonzero(self.labels == label)
+
+    def density(self, adj, labels):
+        """{label: (size, directed density)} for the given community labels,
+        computed from `adj` in one vectorised pass (same as nx.density)."""
+        labels = np.fromiter(labels, dtype=np.int64)
+        if not labels.size:
+            return {}
+        coo = sp.coo_matrix(adj)
+        inside = self.labels[coo.row] == self.labels[coo.col]
+        edges = np.bincount(self.labels[coo.row[inside]], minlength=len(self.labels))
+        out = {}
+        for c in labels.tolist():
+            size = int(self._sizes[c]) if c < len(self._sizes) else 0
+            out[c] = (size, edges[c] / (size * (size - 1)) if size > 1 else 0.0)
+        return out
+
+def _pad(adj, n):
+    if adj.shape[0] >= n:
+        return adj
+    return sp.csr_matrix((adj.data, adj.indices,
+                          np.pad(adj.indptr, (0, n - adj.shape[0]), mode="edge")), shape=(n, n))
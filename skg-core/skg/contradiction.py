@@ -1,25 +1,68 @@
-# cognition/skg/contradiction.py  (60 lines)
-MUTEX_PRED = {"loves": "hates", "bornIn": "diedIn", "worksAt": "firedFrom"}
+# cognition/skg/contradiction.py  –  (s, o)-indexed mutex repair
+import json, os, pathlib
 
-def detect_and_repair(core):
-    g = core.levels[0]          # base graph
+# primary → opposite; on a weight tie the primary predicate survives
+MUTEX_PRED = {"loves": "hates"}
+_CONFLICTS = {}                 # predicate → every predicate it excludes
+
+_REPO_VAULT = pathlib.Path(__file__).resolve().parents[2] / "seed_vault"
+VAULT_ROOT  = pathlib.Path(os.getenv("SEED_VAULT_PATH",
+                                     _REPO_VAULT if _REPO_VAULT.exists() else "/app/seed_vault"))
+MUTEX_VAULT = VAULT_ROOT / "skg" / "mutex_predicates.json"
+
+def register_mutex(pairs):
+    """Add (primary, opposite) pairs to the mutex table."""
+    for a, b in pairs:
+        MUTEX_PRED.setdefault(a, b)
+        _CONFLICTS.setdefault(a, set()).add(b)
+        _CONFLICTS.setdefault(b, set()).add(a)
+
+def load_mutex_table(path=MUTEX_VAULT):
+    """Extend the table from a seed-vault file ({"mutex": [[a, b], ...]}).
+    Returns the number of pairs read; a missing file leaves the defaults."""
+    path = pathlib.Path(path)
+    if not path.exists():
+        return 0
+    pairs = json.loads(path.read_text()).get("mutex", [])
+    register_mutex(pairs)
+    return len(pairs)
+
+register_mutex(list(MUTEX_PRED.items()))
+load_mutex_table()
+
+def _loser(store, s, p, q, o, is_derived=None):
+    """Which of the mutex triples (s,p,o) / (s,q,o) to drop.  An asserted
+    triple always beats a rule-derived one, whatever the weights."""
+    if is_derived is not None:
+        dp, dq = is_derived((s, p, o)), is_derived((s, q, o))
+        if dp != dq:
+            return p if dp else q
+    wp, wq = store.weight(s, p, o, 1.0), store.weight(s, q, o, 1.0)
+    if wp != wq:
+        return q if wp > wq else p
+    return q if MUTEX_PRED.get(p) == q else p
+
+def detect_and_repair(core, triples=None):
+    """Check `triples` (default: every triple with a mutex predicate) against
+    the other predicates on their own (s, o) pair and drop the weaker side.
+    Returns the (s, o) pairs that lost a triple."""
+    store, rules = core.store, getattr(core, "rules", None)
+    is_derived = rules.is_derived if rules is not None else None
+    if triples is None:
+        triples = [(s, p, o) for p in list(_CONFLICTS)
+                   for s, _, o, _ in store.match(None, p, None)]
     removals = []
-    for s, o, d in g.edges(data=True):
-        p = d.get("predicate")
-        if p and p in MUTEX_PRED:
-            opposite = MUTEX_PRED[p]
-            # Check for opposite predicate on same edge
-            for s2, o2, d2 in g.edges(data=True):
-                if s2 == s and o2 == o and d2.get("predicate") == opposite:
-                    # Remove lower weight edge
-                    weight1 = d.get("weight", 1.0)
-                    weight2 = d2.get("weight", 1.0)
-                    if weight1 >= weight2:
-                        removals.append((s2, o2))
-                    else:
-                        removals.append((s, o))
-                    print(f"[SKG] repaired contradiction {s}-{p}/{opposite}-{o}")
-    # Remove contradictory edges
-    for s, o in removals:
-        if g.has_edge(s, o):
-            g.remove_edge(s, o)
\ No newline at end of file
+    for s, p, o in triples:
+        excluded = _CONFLICTS.get(p)
+        if not excluded:
+            continue
+        for q in store.predicates(s, o):
+            if q in excluded and (s, p, o) in store:
+                loser = _loser(store, s, p, q, o, is_derived)
+                if is_derived is not None and is_derived((s, loser, o)):
+                    # or re-derivation would bring it straight back
+                    rules.block((s, loser, o), (s, q if loser == p else p, o))
+                core._drop_triple(s, loser, o)
+                removals.append((s, o))
+                print(f"[SKG] repaired contradiction {s}-{p}/{q}-{o}")
+    return removals
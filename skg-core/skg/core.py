@@ -3,181 +3,867 @@ Super-Knowledge-Graph core  –  real recursive layers, real blocks, real prunin
 Drop-in replacement for yesterday's toy.
 """
 import numpy as np
-import torch, torch.nn as nn
-import networkx as nx
-import sqlite3, json, os, pathlib
-from torch_geometric.utils import dense_to_sparse
-from torch_geometric.data import Data
-from torch_geometric.nn import GCNConv
+import scipy.sparse as sp
+import sqlite3, json, os, pathlib, threading, functools
+from itertools import islice
+from contextlib import contextmanager
+from collections.abc import Mapping
+
+from .nodes import NodeDict
+from .store import TripleStore
+from .prune import make_pruner
+from .propose import make_proposer, link_mask
+from .ingest import IngestQueue, check_triples
+from .state import GraphState
+from .communities import CommunityIndex
+from .curiosity import UnknownIndex, GoalQueue
+from .scheduler import Scheduler, Deferred
+from .rules import RuleEngine, load_rules
+from .cache import QueryCache, pattern_key, dependencies
+from . import snapshot, partition, bgp, traverse
 
 # ----------  config ----------
 MAX_DEPTH      = 3          # how many recursive levels
-GNN_HIDDEN     = 32
 PRUNE_THRESH   = 0.05       # percentile
+PRUNE_STRATEGY = "quantile" # "quantile" | "threshold" | "topk"  (see skg/prune.py)
+PROPOSE_STRATEGY = "adamic_adar"  # "common_neighbors" | "adamic_adar" | "jaccard" | "katz" | "gcn" | "none"
+INCREMENTAL    = True       # update dirty rows of K¹…Kᴹᴬˣ instead of rebuilding
+FULL_REBUILD_EVERY = 64     # incremental updates between full rebuilds
+DIRTY_REBUILD_FRAC = 0.25   # rebuild when this share of K⁰ rows is dirty
 DB_FILE        = pathlib.Path(os.environ.get("UCM_SKG_DB", "ucm_skg.db"))
+LOAD_BATCH     = 50_000     # rows per fetchmany() on warm start
+INVENT_EVERY   = 300        # background job intervals (seconds)
+RETRAIN_EVERY  = 600
+REBUILD_EVERY  = 900        # full rebuild folding up incremental drift
+SNAPSHOT_EVERY = 1800
 
 # ----------  tiny utils ----------
-def conn():
-    DB_FILE.parent.mkdir(exist_ok=True)
-    return sqlite3.connect(DB_FILE)
+def conn(path=None, **kw):
+    path = pathlib.Path(path or DB_FILE)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return sqlite3.connect(path, **kw)
 
-def init_db():
-    c = conn()
+def init_db(path=None):
+    c = conn(path)
+    c.execute("PRAGMA journal_mode=WAL")
     for lvl in range(MAX_DEPTH):
         c.execute(f"CREATE TABLE IF NOT EXISTS level_{lvl}(i INT, j INT, weight REAL)")
     c.execute("CREATE TABLE IF NOT EXISTS meta(depth INT)")
+    c.execute("CREATE TABLE IF NOT EXISTS nodes(id INTEGER PRIMARY KEY, label TEXT)")
+    c.execute("CREATE TABLE IF NOT EXISTS triples(s TEXT, p TEXT, o TEXT, weight REAL,"
+              " PRIMARY KEY (s, p, o)) WITHOUT ROWID")
     c.commit(); c.close()
 
-# ----------  GNN edge scorer ----------
-class EdgeScoreGNN(nn.Module):
-    def __init__(self, in_dim, hidden=GNN_HIDDEN):
-        super().__init__()
-        self.conv1 = GCNConv(in_dim, hidden)
-        self.conv2 = GCNConv(hidden, 1)
-    def forward(self, x, edge_index):
-        x = self.conv1(x, edge_index).relu()
-        return torch.sigmoid(self.conv2(x, edge_index)).squeeze(-1)
+# ----------  sparse helpers ----------
+def _resize(adj, n):
+    """Pad a square CSR matrix with empty rows/cols up to n×n."""
+    adj = sp.csr_matrix(adj, dtype=float)
+    if adj.shape[0] < n:
+        adj = sp.csr_matrix((adj.data, adj.indices,
+                             np.pad(adj.indptr, (0, n - adj.shape[0]), mode="edge")),
+                            shape=(n, n))
+    return adj
+
+def _row_mask(rows, n):
+    """Diagonal selector that keeps only `rows` of an n×n matrix."""
+    keep = np.zeros(n)
+    keep[rows] = 1.0
+    return sp.diags(keep, format="csr")
+
+class _Levels(Mapping):
+    """`SKGCore.levels` – nx views by level.  K⁰ is the graph the writer keeps
+    in step with the store; a derived level's view is frozen and only built
+    when asked for, from the published GraphState (cached with it), so full
+    expansions never pay for a second copy of every weight."""
+
+    def __init__(self, core):
+        self._core = core
+        self._base = None
+
+    def __setitem__(self, level, graph):
+        if level != 0:
+            raise TypeError("derived level views are built from the level matrices")
+        self._base = graph
+
+    def __getitem__(self, level):
+        if level == 0 and self._base is not None:
+            return self._base
+        core = self._core
+        adj = core.adjs.get(level) if level else None
+        if adj is None:
+            raise KeyError(level)
+        state = core._state
+        if state.adjs.get(level) is not adj:
+            # mid-write, not published yet – an uncached view of the new matrix
+            state = GraphState(core.version, core.depth, {level: adj}, core.nodes.labels())
+        return state.graph(level)
+
+    def __iter__(self):
+        if self._base is not None:
+            yield 0
+        yield from sorted(k for k in self._core.adjs if k > 0)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+def _writer(method):
+    """Serialise a mutating SKGCore method on the core's write lock."""
+    @functools.wraps(method)
+    def locked(self, *args, **kw):
+        with self._write_lock:
+            return method(self, *args, **kw)
+    return locked
 
 # ----------  SKG engine ----------
 class SKGCore:
-    def __init__(self):
-        init_db()
-        self.levels   = {}          # nx graphs
-        self.adjs     = {}          # numpy matrices
+    def __init__(self, db_path=None, incremental=INCREMENTAL, persist=True, prune=PRUNE_STRATEGY,
+                 workers=None, propose=PROPOSE_STRATEGY):
+        self.db_path = pathlib.Path(db_path or DB_FILE)
+        init_db(self.db_path)
+        self.levels   = _Levels(self)   # nx views (K⁰ live, derived levels lazy)
+        self.adjs     = {}          # scipy.sparse CSR matrices
         self.depth    = 0
         self.total_edges = 0        # MISSING COUNTER
         self.bootstrapped = False   # MISSING FLAG
-        self.curiosity_goals = []   # track spawned goals
-        self.curiosity_daemon = None # daemon thread
+        self.curiosity_goals = GoalQueue()   # bounded, deduplicated, centrality-ranked
+        self.unknowns = UnknownIndex()       # K⁰ triples mentioning UNKNOWN
+        self.scheduler = Scheduler()        # every background job, one thread
+        self._snapshot_version = None
+        self.invented_predicates = [] # names minted by maybe_invent_predicate
+        self.communities = CommunityIndex()   # cached K² partition for predicate invention
+        self.incremental = incremental
+        self.nodes   = NodeDict()   # label ↔ int32 id = matrix row at every level
+        self.store   = TripleStore(self.nodes)   # K⁰ triples, SPO/POS/OSP indexed
+        self.store.changes = []     # drained by _publish() to invalidate the cache
+        self.cache   = QueryCache() # query results, dropped by the index keys a write touches
+        self.rules   = RuleEngine(load_rules())  # Datalog rules materialized into K⁰
+        self._rules_stale = False   # a rule premise was deleted – re-derive
+        self._dirty  = set()        # K⁰ rows changed since the last level update
+        self._top    = {}           # level → cached top-scoring node mask
+        self.prune_strategy = prune
+        self.workers = workers or partition.default_workers()   # expansion processes
+        self._pruners = {}          # level → Pruner (quantile sketch of the level's weights)
+        self._updates_since_rebuild = 0
+        self.propose_strategy = propose
+        self.proposer = self._new_proposer()   # non-local links X (see skg/propose.py)
+        self._bulk   = 0            # open bulk_load() sessions
+        self._bulk_added = 0
+        self._bulk_delta = []       # triples appended in the open session (None = whole store)
+        self.persist = persist      # write-through of K⁰ triples to SQLite
+        self.snapshot_dir = self.db_path.with_suffix(".snapshot")
+        self._db     = None
+        self._db_lock = threading.Lock()
+        self._write_lock = threading.RLock()   # one writer at a time (see _writer)
+        self._store_lock = threading.Lock()    # K⁰ index mutation vs. level-0 reads
+        self.version = 0            # bumped whenever an applied write is visible
+        self._state  = GraphState(0, 0, {}, self.nodes.labels())   # what readers pin
+        self._pred_adjs = {}        # predicate set → (version, K⁰ restricted to it, labels)
+        self.ingest  = IngestQueue(self)   # coalescing async writes (see skg/ingest.py)
+        if persist:
+            self._db = conn(self.db_path, check_same_thread=False)
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._warm_start()
+
+    # 0.  durable base triples  (SQLite WAL, batched write-through)
+    def _warm_start(self):
+        """Stream the persisted triples back into K⁰.  If a snapshot of exactly
+        these triples exists its levels are mapped in; otherwise the triples are
+        flushed as one bulk load."""
+        snap = snapshot.latest(self.snapshot_dir)
+        meta = snapshot.read_meta(snap) if snap else None
+        if meta:
+            # intern in snapshot order so ids line up with its matrix rows
+            for label in snapshot.load_labels(snap):
+                self.nodes.intern(label)
+        import networkx as nx
+        g, loaded, fp = nx.DiGraph(), 0, 0
+        with self._db_lock:
+            cur = self._db.execute("SELECT s, p, o, weight FROM triples")
+            while rows := cur.fetchmany(LOAD_BATCH):
+                with self._store_lock:
+                    for s, p, o, w in rows:
+                        self.store.add(s, p, o, w)
+                        g.add_edge(s, o, predicate=p, weight=w)
+                        self.unknowns.observe(s, p, o)
+                if meta:
+                    fp ^= snapshot.fingerprint((s, p, o) for s, p, o, _ in rows)
+                loaded += len(rows)
+        if not loaded:
+            return
+        print(f"[SKG] warm start: {loaded} triples from {self.db_path}")
+        self.levels[0] = g
+        self.total_edges += loaded
+        # the persisted marker triples name every invention – without them a
+        # restart would mint the same clusters again
+        self.invented_predicates = [s for s, _, _, _ in self.store.match(None, "isA", "invented_predicate")]
+        if meta and (meta["triples"], meta["fingerprint"], meta["nodes"]) == (loaded, fp, len(self.nodes)):
+            self._map_snapshot(snap, meta)
+            with self._store_lock:
+                self._derive(self._all_triples())   # already in the snapshot's K⁰
+            return
+        self.begin_bulk()
+        self._bulk_added, self._bulk_delta = loaded, None   # nothing derived yet – full pass
+        self.end_bulk()
+
+    # 0b. binary snapshots of every level  (see skg/snapshot.py)
+    @_writer
+    def save_snapshot(self, path=None):
+        """Write a new snapshot generation; returns its directory.  Refused
+        while a bulk load is open – K⁰ is only rebuilt when it flushes."""
+        if self._bulk:
+            raise RuntimeError("bulk load in progress – snapshot after end_bulk()")
+        out = snapshot.save(self, path or self.snapshot_dir)
+        print(f"[SKG] snapshot written → {out}")
+        return out
+
+    @_writer
+    def load_snapshot(self, path=None):
+        """Map the newest snapshot's levels (read-only mmap) and metadata into this
+        core.  The snapshot must be of exactly the triples in the store, and the
+        node dictionary a prefix of the snapshot's."""
+        snap = snapshot.latest(path or self.snapshot_dir)
+        if snap is None:
+            raise FileNotFoundError(f"no snapshot under {path or self.snapshot_dir}")
+        meta = snapshot.read_meta(snap)
+        with self._store_lock:
+            triples, fp = snapshot.asserted(self)
+        if (meta["triples"], meta["fingerprint"]) != (triples, fp):
+            raise ValueError(f"snapshot does not match the triple store ({meta['triples']} "
+                             f"triples vs {triples}) – save a new snapshot")
+        return self._map_snapshot(snap, meta)
+
+    def _map_snapshot(self, snap, meta):
+        labels = snapshot.load_labels(snap)
+        if any(self.nodes.label(i) != labels[i] for i in range(min(len(self.nodes), len(labels)))):
+            raise ValueError("snapshot node dictionary does not match this graph")
+        for label in labels:
+            self.nodes.intern(label)
+        n = len(self.nodes)
+        adjs = snapshot.load_levels(snap, meta["depth"], meta["shape"][0])
+        self.adjs = {k: _resize(a, n) if a.shape[0] < n else a for k, a in adjs.items()}
+        if 0 not in self.levels and 0 in self.adjs:
+            self.levels[0] = self._level_graph(self.adjs[0])
+        self.depth = meta["depth"]
+        self.bootstrapped = meta["bootstrapped"]
+        self.total_edges = max(self.total_edges, meta["total_edges"])
+        self.invented_predicates = list(meta["invented_predicates"])
+        self._top = {k: np.pad(t, (0, n - len(t))) for k, t in snapshot.load_top(snap, self.depth).items()}
+        if meta.get("propose", "gcn") != self.propose_strategy:
+            self._top = {}          # built by another proposer – next write rebuilds
+        self._pruners = {}
+        for k in range(1, self.depth):
+            self._pruners[k] = self._new_pruner()
+            self._pruners[k].observe(self.adjs[k].data)
+        self._dirty.clear()
+        self._updates_since_rebuild = 0
+        self._publish()
+        print(f"[SKG] snapshot {snap.name} loaded  depth={self.depth}  |V|={n}")
+        return meta
+
+    def _write_triples(self, rows):
+        if self._db is not None:
+            with self._db_lock:
+                self._db.executemany("INSERT OR REPLACE INTO triples VALUES (?,?,?,?)", rows)
+
+    def _delete_triples(self, rows):
+        if self._db is not None:
+            with self._db_lock:
+                self._db.executemany("DELETE FROM triples WHERE s=? AND p=? AND o=?", rows)
+
+    # 0c. snapshot isolation  – readers pin the last published GraphState
+    def state(self):
+        """The current immutable view of the levels; safe to read while writing."""
+        return self._state
+
+    def _publish(self):
+        old = self._state
+        self.version += 1
+        self._state = GraphState(self.version, self.depth, self.adjs, self.nodes.labels())
+        with self._store_lock:
+            touched, self.store.changes = self.store.changes, []
+        rebuilt = [k for k in set(self.adjs) | set(old.adjs)
+                   if k > 0 and self.adjs.get(k) is not old.adjs.get(k)]
+        self.cache.invalidate(touched, rebuilt, self.version)
+
+    def _commit(self):
+        if self._db is not None:
+            with self._db_lock:
+                self._db.commit()
+
+    def close(self):
+        self.scheduler.stop()
+        self.ingest.close()
+        if self._db is not None:
+            self._commit()
+            self._db.close()
+            self._db = None
 
     # 1.  ingest base triples → K⁰
+    @_writer
     def add_triples(self, triples):
+        # malformed input fails here, before the store is touched
+        triples = check_triples(triples)
+
         # Initialize graph if it doesn't exist
         if 0 not in self.levels:
+            import networkx as nx
             self.levels[0] = nx.DiGraph()
         
         g = self.levels[0]
-        old_count = g.number_of_edges()
         
         # Add new triples to existing graph
-        for s, p, o in triples:
-            g.add_edge(s, o, predicate=p, weight=1.0)
+        with self._store_lock:
+            for s, p, o in triples:
+                self.store.add(s, p, o)
+                self.rules.assert_fact((s, p, o))
+                g.add_edge(s, o, predicate=p, weight=1.0)
+                self.unknowns.observe(s, p, o)
+            # rules run at end_bulk() in a bulk session
+            derived = [] if self._bulk else self._derive(triples)
+        self._write_triples([(s, p, o, 1.0) for s, p, o in triples])
         
         self.total_edges += len(triples)
+        self.proposer.touch(len(triples))
+        if self._bulk:
+            # bulk load: append only – repair/expansion wait for end_bulk()
+            self._bulk_added += len(triples)
+            self._bulk_delta.extend(triples)
+            self._commit()
+            self._publish()
+            return
         print(f"[SKG] added {len(triples)} edges → total {self.total_edges}")
         
-        self.adjs[0] = nx.adjacency_matrix(g).todense().astype(float)
-        self.depth = 1
-        detect_and_repair(self)
+        removed = self._repair(triples + derived)
+        if self._rules_stale:
+            removed += self._rederive()
+        self._commit()
+        self._sync_base([(s, o) for s, _, o in triples + derived] + removed)
+        if getattr(self, '_expanding', False):
+            # nested add (predicate invention) – the running expansion
+            # picks the dirty rows up before it returns
+            self._publish()
+            return
         
         # ---- FIXED BOOTSTRAP CASCADE ----
         if self.total_edges >= 50 and not self.bootstrapped:
             print("[SKG] 50+ FACTS REACHED – FULL RECURSIVE CASCADE INITIATED")
+            self.depth = 1
             self.expand_recursive()
             maybe_invent_predicate(self)
-            start_curiosity(self)
+            self.start_background()
             self.bootstrapped = True
+        elif self._can_update():
+            # Incremental maintenance of K¹…Kᴹᴬˣ for real-time processing
+            self.update_levels()
         else:
             # Light recursive expansion for real-time processing
+            self.depth = 1
+            self.expand_recursive()
+        self._publish()
+
+    # 1a. async ingest  – acknowledge now, apply in coalesced batches
+    def submit(self, triples):
+        """Queue triples for the background ingest worker; returns a ticket."""
+        return self.ingest.submit(triples)
+
+    def wait_for(self, ticket=None, timeout=None):
+        """Read-your-writes: block until `ticket` is applied, return the version."""
+        return self.ingest.wait(ticket, timeout)
+
+    # 1b. bulk load  – append many batches, repair + expand once at the end
+    @contextmanager
+    def bulk_load(self):
+        self.begin_bulk()
+        try:
+            yield self
+        finally:
+            self.end_bulk()
+
+    def begin_bulk(self):
+        if not self._bulk:
+            self._bulk_added, self._bulk_delta = 0, []
+        self._bulk += 1
+
+    @_writer
+    def end_bulk(self):
+        """Close a bulk session; the outermost one flushes and returns the
+        number of triples appended while it was open."""
+        if not self._bulk:
+            raise RuntimeError("no bulk load in progress")
+        self._bulk -= 1
+        if self._bulk:
+            return 0
+        added, self._bulk_added = self._bulk_added, 0
+        delta, self._bulk_delta = self._bulk_delta, []
+        print(f"[SKG] bulk load flushed {added} edges → total {self.total_edges}")
+        if 0 not in self.levels:
+            return added
+        with self._store_lock:
+            # semi-naive: only the session's appends are new premises
+            self._derive(self._all_triples() if delta is None else delta)
+        self._rebuild_base()
+        repaired = self._repair()
+        if self._rules_stale:
+            repaired += self._rederive()
+        self._sync_base(repaired)
+        self._commit()
+        self._dirty.clear()
+        if self.levels[0].number_of_edges():
+            self.depth = 1
             self.expand_recursive()
+            if self.total_edges >= 50 and not self.bootstrapped:
+                self.start_background()
+                self.bootstrapped = True
+        self._publish()
+        return added
+
+    def _rebuild_base(self):
+        """Regenerate K⁰ from the base graph in one pass (bulk flush)."""
+        g, n = self.levels[0], len(self.nodes)
+        edges = list(g.edges(data="weight", default=1.0))
+        rows = self.nodes.ids(u for u, _, _ in edges)
+        cols = self.nodes.ids(v for _, v, _ in edges)
+        data = np.fromiter((w for _, _, w in edges), dtype=float, count=len(edges))
+        self.adjs[0] = sp.csr_matrix((data, (rows, cols)), shape=(n, n))
+
+    def _repair(self, triples=None):
+        """Contradiction repair for `triples` (None = whole store); returns touched pairs."""
+        return list(detect_and_repair(self, triples) or [])
+
+    def _drop_triple(self, s, p, o):
+        """Remove one triple from the store and the K⁰ graph view (not K⁰ itself)."""
+        with self._store_lock:
+            if not self.store.remove(s, p, o):
+                return False
+        self.unknowns.forget(s, p, o)
+        self._delete_triples([(s, p, o)])
+        self._unlink(s, p, o)
+        t = (s, p, o)
+        if self.rules.relevant(t) or self.rules.is_derived(t) or self.rules.is_blocking(t):
+            self._rules_stale = True
+        return True
+
+    def _unlink(self, s, p, o):
+        """Update the K⁰ graph view after (s, p, o) left the store."""
+        g = self.levels[0]
+        if g.has_edge(s, o) and g[s][o].get("predicate") == p:
+            left = self.store.predicates(s, o)
+            if left:
+                g[s][o]["predicate"] = left[-1]
+            else:
+                g.remove_edge(s, o)
+
+    # 1c. rule materialization  (semi-naive, see skg/rules.py)
+    def _all_triples(self):
+        return [(s, p, o) for s, p, o, _ in self.store.match()]
+
+    def _derive(self, delta):
+        """Add what the rules derive from `delta` to the store and the K⁰ graph
+        view; returns the derived triples.  Caller holds `_store_lock`."""
+        derived = self.rules.materialize(self.store, delta)
+        if derived:
+            g = self.levels[0]
+            for s, p, o in derived:
+                if not g.has_edge(s, o):
+                    g.add_edge(s, o, predicate=p, weight=1.0)
+            print(f"[SKG] derived {len(derived)} triples by rule")
+        return derived
+
+    def _rederive(self):
+        """Recompute derived triples after a premise was deleted; returns the
+        (s, o) pairs whose derived triples changed."""
+        self._rules_stale = False
+        with self._store_lock:
+            dropped, added = self.rules.rematerialize(self.store)
+            g = self.levels[0]
+            for s, p, o in dropped:
+                self._unlink(s, p, o)
+            for s, p, o in added:
+                if not g.has_edge(s, o):
+                    g.add_edge(s, o, predicate=p, weight=1.0)
+        return [(s, o) for s, _, o in dropped | added]
+
+    @_writer
+    def remove_triples(self, triples):
+        g = self.levels.get(0)
+        if g is None:
+            return
+        pairs = []
+        for s, p, o in triples:
+            derived = self.rules.is_derived((s, p, o))
+            if self._drop_triple(s, p, o):
+                self.total_edges -= not derived     # total_edges counts asserted triples
+                pairs.append((s, o))
+        self._commit()
+        print(f"[SKG] removed {len(pairs)} edges → total {self.total_edges}")
+        if not pairs or self._bulk:
+            return
+        if self._rules_stale:
+            pairs += self._rederive()
+        self._sync_base(pairs)
+        if not getattr(self, '_expanding', False):
+            if self._can_update():
+                self.update_levels()
+            else:
+                self.depth = 1
+                self.expand_recursive()
+        self._publish()
+
+    def _sync_base(self, pairs):
+        """Write the current weight of each (s, o) pair into K⁰ and mark its rows dirty."""
+        g = self.levels[0]
+        n = len(self.nodes)
+        adj = _resize(self.adjs.get(0, sp.csr_matrix((0, 0))), n)
+        rows, cols, delta = [], [], []
+        for s, o in set(pairs):
+            i, j = self.nodes.id(s), self.nodes.id(o)
+            w = g[s][o].get("weight", 1.0) if g.has_edge(s, o) else 0.0
+            d = w - adj[i, j]
+            if d:
+                rows.append(i); cols.append(j); delta.append(d)
+            self._dirty.update((i, j))
+        if delta:
+            adj = adj + sp.csr_matrix((delta, (rows, cols)), shape=(n, n))
+            adj.eliminate_zeros()
+        self.adjs[0] = adj
+
+    def _can_update(self):
+        """Incremental update is possible once a full build has cached its state."""
+        if not self.incremental or self.depth < MAX_DEPTH:
+            return False
+        if any(k not in self._top for k in range(1, MAX_DEPTH)):
+            return False
+        n = self.adjs[0].shape[0]
+        if self._updates_since_rebuild >= FULL_REBUILD_EVERY:
+            return False                # periodic full-rebuild fallback
+        return len(self._dirty) <= DIRTY_REBUILD_FRAC * n
 
     # 2.  recursive expansion  Kᵏ → Kᵏ⁺¹
+    @_writer
     def expand_recursive(self):
         if getattr(self, '_expanding', False):
             return
         self._expanding = True
-        
-        while self.depth < MAX_DEPTH:
-            k = self.depth
+        try:
+            if self.depth < MAX_DEPTH:
+                self._dirty.clear()
+                self._updates_since_rebuild = 0
+            while self.depth < MAX_DEPTH:
+                k = self.depth
+                prev = self.adjs[k-1]
+
+                # non-local proposals X target the top-scoring nodes
+                top = self._top_nodes(prev, k)
+                # new adjacency  Kᵏ⁻¹ + C + X
+                new_adj = self._expand_level(prev, top)
+                pruner = self._new_pruner()
+                new_adj = self._prune(new_adj, pruner)
+
+                self.adjs[k] = new_adj
+                self._top[k], self._pruners[k] = top, pruner
+                self.depth += 1
+                n = new_adj.shape[0]
+                print(f"[SKG] built level {k}  |V|={n}  density={new_adj.sum()/max(n*n, 1):.3f}")
+            maybe_invent_predicate(self)
+            if self._dirty:
+                self._update_dirty()
+        finally:
+            self._expanding = False
+        self._publish()
+
+    # 2b. incremental maintenance  – recompute only rows touched since the last build
+    @_writer
+    def update_levels(self):
+        if getattr(self, '_expanding', False):
+            return
+        self._expanding = True
+        try:
+            self._update_dirty()
+            maybe_invent_predicate(self)
+            if self._dirty:
+                self._update_dirty()
+        finally:
+            self._expanding = False
+        self._publish()
+
+    def _update_dirty(self):
+        n = self.adjs[0].shape[0]
+        changed = np.fromiter(sorted(self._dirty), dtype=np.int64, count=len(self._dirty))
+        self._dirty.clear()
+        self._updates_since_rebuild += 1
+        for k in range(1, self.depth):
             prev = self.adjs[k-1]
+            mask = (prev != 0).astype(float)
+            # row i of Kᵏ reads row i of Kᵏ⁻¹ and, through the proposals, rows up
+            # to `hops - 1` links downstream → refresh that many in-neighbour rings
+            hit = np.zeros(n)
+            hit[changed] = 1.0
+            for _ in range(self.proposer.hops - 1):
+                hit = np.maximum(hit, mask @ hit)
+            rows = np.flatnonzero(hit)
+            select = _row_mask(rows, n)
 
-            # local cross-links  C
-            C = self._cross_links(prev)
-            # non-local proposals X
-            X = self._propose_edges(prev)
-            # new adjacency
-            new_adj = prev + C + X
-            new_adj = self._prune(new_adj)
+            top = np.pad(self._top[k], (0, n - self._top[k].shape[0]))
+            fresh = select @ (prev + self._cross_links(prev))
+            fresh = (fresh + self._propose_edges(prev, rows=rows, top=top)).tocsr()
+            # the sketch follows the level: the old rows leave, the fresh ones
+            # enter, and only the fresh rows are pruned against it
+            old = _resize(self.adjs[k], n)
+            stale = select @ old
+            pruner = self._pruners[k]
+            pruner.forget(stale.data)
+            fresh = self._prune(fresh, pruner)
 
+            new_adj = (old - stale + fresh).tocsr()
+            new_adj.eliminate_zeros()
             self.adjs[k] = new_adj
-            self.levels[k] = nx.from_numpy_array(new_adj, create_using=nx.DiGraph)
-            self.depth += 1
-            print(f"[SKG] built level {k}  |V|={new_adj.shape[0]}  density={new_adj.sum()/new_adj.size:.3f}")
-        maybe_invent_predicate(self)
-        
-        self._expanding = False
+            self._top[k] = top
+            print(f"[SKG] updated level {k}  |V|={n}  rows={len(rows)}")
+            changed = rows
+
+    def _expand_level(self, prev, top):
+        """Unpruned next level.  Large levels are split into groups of connected
+        components and built on the process pool (see skg/partition.py)."""
+        if partition.should_split(prev, self.workers):
+            return partition.expand_level(prev, top, self.workers, self.proposer)
+        # local cross-links  C,  non-local proposals X
+        return (prev + self._cross_links(prev) + self._propose_edges(prev, top=top)).tocsr()
+
+    def _level_graph(self, adj):
+        """nx view of a level matrix, keyed by the same labels as K⁰."""
+        import networkx as nx
+        labels = self.nodes.labels()[:adj.shape[0]]
+        G = nx.DiGraph()
+        G.add_nodes_from(labels)
+        coo = adj.tocoo()
+        G.add_weighted_edges_from(zip(labels[coo.row], labels[coo.col], coo.data.tolist()))
+        return G
 
     # 3.  cross-links = shared nodes
     def _cross_links(self, adj):
-        g = nx.from_numpy_array(adj, create_using=nx.DiGraph)
-        c = nx.adjacency_matrix(g).todense() * 0.2   # dampen
+        c = sp.csr_matrix(adj, dtype=float) * 0.2   # dampen
         return c
 
-    # 4.  non-local proposals via GNN attention
-    def _propose_edges(self, adj):
-        g = nx.from_numpy_array(adj, create_using=nx.DiGraph)
-        edge_index, _ = dense_to_sparse(torch.tensor(adj, dtype=torch.float))
-        x = torch.eye(adj.shape[0])
-        model = EdgeScoreGNN(x.size(1))
-        opt   = torch.optim.Adam(model.parameters(), lr=0.01)
-        # dummy target = degree
-        target = torch.tensor(list(dict(g.degree()).values()), dtype=torch.float)
-        for _ in range(10):  # reduced for testing
-            opt.zero_grad()
-            out = model(x, edge_index)
-            loss = nn.MSELoss()(out, target)
-            loss.backward(); opt.step()
-        with torch.no_grad():
-            scores = model(x, edge_index).numpy()
-        proposals = (scores > np.percentile(scores, 95)).astype(float) * 0.15
-        return proposals
-
-    # 5.  prune low weights
-    def _prune(self, adj):
-        thresh = np.percentile(adj[adj>0], PRUNE_THRESH*100)
-        adj[adj < thresh] = 0
-        return adj
+    # 4.  non-local proposals  (strategy per core, see skg/propose.py)
+    def _new_proposer(self):
+        kw = {"path": self.db_path.with_suffix(".gnn.pt")} if self.propose_strategy == "gcn" else {}
+        return make_proposer(self.propose_strategy, **kw)
+
+    def _top_nodes(self, adj, level=None):
+        # per-level proposer prior (GCN: top-scoring node mask), cached in _top
+        return self.proposer.targets(adj, self.depth if level is None else level)
+
+    @_writer
+    def retrain_scorer(self):
+        """Scheduled proposer refresh (GCN warm start); applies from the next full rebuild."""
+        self.proposer.retrain(self.adjs)
+
+    def _propose_edges(self, adj, rows=None, top=None):
+        mask = link_mask(adj)
+        if top is None:
+            top = self._top_nodes(adj)
+        out = self.proposer.propose(mask, rows, top)
+        if rows is None:
+            return out
+        # row block → n×n with the other rows empty
+        n = mask.shape[0]
+        rows = np.asarray(rows, dtype=np.int64)
+        place = sp.csr_matrix((np.ones(len(rows)), (rows, np.arange(len(rows)))), shape=(n, len(rows)))
+        return (place @ out).tocsr()
+
+    # 5.  prune low weights  (strategy per level, see skg/prune.py)
+    def _new_pruner(self):
+        kw = {"q": PRUNE_THRESH} if self.prune_strategy == "quantile" else {}
+        return make_pruner(self.prune_strategy, **kw)
+
+    def _prune(self, adj, pruner=None):
+        """Feed `adj`'s weights to the level's pruner and drop what it rejects."""
+        adj = sp.csr_matrix(adj, dtype=float)
+        if pruner is None:
+            pruner = self._new_pruner()
+        pruner.observe(adj.data)
+        return pruner.prune(adj)
+
+    # 5b. pattern match  [s, p, o] (None = wildcard) → [(u, v, data), ...]
+    def query(self, pat, k=10, level=0, state=None):
+        """K⁰ answers from the triple store (latest committed triples); derived
+        levels from `state` (default: the current one) – never a half-built level.
+        Results are served from `cache` until a write touches their pattern."""
+        version = self.version if level == 0 else (state or self._state).version
+        key = ("query", pattern_key(pat), level, k)
+        rows = self.cache.get(key, version)
+        if rows is None:
+            rows = self._query(pat, k, level, state)
+            self.cache.put(key, rows, dependencies(pat, level), version)
+        return list(rows)
+
+    def _query(self, pat, k, level, state):
+        if level == 0:
+            if 0 not in self.levels:
+                return []
+            s, p, o = (list(pat) + [None] * 3)[:3]
+            # K⁰ keeps every predicate per (s, o) in the indexed triple store
+            derived = self.rules.derived
+            with self._store_lock:
+                return [(u, v, {"predicate": q, "weight": w, "derived": True} if (u, q, v) in derived
+                         else {"predicate": q, "weight": w})
+                        for u, q, v, w in islice(self.store.match(s, p, o), k)]
+        return (state or self._state).query(self.nodes, pat, k, level)
+
+    def edges(self, level, state=None):
+        """Every (u, v, data) of one level without touching the writer-side nx
+        views: K⁰ copied from the triple store (with predicates) under the
+        store lock, derived levels from the frozen graph of `state`."""
+        if level == 0:
+            derived = self.rules.derived
+            with self._store_lock:
+                return [(u, v, {"predicate": p, "weight": w, "derived": True} if (u, p, v) in derived
+                         else {"predicate": p, "weight": w})
+                        for u, p, v, w in self.store.match()]
+        return list((state or self._state).graph(level).edges(data=True))
+
+    # 5c. conjunctive queries  [[s, p, o], …] with ?variables  (see skg/bgp.py)
+    def select(self, patterns, limit=None):
+        """Solutions of a basic graph pattern over K⁰ as [{var: label}, …]; the
+        join order comes from the store's cardinality estimates and evaluation
+        stops once `limit` solutions are found."""
+        with self._store_lock:
+            return bgp.select(self.store, patterns, limit)
+
+    def explain(self, patterns):
+        """Join order and methods `select()` would use for `patterns`."""
+        with self._store_lock:
+            return bgp.plan(self.store, patterns).explain()
+
+    # 5d. neighbourhoods and paths  (vectorized CSR frontiers, see skg/traverse.py)
+    def _predicate_adj(self, predicates):
+        """K⁰ restricted to `predicates`, read from the POS index once per
+        version, with the label array its ids index into."""
+        key = tuple(sorted(set(predicates)))
+        hit = self._pred_adjs.get(key)
+        if hit is not None and hit[0] == self.version:
+            return hit[1], hit[2]
+        version, store = self.version, self.store
+        with self._store_lock:
+            labels = self.nodes.labels()
+            rows, cols, data = [], [], []
+            for p in key:
+                pi = store.preds.id(p)
+                if pi is None:
+                    continue
+                for si, _, oi, w in store.match_ids(None, pi, None):
+                    rows.append(si); cols.append(oi); data.append(w)
+        n = len(labels)
+        adj = sp.csr_matrix((data, (rows, cols)), shape=(n, n), dtype=float)
+        if any(v != version for v, _, _ in self._pred_adjs.values()):
+            self._pred_adjs = {}
+        self._pred_adjs[key] = (version, adj, labels)
+        return adj, labels
+
+    def _traversal(self, level, predicates, direction, state):
+        """(adjacency to walk, labels) for a traversal request."""
+        state = state or self._state
+        if predicates:
+            if level != 0:
+                raise ValueError("predicate filters apply to K⁰ only – derived levels carry no predicates")
+            adj, labels = self._predicate_adj(predicates)
+            return traverse.oriented(adj, direction), labels
+        if level not in state.adjs:
+            raise ValueError(f"level {level} not built (depth {state.depth})")
+        return state.adjacency(level, direction), state.labels
+
+    def _node_id(self, label, adj):
+        i = self.nodes.id(label, -1)
+        if not 0 <= i < adj.shape[0]:
+            raise KeyError(f"unknown node {label!r}")
+        return i
+
+    def neighbors(self, node, hops=1, level=0, predicates=None, direction="out",
+                  fanout=None, max_nodes=None, timeout=None, state=None):
+        """Ego network of `node` up to `hops` away as a `traverse.Expansion`
+        yielding labelled batches of newly reached nodes.  Reads one pinned
+        version (K⁰ restricted to `predicates` if given) and raises KeyError
+        for a node that version does not have."""
+        adj, labels = self._traversal(level, predicates, direction, state)
+        return traverse.Expansion(adj, self._node_id(node, adj), hops, fanout=fanout,
+                                  max_nodes=max_nodes, timeout=timeout, labels=labels)
+
+    def paths(self, source, target, max_hops=4, max_paths=10, level=0, predicates=None,
+              direction="out", fanout=None, timeout=None, state=None):
+        """Shortest paths source → target as label lists, generated lazily."""
+        adj, labels = self._traversal(level, predicates, direction, state)
+        src, dst = self._node_id(source, adj), self._node_id(target, adj)
+        return ([labels[i] for i in path] for path in
+                traverse.paths(adj, src, dst, max_hops, max_paths, fanout, timeout))
 
     # 6.  persist level to SQLite
     def _persist_level(self, lvl, adj):
-        c = conn()
+        c = conn(self.db_path)
         c.execute(f"DELETE FROM level_{lvl}")
-        rows = [(int(i), int(j), float(adj[i,j]))
-                for i in range(adj.shape[0]) for j in range(adj.shape[1]) if adj[i,j]>0]
+        c.executemany("INSERT OR IGNORE INTO nodes VALUES (?,?)",
+                      ((i, str(label)) for i, label in enumerate(self.nodes)))
+        coo = sp.coo_matrix(adj)
+        rows = [(int(i), int(j), float(w))
+                for i, j, w in zip(coo.row, coo.col, coo.data) if w > 0]
         c.executemany(f"INSERT INTO level_{lvl} VALUES (?,?,?)", rows)
         c.execute("REPLACE INTO meta(depth) VALUES (?)", (lvl+1,))
         c.commit(); c.close()
 
-    # 7.  assemble full SKG block matrix
-    def block_matrix(self):
-        blocks = [[self.adjs.get(min(i,j), np.zeros_like(self.adjs[0])) if abs(i-j)<=1
-                   else np.zeros_like(self.adjs[0]) for j in range(self.depth)]
-                  for i in range(self.depth)]
-        return np.block(blocks)
+    # 7.  full SKG block matrix – a lazy operator (pass dense=True for ndarray)
+    def block_matrix(self, dense=False):
+        from .blocks import BlockOperator      # scipy.sparse.linalg – only when asked for
+        n = len(self.nodes)
+        # levels can lag K⁰ by a few rows (bulk sessions) – pad to n×n
+        block = BlockOperator([_resize(self.adjs[k], n) for k in range(self.depth)])
+        return block.to_dense() if dense else block
+
+    # 8.  background jobs  – one scheduler thread per core (see skg/scheduler.py)
+    def start_background(self):
+        """Schedule curiosity scans, predicate invention, scorer refresh, full
+        rebuilds and snapshots.  Idempotent – each job runs at most once."""
+        start_curiosity(self)
+        jobs = self.scheduler
+        jobs.register("invent", self._background(lambda: maybe_invent_predicate(self)), INVENT_EVERY)
+        jobs.register("retrain", self._background(self.retrain_scorer), RETRAIN_EVERY)
+        jobs.register("rebuild", self._background(self._rebuild_levels), REBUILD_EVERY)
+        if self.persist:
+            jobs.register("snapshot", self._background(self._snapshot_if_changed), SNAPSHOT_EVERY)
+        return jobs
+
+    def _background(self, fn):
+        """Job body that yields to the request path: while a writer holds the
+        lock the run is deferred instead of queueing behind it."""
+        def run(job):
+            if not self._write_lock.acquire(blocking=False):
+                raise Deferred()
+            try:
+                if not job.cancelled.is_set():
+                    fn()
+            finally:
+                self._write_lock.release()
+        return run
+
+    def _rebuild_levels(self):
+        if self._updates_since_rebuild and self.depth:
+            self.depth = 1
+            self.expand_recursive()
+
+    def _snapshot_if_changed(self):
+        if self.depth and self._snapshot_version != self.version:
+            self.save_snapshot()
+            self._snapshot_version = self.version
 
     # Curiosity daemon control methods
     def start_curiosity_daemon(self):
-        """Start the curiosity daemon if not already running"""
-        import threading
-        if self.curiosity_daemon is None or not self.curiosity_daemon.is_alive():
-            from .curiosity import curiosity_loop
-            self.curiosity_daemon = threading.Thread(
-                target=curiosity_loop, 
-                args=(self,), 
-                daemon=True
-            )
-            self.curiosity_daemon.start()
+        """Schedule the curiosity scan (no-op if it is already scheduled)"""
+        return start_curiosity(self)
 
     def stop_curiosity_daemon(self):
-        """Stop the curiosity daemon"""
-        if self.curiosity_daemon and self.curiosity_daemon.is_alive():
-            # Note: daemon threads will stop when main program exits
-            # For more control, we'd need a stop event mechanism
-            pass
+        """Cancel the curiosity scan"""
+        return self.scheduler.cancel("curiosity")
 
 # ----------  Flask service wrapper (same URLs as before) ----------
-# Import Flask for web service
-from flask import Flask, request, jsonify
+# Flask is imported by SKGService only – library users never load it
 
 # Import our SKG enhancement modules
 from .contradiction import detect_and_repair
@@ -186,32 +872,46 @@ from .curiosity import start_curiosity
 class SKGService:
     def __init__(self, db_path=None):
         if db_path: os.environ["UCM_SKG_DB"] = db_path
-        self.core = SKGCore()
+        from flask import Flask
+        self.core = SKGCore(db_path)
         self.app  = Flask("skg")
         self._routes()
 
     def _routes(self):
         self.app.add_url_rule("/add",  "add",  self._add,  methods=["POST"])
         self.app.add_url_rule("/query","query",self._query,methods=["GET"])
+        self.app.add_url_rule("/select","select",self._select,methods=["POST"])
+        self.app.add_url_rule("/version","version",self._version,methods=["GET"])
+        self.app.add_url_rule("/jobs","jobs",self._jobs,methods=["GET"])
 
     def _add(self):
+        from flask import request, jsonify
         data = request.get_json(force=True)
-        triples = [(data["s"], data["p"], data["o"])]
-        self.core.add_triples(triples)
-        self.core.expand_recursive()
-        return jsonify({"status":"ok", "depth":self.core.depth})
+        ticket = self.core.submit([(data["s"], data["p"], data["o"])])
+        # acknowledged once queued; {"wait": true} also waits until it is readable
+        version = self.core.wait_for(ticket) if data.get("wait") else self.core.version
+        return jsonify({"status":"ok", "ticket":ticket, "version":version, "depth":self.core.depth})
+
+    def _version(self):
+        from flask import jsonify
+        return jsonify(self.core.ingest.status())
+
+    def _jobs(self):
+        from flask import jsonify
+        return jsonify(self.core.scheduler.status())
 
     def _query(self):
+        from flask import request, jsonify
         pat = json.loads(request.args.get("pat"))
         # for now just return base-level edges (can extend to meta later)
-        g = self.core.levels[0]
-        match = [(u,v,d) for u,v,d in g.edges(data=True)
-                 if (pat[0] is None or u==pat[0]) and
-                    (pat[1] is None or d.get("predicate")==pat[1]) and
-                    (pat[2] is None or v==pat[2])]
-        return jsonify(match[:int(request.args.get("k", 10))])
+        return jsonify(self.core.query(pat, int(request.args.get("k", 10))))
+    def _select(self):
+        from flask import request, jsonify
+        data = request.get_json(force=True)
+        return jsonify(self.core.select(data["patterns"], data.get("limit")))
+
     def start(self, port=7777):
-        start_curiosity(self.core)
+        self.core.start_background()
         self.app.run(host="0.0.0.0", port=port, debug=False)
         self.app.run(host="0.0.0.0", port=port, debug=False)
 
@@ -223,22 +923,17 @@ class SKGService:
             print(f"[SKG] ➜  {self.core.levels[0].number_of_edges()} base facts – bootstrap")
             self.core.expand_recursive()
             maybe_invent_predicate(self.core)
-            start_curiosity(self.core)
+            self.core.start_background()
         
         # ---- per-edge bootstrap trigger ----
         if self.core.levels[0].number_of_edges() % 50 == 0 and self.core.levels[0].number_of_edges() > 0:
             print(f"[SKG] ➜  {self.core.levels[0].number_of_edges()} base facts – bootstrap")
             self.core.expand_recursive()
             maybe_invent_predicate(self.core)
-            start_curiosity(self.core)
+            self.core.start_background()
 
     def query(self, pat, k=10):
-        g = self.core.levels[0]
-        match = [(u,v,d) for u,v,d in g.edges(data=True)
-                 if (pat[0] is None or u==pat[0]) and
-                    (pat[1] is None or d.get("predicate")==pat[1]) and
-                    (pat[2] is None or v==pat[2])]
-        return match[:k]
+        return self.core.query(pat, k)
 
 # ----------  convenience client ----------
 class Knowledge:
@@ -248,11 +943,6 @@ class Knowledge:
         self.svc.core.add_triples([(s,p,o)])
         self.svc.core.expand_recursive()
     def query(self, pat, k=10):
-        return self.svc._query_internal(pat, k)
+        return self._query_internal(pat, k)
     def _query_internal(self, pat, k):
-        g = self.svc.core.levels[0]
-        match = [(u,v,d) for u,v,d in g.edges(data=True)
-                 if (pat[0] is None or u==pat[0]) and
-                    (pat[1] is None or d.get("predicate")==pat[1]) and
-                    (pat[2] is None or v==pat[2])]
-        return match[:k]
\ No newline at end of file
+        return self.svc.core.query(pat, k)
\ No newline at end of file
@@ -1,47 +1,168 @@
-# cognition/skg/curiosity.py  (80 lines)
-import networkx as nx
-import threading, time, random
-from collections import defaultdict
+# cognition/skg/curiosity.py  –  indexed UNKNOWN tracking + bounded goal queue
+import threading, heapq, itertools
 
 ENTROPY_THRESH = 0.75
+UNKNOWN_TOKEN  = "UNKNOWN"
+MAX_GOALS      = 256        # goal queue bound – lowest-centrality goals fall off
+LEVEL_FANOUT   = 16         # derived-level neighbours followed per unknown entity
+CURIOSITY_INTERVAL = 30     # seconds between scans
 
 def entropy(cluster):
     n = len(cluster)
     unknown = sum(1 for u, v in cluster if u == "UNKNOWN" or v == "UNKNOWN")
     return unknown / n if n else 0
 
-def curiosity_loop(core, interval=30):
-    while True:
-        time.sleep(interval)
-        
-        # Scan all levels for UNKNOWN patterns
-        for level_num in [0, 1, 2]:
-            g = core.levels.get(level_num)
-            if not g: continue
-            
-            # Look for UNKNOWN entities/relationships
-            unknown_edges = []
-            for u, v, d in g.edges(data=True):
-                if "UNKNOWN" in str(u) or "UNKNOWN" in str(v) or "UNKNOWN" in str(d):
-                    unknown_edges.append((u, v, d))
-            
-            # Generate goals for each UNKNOWN pattern
-            for u, v, d in unknown_edges:
-                if "UNKNOWN" in str(u):
-                    goal = f"Research identity of {u} connected to {v}"
-                elif "UNKNOWN" in str(v):
-                    goal = f"Research identity of {v} connected to {u}"
-                else:
-                    goal = f"Research relationship {d} between {u} and {v}"
-                # Store goals in core object
-                if not hasattr(core, 'curiosity_goals'):
-                    core.curiosity_goals = []
-                core.curiosity_goals.append(goal)
+def is_unknown(term):
+    return UNKNOWN_TOKEN in str(term)
+
+class UnknownIndex:
+    """K⁰ triples that mention UNKNOWN, kept current by the core on every insert
+    and delete, plus the changes since the curiosity loop last drained them."""
+
+    def __init__(self):
+        self.triples  = set()
+        self._added   = []
+        self._removed = []
+        self._lock    = threading.Lock()
+
+    def __len__(self):
+        return len(self.triples)
+
+    def observe(self, s, p, o):
+        if not (is_unknown(s) or is_unknown(p) or is_unknown(o)):
+            return
+        with self._lock:
+            if (s, p, o) not in self.triples:
+                self.triples.add((s, p, o))
+                self._added.append((s, p, o))
+
+    def forget(self, s, p, o):
+        with self._lock:
+            if (s, p, o) in self.triples:
+                self.triples.discard((s, p, o))
+                self._removed.append((s, p, o))
+
+    def entities(self):
+        with self._lock:
+            return {t for s, _, o in self.triples for t in (s, o) if is_unknown(t)}
+
+    def drain(self):
+        """(added, removed) since the last drain."""
+        with self._lock:
+            added, self._added = self._added, []
+            removed, self._removed = self._removed, []
+        return added, removed
+
+class GoalQueue:
+    """Bounded, deduplicated max-priority queue of research goals.  Iterates
+    highest priority first; each goal remembers the triple that raised it so it
+    can be withdrawn when that triple is deleted."""
+
+    def __init__(self, maxlen=MAX_GOALS):
+        self.maxlen = maxlen
+        self._prio  = {}            # goal → priority
+        self._cause = {}            # goal → triple it came from
+        self._heap  = []            # (priority, seq, goal) – min-heap = eviction order
+        self._seq   = itertools.count()
+        self._lock  = threading.Lock()
+
+    def __len__(self):
+        return len(self._prio)
+
+    def __contains__(self, goal):
+        return goal in self._prio
+
+    def __iter__(self):
+        with self._lock:
+            ranked = sorted(self._prio.items(), key=lambda kv: -kv[1])
+        return iter([goal for goal, _ in ranked])
+
+    def push(self, goal, priority=0.0, cause=None):
+        """Insert or re-rank `goal`; returns True if it is new."""
+        with self._lock:
+            new = goal not in self._prio
+            if not new and self._prio[goal] >= priority:
+                return False
+            self._prio[goal] = priority
+            if cause is not None:
+                self._cause[goal] = cause
+            heapq.heappush(self._heap, (priority, next(self._seq), goal))
+            if len(self._heap) > 4 * self.maxlen:        # shed stale entries
+                self._heap = [(pr, next(self._seq), g) for g, pr in self._prio.items()]
+                heapq.heapify(self._heap)
+            while len(self._prio) > self.maxlen:
+                self._evict()
+            return new and goal in self._prio
+
+    append = push                   # list-style callers
+
+    def discard(self, goal):
+        with self._lock:
+            self._prio.pop(goal, None)
+            self._cause.pop(goal, None)
+
+    def withdraw(self, triple):
+        """Drop every goal raised by `triple`."""
+        with self._lock:
+            for goal in [g for g, t in self._cause.items() if t == triple]:
+                self._prio.pop(goal, None)
+                self._cause.pop(goal, None)
+
+    def _evict(self):
+        while self._heap:
+            priority, _, goal = heapq.heappop(self._heap)
+            if self._prio.get(goal) == priority:      # skip stale heap entries
+                del self._prio[goal]
+                self._cause.pop(goal, None)
+                return
+
+def _centrality(core, label):
+    """Degree centrality from the store's per-term counts – O(1) per node."""
+    return core.store.estimate(s=label) + core.store.estimate(o=label)
+
+def spawn_goals(core):
+    """One curiosity tick: turn the UNKNOWN changes since the last tick into
+    ranked goals.  Returns the goals that were new."""
+    index = getattr(core, "unknowns", None)
+    goals = getattr(core, "curiosity_goals", None)
+    if index is None or not isinstance(goals, GoalQueue):
+        return []
+    added, removed = index.drain()
+    for triple in removed:
+        goals.withdraw(triple)
+    state = core.state() if hasattr(core, "state") else None
+    spawned = []
+    for s, p, o in added:
+        if is_unknown(s):
+            candidates = [(f"Research identity of {s} connected to {o}", s)]
+        elif is_unknown(o):
+            candidates = [(f"Research identity of {o} connected to {s}", o)]
+        else:
+            candidates = [(f"Research relationship {p} between {s} and {o}", s)]
+        # derived levels link the unknown entity to more of the graph
+        entity = candidates[0][1]
+        if state is not None and is_unknown(entity):
+            for level in state.levels[1:]:
+                for u, v, _ in state.query(core.nodes, [entity, None, None], LEVEL_FANOUT, level):
+                    if v != o and v != s:
+                        candidates.append((f"Research identity of {entity} connected to {v}", entity))
+        for goal, node in candidates:
+            if goals.push(goal, _centrality(core, node), cause=(s, p, o)):
+                spawned.append(goal)
                 print(f"[Curiosity] spawned goal  {goal}")
+    return spawned
 
-def start_curiosity(core):
-    threading.Thread(target=curiosity_loop, args=(core,), daemon=True).start()
+def start_curiosity(core, interval=CURIOSITY_INTERVAL):
+    """Schedule the curiosity scan on the core's job scheduler.  Idempotent:
+    repeated calls return the one scheduled job instead of spawning threads.
+    A core without a scheduler (a ShardRouter – each shard schedules its own)
+    gets no scan; returns None."""
+    scheduler = getattr(core, "scheduler", None)
+    if scheduler is None:
+        print("[Curiosity] no job scheduler on this core – scan not started")
+        return None
+    return scheduler.register("curiosity", lambda job: spawn_goals(core), interval)
 
 def cali_add_goal(goal):
     # Placeholder: integrate with Cali's goal system
-    print(f"[Curiosity] Would add goal: {goal}")
\ No newline at end of file
+    print(f"[Curiosity] Would add goal: {goal}")
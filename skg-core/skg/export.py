@@ -0,0 +1,255 @@
+# cognition/skg/export.py  –  streaming exports: NDJSON, chunked JSON, GraphML, columnar npz
+import io, json, zipfile
+from datetime import datetime
+from xml.sax.saxutils import quoteattr
+import numpy as np
+
+FORMATS      = ("json", "ndjson", "graphml", "columnar")
+MEDIA_TYPES  = {"json": "application/json", "ndjson": "application/x-ndjson",
+                "graphml": "application/xml", "columnar": "application/octet-stream"}
+EXPORT_CHUNK = 10_000       # edges per chunk – bounds what an export holds at once
+K0_SUBJECTS  = 1024         # K⁰ subjects read per hold of the store lock
+
+class Chunk:
+    """Column arrays of up to EXPORT_CHUNK edges of one level.  `pred` and
+    `derived` are None on derived levels, which carry no predicates."""
+    __slots__ = ("level", "src", "dst", "weight", "pred", "derived")
+
+    def __init__(self, level, src, dst, weight, pred=None, derived=None):
+        self.level, self.src, self.dst, self.weight = level, src, dst, weight
+        self.pred, self.derived = pred, derived
+
+    def __len__(self):
+        return len(self.src)
+
+class Export:
+    """One export of `core`: `levels` (default all), subjects with ids in
+    [start, stop), edges of weight ≥ `min_weight`.  Each format method is a
+    generator of text or bytes pieces, so the caller can stream them.
+
+    Derived levels come from one pinned GraphState.  K⁰ comes from the triple
+    store (predicates, derived-by-rule flags), read K0_SUBJECTS subjects per
+    hold of the store lock so writers are never blocked for the whole export;
+    a write landing mid-export may or may not be included."""
+
+    def __init__(self, core, levels=None, start=0, stop=None, min_weight=None):
+        self.core, self.state = core, core.state()
+        known = sorted(set(self.state.levels) | ({0} if len(core.store) else set()))
+        self.levels = known if levels is None else sorted(set(levels))
+        missing = [k for k in self.levels if k not in known]
+        if missing:
+            raise ValueError(f"levels {missing} not built (have {known})")
+        self.start, self.stop, self.min_weight = max(start, 0), stop, min_weight
+
+    # ---- edges ----
+    def chunks(self, level=None):
+        """Edge chunks of every exported level in order (or of one `level`)."""
+        for k in self.levels if level is None else [level]:
+            yield from (self._k0() if k == 0 else self._csr(k))
+
+    def _keep(self, w):
+        return None if self.min_weight is None else w >= self.min_weight
+
+    def _csr(self, k):
+        adj = self.state.adjs[k]
+        stop = adj.shape[0] if self.stop is None else min(self.stop, adj.shape[0])
+        row = min(self.start, stop)
+        while row < stop:
+            # rows [row, end) hold about EXPORT_CHUNK edges (at least one row)
+            end = int(np.searchsorted(adj.indptr, adj.indptr[row] + EXPORT_CHUNK, side="right")) - 1
+            end = min(max(end, row + 1), stop)
+            lo, hi = adj.indptr[row], adj.indptr[end]
+            src = np.repeat(np.arange(row, end, dtype=np.int32), np.diff(adj.indptr[row:end + 1]))
+            dst, w = adj.indices[lo:hi].astype(np.int32), np.asarray(adj.data[lo:hi], dtype=float)
+            keep = self._keep(w)
+            if keep is not None:
+                src, dst, w = src[keep], dst[keep], w[keep]
+            if len(src):
+                yield Chunk(k, src, dst, w)
+            row = end
+
+    def _k0(self):
+        core, store = self.core, self.core.store
+        stop = float("inf") if self.stop is None else self.stop
+        with core._store_lock:
+            subjects = sorted(s for s in store.spo if self.start <= s < stop)
+            derived = {store._ids(*t) for t in core.rules.derived}
+        rows = []
+        for i in range(0, len(subjects), K0_SUBJECTS):
+            with core._store_lock:
+                for s in subjects[i:i + K0_SUBJECTS]:
+                    for p, objs in store.spo.get(s, {}).items():
+                        rows.extend((s, p, o, w) for o, w in objs.items())
+            while len(rows) >= EXPORT_CHUNK:
+                yield from self._k0_chunk(rows[:EXPORT_CHUNK], derived)
+                rows = rows[EXPORT_CHUNK:]
+        if rows:
+            yield from self._k0_chunk(rows, derived)
+
+    def _k0_chunk(self, rows, derived):
+        s, p, o, w = (np.array(col) for col in zip(*rows))
+        flags = np.fromiter(((a, b, c) in derived for a, b, c, _ in rows), dtype=bool, count=len(rows))
+        keep = self._keep(w.astype(float))
+        chunk = Chunk(0, s.astype(np.int32), o.astype(np.int32), w.astype(float), p.astype(np.int32), flags)
+        if keep is not None:
+            for name in ("src", "dst", "weight", "pred", "derived"):
+                setattr(chunk, name, getattr(chunk, name)[keep])
+        if len(chunk):              # min_weight may have emptied it
+            yield chunk
+
+    def metadata(self):
+        core = self.core
+        return {"version": self.state.version, "depth": self.state.depth,
+                "bootstrapped": getattr(core, "bootstrapped", False),
+                "invented_predicates": list(getattr(core, "invented_predicates", [])),
+                "levels": self.levels, "start": self.start, "stop": self.stop,
+                "min_weight": self.min_weight, "export_timestamp": datetime.now().isoformat()}
+
+    def _labels(self, chunk):
+        """(subject, object, predicate-or-None) label arrays of a chunk."""
+        labels = self.core.nodes.labels()          # grows with K⁰ – fetched per chunk
+        preds = None if chunk.pred is None else self.core.store.preds.labels(chunk.pred)
+        return labels[chunk.src], labels[chunk.dst], preds
+
+    # ---- formats ----
+    def ndjson(self):
+        """A metadata line, then one {"level", "s", "p", "o", "weight"} line per edge."""
+        yield json.dumps({"metadata": self.metadata()}) + "\n"
+        for chunk in self.chunks():
+            s, o, p = self._labels(chunk)
+            lines = []
+            for i, (u, v, w) in enumerate(zip(s.tolist(), o.tolist(), chunk.weight.tolist())):
+                rec = {"level": chunk.level, "s": u, "p": None if p is None else p[i], "o": v, "weight": w}
+                if chunk.derived is not None and chunk.derived[i]:
+                    rec["derived"] = True
+                lines.append(json.dumps(rec, default=str))
+            yield "\n".join(lines) + "\n"
+
+    def json(self):
+        """{"metadata": …, "level_<k>": {"edges": [[u, v, {…}], …]}, …} written
+        incrementally, edges in the (u, v, data) form of the nx views."""
+        yield '{"metadata": ' + json.dumps(self.metadata())
+        for k in self.levels:
+            yield f', "level_{k}": {{"edges": ['
+            sep = ""
+            for chunk in self.chunks(k):
+                s, o, p = self._labels(chunk)
+                edges = []
+                for i, (u, v, w) in enumerate(zip(s.tolist(), o.tolist(), chunk.weight.tolist())):
+                    data = {"weight": w} if p is None else {"predicate": p[i], "weight": w}
+                    if chunk.derived is not None and chunk.derived[i]:
+                        data["derived"] = True
+                    edges.append(json.dumps([u, v, data], default=str))
+                yield sep + ", ".join(edges)
+                sep = ", "
+            yield "]}"
+        yield "}"
+
+    def graphml(self):
+        """GraphML with one multi-level edge set; nodes are declared as first referenced."""
+        yield ('<?xml version="1.0" encoding="UTF-8"?>\n'
+               '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+               '<key id="level" for="edge" attr.name="level" attr.type="int"/>\n'
+               '<key id="predicate" for="edge" attr.name="predicate" attr.type="string"/>\n'
+               '<key id="weight" for="edge" attr.name="weight" attr.type="double"/>\n'
+               '<graph edgedefault="directed">\n')
+        declared = np.zeros(0, dtype=bool)
+        for chunk in self.chunks():
+            labels = self.core.nodes.labels()
+            if len(declared) < len(labels):
+                declared = np.pad(declared, (0, len(labels) - len(declared)))
+            ids = np.unique(np.concatenate([chunk.src, chunk.dst]))
+            ids = ids[~declared[ids]]
+            declared[ids] = True
+            out = [f"<node id={quoteattr(str(x))}/>" for x in labels[ids].tolist()]
+            s, o, p = self._labels(chunk)
+            for i, (u, v, w) in enumerate(zip(s.tolist(), o.tolist(), chunk.weight.tolist())):
+                pred = "" if p is None else f'<data key="predicate">{_text(p[i])}</data>'
+                out.append(f"<edge source={quoteattr(str(u))} target={quoteattr(str(v))}>"
+                           f'<data key="level">{chunk.level}</data>{pred}'
+                           f'<data key="weight">{w!r}</data></edge>')
+            yield "\n".join(out) + "\n"
+        yield "</graph>\n</graphml>\n"
+
+    def columnar(self, compress=False):
+        """npz archive, written as it streams:
+
+            meta.json                          export metadata
+            nodes_blob / nodes_offsets         utf-8 node labels (id = position)
+            preds_blob / preds_offsets         utf-8 K⁰ predicate labels
+            level_<k>_{src,dst,weight}         int32, int32, float64 per edge
+            level_0_{pred,derived}             int32 predicate id, bool
+
+        Each level's columns are gathered before they are written (about 20
+        bytes an edge); the string tables go last so they cover every id."""
+        sink = _Sink()
+        method = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        with zipfile.ZipFile(sink, "w", compression=method, allowZip64=True) as zf:
+            zf.writestr("meta.json", json.dumps(self.metadata()))
+            yield sink.drain()
+            for k in self.levels:
+                parts = {}
+                for chunk in self.chunks(k):
+                    for name in ("src", "dst", "weight", "pred", "derived"):
+                        col = getattr(chunk, name)
+                        if col is not None:
+                            parts.setdefault(name, []).append(col)
+                for name, cols in parts.items():
+                    _write_array(zf, f"level_{k}_{name}", np.concatenate(cols))
+                    yield sink.drain()
+            for prefix, table in (("nodes", self.core.nodes), ("preds", self.core.store.preds)):
+                blob, offsets = _string_table(table.labels())
+                _write_array(zf, f"{prefix}_blob", blob)
+                _write_array(zf, f"{prefix}_offsets", offsets)
+                yield sink.drain()
+        yield sink.drain()
+
+def _text(value):
+    return str(value).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+def _string_table(labels):
+    encoded = [str(label).encode() for label in labels]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+def _write_array(zf, name, arr):
+    with zf.open(name + ".npy", "w", force_zip64=True) as f:
+        np.lib.format.write_array(f, np.ascontiguousarray(arr), allow_pickle=False)
+
+class _Sink(io.RawIOBase):
+    """Write-only, unseekable buffer the zip writer fills and the stream drains."""
+    def __init__(self):
+        self._buf, self._pos = bytearray(), 0
+    def writable(self):
+        return True
+    def write(self, b):
+        self._buf += b
+        self._pos += len(b)
+        return len(b)
+    def tell(self):
+        return self._pos
+    def drain(self):
+        out, self._buf = bytes(self._buf), bytearray()
+        return out
+
+def read_columnar(file):
+    """(metadata, {level: {column: array}}) from a columnar export, with the
+    string tables resolved: src/dst as node labels, pred as predicate labels."""
+    with np.load(file, allow_pickle=False) as npz:
+        meta = json.loads(npz["meta.json"])
+        tables = {}
+        for prefix in ("nodes", "preds"):
+            blob, offsets = npz[f"{prefix}_blob"].tobytes(), npz[f"{prefix}_offsets"]
+            tables[prefix] = np.array([blob[a:b].decode() for a, b in zip(offsets[:-1], offsets[1:])],
+                                      dtype=object)
+        levels = {}
+        for name in npz.files:
+            if name.startswith("level_"):
+                _, k, col = name.split("_", 2)
+                levels.setdefault(int(k), {})[col] = npz[name]
+    for cols in levels.values():
+        cols["src"], cols["dst"] = tables["nodes"][cols["src"]], tables["nodes"][cols["dst"]]
+        if "pred" in cols:
+            cols["pred"] = tables["preds"][cols["pred"]]
+    return meta, levels
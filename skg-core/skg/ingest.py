@@ -0,0 +1,167 @@
+# cognition/skg/ingest.py  –  coalescing write queue in front of SKGCore
+import threading, time
+
+DEBOUNCE_SECS  = 0.05       # quiet period that closes a burst
+MAX_DELAY_SECS = 1.0        # …but never hold the first write longer than this
+MAX_BATCH      = 10_000     # triples per add_triples() call
+FAILED_KEEP    = 1024       # failed submissions remembered for wait()
+
+class IngestError(RuntimeError):
+    """A waited-for write was not applied."""
+
+LABEL_TYPES = (str, int, float)     # what SQLite binds (bool is an int)
+
+def check_triples(triples):
+    """(s, p, o) tuples, or ValueError before anything is queued or stored.
+    Every term must be a label SQLite can bind, or the write-through would
+    fail after the in-memory store had already taken the triple."""
+    out = []
+    for t in triples:
+        t = tuple(t)
+        if len(t) != 3 or not all(isinstance(x, LABEL_TYPES) for x in t):
+            raise ValueError(f"not an (s, p, o) triple of str/int/float labels: {t!r}")
+        out.append(t)
+    return out
+
+class IngestQueue:
+    """Acknowledge writes at once, apply them later in coalesced batches.
+
+    `submit()` appends to an in-memory queue and returns a ticket (the sequence
+    number of the last triple it queued).  A single worker thread waits for a
+    burst to go quiet (`debounce`), then hands everything queued so far to one
+    `core.add_triples()` call – one repair and one level update per burst, not
+    per request.  `wait(ticket)` blocks until that ticket has been applied and
+    returns the graph version it is visible in (read-your-writes).
+
+    Malformed triples are refused by `submit()`.  If a coalesced batch still
+    fails, its submissions are retried one by one so a bad write only fails
+    its own ticket; `wait()` raises IngestError for a ticket that failed."""
+
+    def __init__(self, core, debounce=DEBOUNCE_SECS, max_delay=MAX_DELAY_SECS,
+                 max_batch=MAX_BATCH):
+        self.core      = core
+        self.debounce  = debounce
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.submitted = 0          # sequence number of the last queued triple
+        self.applied   = 0          # …and of the last one add_triples() returned for
+        self.batches   = 0
+        self.last_error = None
+        self._pending  = []         # [(ticket, triples)] – one entry per submit()
+        self._failed   = []         # [(first, ticket, error)] of failed submissions
+        self._last_put = 0.0
+        self._cond     = threading.Condition()
+        self._worker   = None
+        self._stopping = False
+
+    @property
+    def pending(self):
+        return self.submitted - self.applied
+
+    def submit(self, triples):
+        """Queue (s, p, o) triples; returns their ticket."""
+        triples = check_triples(triples)
+        with self._cond:
+            if not triples:
+                return self.submitted
+            self.submitted += len(triples)
+            self._pending.append((self.submitted, triples))
+            self._last_put = time.monotonic()
+            self._ensure_worker()
+            self._cond.notify_all()
+            return self.submitted
+
+    def wait(self, ticket=None, timeout=None):
+        """Block until `ticket` (default: everything queued so far) is applied.
+        Returns the graph version, or None on timeout; raises IngestError if
+        the submission holding `ticket` failed."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            ticket = self.submitted if ticket is None else ticket
+            while self.applied < ticket:
+                left = None if deadline is None else deadline - time.monotonic()
+                if left is not None and left <= 0:
+                    return None
+                self._cond.wait(left)
+            for first, last, error in self._failed:
+                if first <= ticket <= last:
+                    raise IngestError(f"ticket {ticket} failed: {error}")
+            return self.core.version
+
+    def flush(self, timeout=None):
+        return self.wait(None, timeout)
+
+    def close(self, timeout=None):
+        """Apply what is queued, then stop the worker."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+    def status(self):
+        return {"submitted": self.submitted, "applied": self.applied,
+                "pending": self.pending, "batches": self.batches,
+                "version": self.core.version, "last_error": self.last_error}
+
+    # ---- worker ----
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._stopping = False
+            self._worker = threading.Thread(target=self._run, name="skg-ingest", daemon=True)
+            self._worker.start()
+
+    def _next_batch(self):
+        """Wait for a burst to settle; returns whole submissions holding up to
+        max_batch triples (at least one submission), or None to stop."""
+        with self._cond:
+            while not self._pending:
+                if self._stopping:
+                    return None
+                self._cond.wait()
+            first = time.monotonic()
+            while not self._stopping and sum(len(t) for _, t in self._pending) < self.max_batch:
+                now = time.monotonic()
+                quiet = self._last_put + self.debounce - now
+                hold  = first + self.max_delay - now
+                if quiet <= 0 or hold <= 0:
+                    break
+                self._cond.wait(min(quiet, hold))
+            take, size = 0, 0
+            while take < len(self._pending) and (not take or size + len(self._pending[take][1]) <= self.max_batch):
+                size += len(self._pending[take][1])
+                take += 1
+            batch, self._pending = self._pending[:take], self._pending[take:]
+            return batch
+
+    def _apply(self, triples):
+        try:
+            self.core.add_triples(triples)
+            return None
+        except Exception as e:
+            return f"{type(e).__name__}: {e}"
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            start = self.applied
+            error = self._apply([t for _, triples in batch for t in triples])
+            failed = []
+            if error is not None:
+                print(f"[SKG] ingest batch of {len(batch)} submissions failed: {error}")
+                # keep the queue moving, and fail only the submissions that fail alone
+                first = start + 1
+                for ticket, triples in batch:
+                    err = error if len(batch) == 1 else self._apply(triples)
+                    if err is not None:
+                        failed.append((first, ticket, err))
+                    first = ticket + 1
+            self.last_error = failed[-1][2] if failed else None
+            with self._cond:
+                self._failed = (self._failed + failed)[-FAILED_KEEP:]
+                self.applied = batch[-1][0]
+                self.batches += 1
+                self._cond.notify_all()
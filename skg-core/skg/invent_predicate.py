@@ -1,33 +1,55 @@
-# cognition/skg/invent_predicate.py  (70 lines)
-import networkx as nx
-from networkx.algorithms import community
+# cognition/skg/invent_predicate.py  –  predicate invention over incrementally tracked communities
+import contextlib
+from .communities import CommunityIndex, fingerprint
 
 def maybe_invent_predicate(core, thresh=0.8):
+    """Invent predicates for dense K² communities.  Runs on the core's write
+    lock (re-entrant, so writers may call it): the community index and the
+    recursion flag are never shared with a concurrent writer."""
+    lock = getattr(core, "_write_lock", None)
+    with lock if lock is not None else contextlib.nullcontext():
+        return _invent(core, thresh)
+
+def _invent(core, thresh):
     if len(core.levels) < 3:  # need at least 3 levels
         return
-    
+
     # Prevent infinite recursion when adding invented predicates
     if getattr(core, '_inventing_predicate', False):
         return
-        
-    g = core.levels[2]                      # meta-meta graph
-    if g.number_of_edges() < 5: return
-    
+
+    adj = core.adjs.get(2)                  # meta-meta graph
+    if adj is None or adj.nnz < 5: return
+
     # Set flag to prevent recursion
     core._inventing_predicate = True
     try:
-        # greedy modularity
-        clusters = community.greedy_modularity_communities(g)
-        for c in clusters:
-            if len(c) < 3: continue
-            density = nx.density(g.subgraph(c))
-            if density > thresh:
-                name = f"cluster_{abs(hash(tuple(sorted(c))))}"[:12]
-                print(f"[SKG] invented predicate  {name} (density={density:.2f})")
-                # inject back into K⁰ as a synthetic predicate
-                core.add_triples([(name, "isA", "invented_predicate")])
-                for n in c:
-                    core.add_triples([(n, "member_of", name)])
+        # label propagation seeded from the cached partition – only
+        # communities touched since the last call are re-evaluated
+        index = getattr(core, "communities", None)
+        if index is None:
+            index = core.communities = CommunityIndex()
+        touched = index.update(adj)
+        labels = core.nodes.labels()
+        invented = getattr(core, "invented_predicates", None)
+        # invented nodes join the communities they name – leave them out of
+        # the fingerprint, or every expansion would re-invent the same cluster
+        synthetic = set(invented or ()) | {"invented_predicate"}
+        for c, (size, density) in index.density(adj, touched).items():
+            if size < 3 or density <= thresh:
+                continue
+            members = [m for m in labels[index.members(c)].tolist() if m not in synthetic]
+            if len(members) < 3:
+                continue
+            name = f"cluster_{fingerprint(members)}"
+            if invented is not None:
+                if name in invented:
+                    continue        # same members as an earlier invention
+                invented.append(name)
+            print(f"[SKG] invented predicate  {name} (density={density:.2f})")
+            # inject back into K⁰ as a synthetic predicate
+            core.add_triples([(name, "isA", "invented_predicate")] +
+                             [(n, "member_of", name) for n in members])
     finally:
         # Clear flag
-        core._inventing_predicate = False
\ No newline at end of file
+        core._inventing_predicate = False
@@ -0,0 +1,51 @@
+# cognition/skg/nodes.py  –  interned node dictionary shared by every level
+import numpy as np
+
+class NodeDict:
+    """Label ↔ dense int32 id.  Ids are handed out in first-seen order and never
+    reused, so row i of every level matrix is the same node at every depth."""
+
+    def __init__(self, labels=()):
+        self._ids    = {}           # label → id
+        self._labels = []           # id → label
+        self._array  = None         # cached reverse-lookup ndarray
+        for label in labels:
+            self.intern(label)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __contains__(self, label):
+        return label in self._ids
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def intern(self, label):
+        """Return the id of `label`, assigning the next free one if unseen."""
+        i = self._ids.get(label)
+        if i is None:
+            i = self._ids[label] = len(self._labels)
+            self._labels.append(label)
+            self._array = None
+        return i
+
+    def intern_many(self, labels):
+        return np.fromiter((self.intern(l) for l in labels), dtype=np.int32)
+
+    def id(self, label, default=None):
+        return self._ids.get(label, default)
+
+    def ids(self, labels):
+        """Ids for known labels; unknown labels map to -1."""
+        return np.fromiter((self._ids.get(l, -1) for l in labels), dtype=np.int32)
+
+    def label(self, i):
+        return self._labels[i]
+
+    def labels(self, ids=None):
+        """Reverse lookup array (object dtype), optionally gathered at `ids`."""
+        if self._array is None or len(self._array) != len(self._labels):
+            self._array = np.empty(len(self._labels), dtype=object)
+            self._array[:] = self._labels
+        return self._array if ids is None else self._array[np.asarray(ids)]
@@ -0,0 +1,127 @@
+# cognition/skg/partition.py  –  per-component level construction on a process pool
+import atexit, os
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import scipy.sparse as sp
+
+PARALLEL_MIN_NNZ = 200_000  # below this a pool costs more than it saves
+TASKS_PER_WORKER = 4        # component groups per worker, for load balance
+CROSS_WEIGHT     = 0.2      # same constant as SKGCore._cross_links
+START_METHOD     = os.environ.get("SKG_POOL_START",          # no fork of a threaded parent
+                                  "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn")
+
+def default_workers():
+    return os.cpu_count() or 1
+
+def candidate_rows(adj, mask, top, rows, proposer):
+    """Kᵏ candidates (before pruning) for `rows` of Kᵏ⁻¹ as a len(rows)×n CSR:
+    the rows themselves, their damped cross-links and the proposer's links.
+    Exact for any row set, so components can be processed independently and
+    stitched back together."""
+    part = adj[rows]
+    out = (part + part * CROSS_WEIGHT + proposer.propose(mask, rows, top)).tocsr()
+    out.eliminate_zeros()
+    return out
+
+def component_groups(adj, parts):
+    """Split the nodes into ≤ `parts` groups of whole weakly connected
+    components, balanced by stored edges (largest-first greedy)."""
+    from scipy.sparse.csgraph import connected_components   # pulls in scipy.linalg
+    n_comp, labels = connected_components(adj, directed=True, connection="weak")
+    load = np.bincount(labels, weights=np.diff(adj.indptr), minlength=n_comp) + 1
+    bins, assign = np.zeros(max(min(parts, n_comp), 1)), np.empty(n_comp, dtype=np.int64)
+    for c in np.argsort(-load, kind="stable").tolist():
+        b = int(np.argmin(bins))
+        assign[c] = b
+        bins[b] += load[c]
+    node_bin = assign[labels]
+    order = np.argsort(node_bin, kind="stable")
+    cuts = np.searchsorted(node_bin[order], np.arange(1, len(bins)))
+    return [g for g in np.split(order, cuts) if g.size]
+
+class SharedArrays:
+    """Numpy arrays copied once into named shared-memory blocks; workers
+    attach by name instead of receiving a pickled copy per task."""
+
+    def __init__(self, **arrays):
+        self.blocks, self.spec = [], {}
+        for key, arr in arrays.items():
+            arr = np.ascontiguousarray(arr)
+            shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            np.ndarray(arr.shape, arr.dtype, buffer=shm.buf)[...] = arr
+            self.blocks.append(shm)
+            self.spec[key] = (shm.name, arr.shape, arr.dtype.str)
+
+    def __enter__(self):
+        return self.spec
+
+    def __exit__(self, *exc):
+        for shm in self.blocks:
+            shm.close()
+            shm.unlink()
+
+def _attach(spec):
+    handles, arrays = [], {}
+    for key, (name, shape, dtype) in spec.items():
+        shm = shared_memory.SharedMemory(name=name)
+        handles.append(shm)
+        arrays[key] = np.ndarray(shape, np.dtype(dtype), buffer=shm.buf)
+    return handles, arrays
+
+def _expand_task(spec, n, rows, proposer):
+    handles, a = _attach(spec)
+    adj = mask = None
+    try:
+        adj = sp.csr_matrix((a["data"], a["indices"], a["indptr"]), shape=(n, n), copy=False)
+        mask = sp.csr_matrix(((a["data"] != 0).astype(float), a["indices"], a["indptr"]),
+                             shape=(n, n), copy=False)
+        return candidate_rows(adj, mask, a["top"], rows, proposer)    # fresh arrays, not views
+    finally:
+        # views into the blocks must be gone before they can be closed
+        adj = mask = None
+        a.clear()
+        for shm in handles:
+            shm.close()
+
+_POOL, _POOL_SIZE = None, 0
+
+def pool(workers):
+    global _POOL, _POOL_SIZE
+    if _POOL is None or _POOL_SIZE != workers:
+        shutdown()
+        ctx = mp.get_context(START_METHOD)
+        if START_METHOD == "forkserver":
+            # the server preloads only this module (numpy, scipy) – never the
+            # caller's __main__, which may build a whole core on import
+            ctx.set_forkserver_preload([__name__])
+        _POOL, _POOL_SIZE = ProcessPoolExecutor(max_workers=workers, mp_context=ctx), workers
+    return _POOL
+
+@atexit.register
+def shutdown():
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(cancel_futures=True)
+        _POOL = None
+
+def should_split(adj, workers, min_nnz=None):
+    min_nnz = PARALLEL_MIN_NNZ if min_nnz is None else min_nnz
+    return workers > 1 and adj.nnz >= min_nnz
+
+def expand_level(prev, top, workers, proposer):
+    """Unpruned Kᵏ from Kᵏ⁻¹: component groups are expanded in parallel over
+    shared memory and merged into one CSR matrix."""
+    prev = sp.csr_matrix(prev, dtype=float)        # published levels are never touched
+    n = prev.shape[0]
+    groups = component_groups(prev, workers * TASKS_PER_WORKER)
+    with SharedArrays(indptr=prev.indptr, indices=prev.indices, data=prev.data,
+                      top=np.asarray(top, dtype=float)) as spec:
+        futures = [pool(workers).submit(_expand_task, spec, n, rows, proposer) for rows in groups]
+        parts = [f.result() for f in futures]
+    if not parts:
+        return sp.csr_matrix((n, n))
+    # groups arrive as row blocks: stack them, then put rows back in id order
+    stacked = sp.vstack(parts, format="csr")
+    return stacked[np.argsort(np.concatenate(groups), kind="stable")]
@@ -0,0 +1,168 @@
+# cognition/skg/propose.py  –  pluggable non-local edge proposers X for Kᵏ⁻¹ → Kᵏ
+import abc
+import numpy as np
+import scipy.sparse as sp
+from .prune import TopKPruner
+
+PROPOSAL_WEIGHT = 0.15      # weight of every proposed edge in the next level
+PROPOSE_FANOUT  = 8         # heuristic proposers: new links kept per row
+KATZ_BETA       = 0.1       # Katz damping per hop
+KATZ_HOPS       = 3         # Katz walk length cut-off
+TARGET_PCT      = 95        # proposals target nodes scoring above this percentile
+
+def link_mask(adj):
+    """0/1 float matrix of a level's stored links."""
+    return (sp.csr_matrix(adj, dtype=float) != 0).astype(float)
+
+def _rows(rows, n):
+    return np.arange(n) if rows is None else np.asarray(rows, dtype=np.int64)
+
+class Proposer:
+    """Proposes nothing.  Subclasses score (row, target) pairs in `scores()`.
+
+    `targets()` runs once per full build and is cached by the core (`_top`);
+    `propose()` must read no rows of `mask` further than `hops - 1` links from
+    `rows`, which is what lets dirty-row updates and per-component builds
+    recompute a subset of rows exactly."""
+    name = "none"
+    hops = 1
+
+    def targets(self, adj, level):
+        """Per-node prior handed back to `propose()` as `top`."""
+        return np.ones(adj.shape[0])
+
+    def touch(self, n=1):
+        pass
+
+    def retrain(self, adjs):
+        pass
+
+    def scores(self, mask, rows, top):
+        return sp.csr_matrix((len(rows), mask.shape[1]))
+
+    def propose(self, mask, rows=None, top=None):
+        """len(rows)×n proposals (every row if `rows` is None), each at PROPOSAL_WEIGHT."""
+        rows = _rows(rows, mask.shape[0])
+        if top is None:
+            top = self.targets(mask, None)
+        out = sp.csr_matrix(self.scores(mask, rows, top))
+        out.eliminate_zeros()
+        out.data[:] = PROPOSAL_WEIGHT
+        return out
+
+class HeuristicProposer(Proposer, metaclass=abc.ABCMeta):
+    """Link-prediction score from sparse path products; keeps the `fanout`
+    best links per row that do not exist yet.  No model, no torch.
+
+    Like the GCN, proposals only point at target nodes – here the nodes whose
+    degree is above the `target_pct` percentile, the quantity the GCN is
+    trained to predict (None: every node is a target)."""
+    hops = 2
+
+    def __init__(self, fanout=PROPOSE_FANOUT, target_pct=TARGET_PCT):
+        self.fanout = fanout
+        self.target_pct = target_pct
+
+    def targets(self, adj, level):
+        if self.target_pct is None:
+            return np.ones(adj.shape[0])
+        mask = link_mask(adj)
+        degree = np.asarray(mask.sum(axis=0)).ravel() + np.asarray(mask.sum(axis=1)).ravel()
+        return (degree > np.percentile(degree, self.target_pct)).astype(float)
+
+    @abc.abstractmethod
+    def paths(self, mask, src, rows):
+        """len(rows)×n path-count scores of the `src` = mask[rows] rows."""
+
+    def scores(self, mask, rows, top):
+        src = mask[rows]
+        s = sp.csr_matrix(self.paths(mask, src, rows) @ sp.diags(top))
+        own = sp.csr_matrix((np.ones(len(rows)), (np.arange(len(rows)), rows)), shape=src.shape)
+        s = s - s.multiply((src + own) != 0)       # existing links and self-loops
+        s.eliminate_zeros()
+        return TopKPruner(self.fanout).prune(s)
+
+class CommonNeighbors(HeuristicProposer):
+    """|out(i) ∩ in(j)| – number of two-hop paths i → z → j."""
+    name = "common_neighbors"
+    def paths(self, mask, src, rows):
+        return src @ mask
+
+class AdamicAdar(HeuristicProposer):
+    """Two-hop paths weighted by 1 / log(1 + out-degree of the middle node),
+    so paths through hubs count for less."""
+    name = "adamic_adar"
+    def paths(self, mask, src, rows):
+        deg = np.asarray(mask.sum(axis=1)).ravel()
+        w = np.zeros_like(deg)
+        np.divide(1.0, np.log1p(deg), out=w, where=deg > 0)
+        return src @ sp.diags(w) @ mask
+
+class Jaccard(HeuristicProposer):
+    """|out(i) ∩ in(j)| / |out(i) ∪ in(j)|.  The in-degree term reads columns,
+    so dirty-row updates leave it stale until the next full rebuild."""
+    name = "jaccard"
+    def paths(self, mask, src, rows):
+        common = sp.csr_matrix(src @ mask).tocoo()
+        out_deg = np.asarray(src.sum(axis=1)).ravel()
+        in_deg = np.asarray(mask.sum(axis=0)).ravel()
+        union = out_deg[common.row] + in_deg[common.col] - common.data
+        return sp.csr_matrix((common.data / union, (common.row, common.col)), shape=common.shape)
+
+class Katz(HeuristicProposer):
+    """Σ_{l ≤ hops} βˡ · (walks of length l), truncated after `hops` products."""
+    name = "katz"
+
+    def __init__(self, fanout=PROPOSE_FANOUT, target_pct=TARGET_PCT, beta=KATZ_BETA, hops=KATZ_HOPS):
+        super().__init__(fanout, target_pct)
+        self.beta, self.hops = beta, hops
+
+    def paths(self, mask, src, rows):
+        walk = total = src * self.beta
+        for _ in range(self.hops - 1):
+            walk = (walk @ mask) * self.beta
+            total = total + walk
+        return total
+
+class GCNProposer(Proposer):
+    """Two-hop proposals towards the nodes a per-level GCN scores highest.
+    Optional backend: torch and torch_geometric are imported on first use."""
+    name = "gcn"
+    hops = 2
+
+    def __init__(self, path=None):
+        self.path = path
+        self._scorer = None
+
+    @property
+    def scorer(self):
+        if self._scorer is None:
+            from .scorer import EdgeScorer
+            self._scorer = EdgeScorer(self.path)     # warm-started from the checkpoint
+        return self._scorer
+
+    def __getstate__(self):
+        # pool workers only need `top`, never the model
+        return {"path": self.path, "_scorer": None}
+
+    def targets(self, adj, level):
+        scores = self.scorer.scores(adj, level)
+        return (scores > np.percentile(scores, TARGET_PCT)).astype(float)
+
+    def touch(self, n=1):
+        self.scorer.touch(n)
+
+    def retrain(self, adjs):
+        self.scorer.retrain(adjs)
+
+    def scores(self, mask, rows, top):
+        return (mask[rows] @ mask) @ sp.diags(top)
+
+PROPOSERS = {cls.name: cls for cls in (CommonNeighbors, AdamicAdar, Jaccard, Katz, GCNProposer, Proposer)}
+
+def make_proposer(strategy="adamic_adar", **kw):
+    """Edge proposer by name; `kw` go to the strategy's constructor."""
+    try:
+        return PROPOSERS[strategy](**kw)
+    except KeyError:
+        raise ValueError(f"unknown edge proposer {strategy!r} – one of {sorted(PROPOSERS)}")
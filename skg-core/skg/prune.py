@@ -0,0 +1,126 @@
+# cognition/skg/prune.py  –  pruning strategies for level construction
+import math
+import numpy as np
+import scipy.sparse as sp
+
+PRUNE_THRESH   = 0.05       # share of weights dropped by "quantile"
+SKETCH_ALPHA   = 0.01       # relative accuracy of the quantile sketch
+PRUNE_MIN_WEIGHT = 0.1      # cut-off for "threshold"
+PRUNE_TOPK     = 32         # edges kept per row by "topk"
+
+class QuantileSketch:
+    """Log-bucketed quantile sketch (DDSketch-style): every weight lands in
+    bucket ⌈log_γ w⌉ with γ = (1+α)/(1-α), so a quantile is exact to a relative
+    error α.  Buckets are plain counters, which makes removal as cheap and as
+    exact as insertion – unlike t-digest/KLL, edges can leave a level."""
+
+    def __init__(self, alpha=SKETCH_ALPHA):
+        self.gamma  = (1 + alpha) / (1 - alpha)
+        self._log_g = math.log(self.gamma)
+        self.counts = {}            # bucket key → count
+        self.total  = 0
+
+    def keys(self, values):
+        values = np.maximum(np.asarray(values, dtype=float), 1e-300)
+        return np.ceil(np.log(values) / self._log_g).astype(np.int64)
+
+    def _update(self, values, sign):
+        if len(values) == 0:
+            return
+        keys, counts = np.unique(self.keys(values), return_counts=True)
+        for key, c in zip(keys.tolist(), counts.tolist()):
+            left = self.counts.get(key, 0) + sign * c
+            if left > 0:
+                self.counts[key] = left
+            else:
+                self.counts.pop(key, None)
+        self.total = max(self.total + sign * int(counts.sum()), 0)
+
+    def add(self, values):
+        self._update(values, +1)
+
+    def remove(self, values):
+        self._update(values, -1)
+
+    def quantile_key(self, q):
+        """Bucket holding rank ⌈q·(n-1)⌉ (the rank np.percentile interpolates towards)."""
+        if not self.total:
+            return None
+        rank, seen = math.ceil(q * (self.total - 1)), 0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            if seen > rank:
+                return key
+        return key
+
+    def quantile(self, q):
+        key = self.quantile_key(q)
+        return None if key is None else 2 * self.gamma ** key / (self.gamma + 1)
+
+class Pruner:
+    """Strategy interface.  `observe`/`forget` keep any streaming state in step
+    with the weights a level holds; `prune` drops candidates that were observed
+    and forgets what it dropped, so state stays O(changed edges) per update."""
+    name = "none"
+    def observe(self, weights): pass
+    def forget(self, weights): pass
+    def threshold(self): return None
+    def prune(self, adj):
+        return sp.csr_matrix(adj, dtype=float)
+
+    def _drop(self, adj, drop):
+        self.forget(adj.data[drop])
+        adj.data[drop] = 0
+        adj.eliminate_zeros()
+        return adj
+
+class QuantilePruner(Pruner):
+    """Drop the lowest `q` share of a level's weights, read from the sketch."""
+    name = "quantile"
+    def __init__(self, q=PRUNE_THRESH, alpha=SKETCH_ALPHA):
+        self.q = q
+        self.sketch = QuantileSketch(alpha)
+    def observe(self, weights): self.sketch.add(weights)
+    def forget(self, weights): self.sketch.remove(weights)
+    def threshold(self): return self.sketch.quantile(self.q)
+    def prune(self, adj):
+        adj = sp.csr_matrix(adj, dtype=float)
+        cut = self.sketch.quantile_key(self.q)
+        if cut is None or not adj.nnz:
+            return adj
+        # compare bucket keys so equal weights are never split by sketch error
+        return self._drop(adj, self.sketch.keys(adj.data) < cut)
+
+class ThresholdPruner(Pruner):
+    """Drop every weight below an absolute cut-off."""
+    name = "threshold"
+    def __init__(self, min_weight=PRUNE_MIN_WEIGHT):
+        self.min_weight = min_weight
+    def threshold(self): return self.min_weight
+    def prune(self, adj):
+        adj = sp.csr_matrix(adj, dtype=float)
+        return self._drop(adj, adj.data < self.min_weight)
+
+class TopKPruner(Pruner):
+    """Keep the `k` heaviest out-edges of every row."""
+    name = "topk"
+    def __init__(self, k=PRUNE_TOPK):
+        self.k = k
+    def prune(self, adj):
+        adj = sp.csr_matrix(adj, dtype=float)
+        adj.sort_indices()
+        rows = np.repeat(np.arange(adj.shape[0]), np.diff(adj.indptr))
+        order = np.lexsort((-adj.data, rows))          # row-major, heaviest first
+        rank = np.arange(adj.nnz) - adj.indptr[rows[order]]
+        drop = np.zeros(adj.nnz, dtype=bool)
+        drop[order[rank >= self.k]] = True
+        return self._drop(adj, drop)
+
+PRUNERS = {cls.name: cls for cls in (QuantilePruner, ThresholdPruner, TopKPruner, Pruner)}
+
+def make_pruner(strategy="quantile", **kw):
+    """Fresh pruner for one level; `kw` go to the strategy's constructor."""
+    try:
+        return PRUNERS[strategy](**kw)
+    except KeyError:
+        raise ValueError(f"unknown prune strategy {strategy!r} – one of {sorted(PRUNERS)}")
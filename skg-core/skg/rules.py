@@ -0,0 +1,146 @@
+# cognition/skg/rules.py  –  Datalog rules materialized into K⁰ by semi-naive evaluation
+import json, os, pathlib
+from collections import defaultdict
+from .bgp import Plan, is_var
+
+_REPO_VAULT = pathlib.Path(__file__).resolve().parents[2] / "seed_vault"
+VAULT_ROOT  = pathlib.Path(os.getenv("SEED_VAULT_PATH",
+                                     _REPO_VAULT if _REPO_VAULT.exists() else "/app/seed_vault"))
+RULES_VAULT = VAULT_ROOT / "skg" / "inference_rules.json"
+MAX_ROUNDS  = 64            # semi-naive rounds per insert (deep chains stop here)
+
+class Rule:
+    """head :- body₁, body₂, …   – every term a label or a `?var`; head
+    variables must all occur in the body (range restriction)."""
+
+    def __init__(self, name, head, body):
+        self.name, self.head, self.body = name, tuple(head), [tuple(a) for a in body]
+        if len(self.head) != 3 or not self.body or any(len(a) != 3 for a in self.body):
+            raise ValueError(f"rule {name!r}: head and body atoms must be [s, p, o]")
+        free = {t for t in self.head if is_var(t)} - {t for a in self.body for t in a if is_var(t)}
+        if free:
+            raise ValueError(f"rule {name!r}: head variables {sorted(free)} not bound by the body")
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d["name"], d["head"], d["body"])
+
+    def __repr__(self):
+        return f"{self.name}: {list(self.head)} :- {[list(a) for a in self.body]}"
+
+def _unify(atom, triple):
+    """Binding that makes `atom` equal `triple`, or None."""
+    binding = {}
+    for term, value in zip(atom, triple):
+        if is_var(term):
+            if binding.setdefault(term, value) != value:
+                return None
+        elif term != value:
+            return None
+    return binding
+
+def _subst(atom, binding):
+    return tuple(binding.get(t, t) if is_var(t) else t for t in atom)
+
+class RuleEngine:
+    """Rules plus the set of K⁰ triples they derived.  Semi-naive: each round
+    joins only the facts new in the previous round – one body atom at a time
+    unified with a new fact, the rest of the body answered from the store's
+    indexes – so an insert costs work proportional to what it derives."""
+
+    def __init__(self, rules=()):
+        self.rules   = []
+        self.derived = set()        # (s, p, o) materialized here, never asserted
+        self.blocked = {}           # derived triple lost to an asserted one → that triple
+        self._atoms  = defaultdict(list)   # body predicate (None = variable) → [(rule, i)]
+        for rule in rules:
+            self.add_rule(rule)
+
+    def __len__(self):
+        return len(self.rules)
+
+    def add_rule(self, rule):
+        if isinstance(rule, dict):
+            rule = Rule.from_dict(rule)
+        self.rules.append(rule)
+        for i, atom in enumerate(rule.body):
+            self._atoms[None if is_var(atom[1]) else atom[1]].append((rule, i))
+        return rule
+
+    def relevant(self, triple):
+        """True if `triple` can take part in some rule body."""
+        return bool(self._atoms.get(triple[1]) or self._atoms.get(None))
+
+    def is_derived(self, triple):
+        return triple in self.derived
+
+    def materialize(self, store, delta):
+        """Derive everything that follows from the new facts `delta` (already in
+        `store`), add it to the store and return the derived triples."""
+        if not self.rules:
+            return []
+        out, new = [], [t for t in delta if self.relevant(t)]
+        for _ in range(MAX_ROUNDS):
+            if not new:
+                break
+            found = []
+            for fact in new:
+                for rule, i in self._atoms.get(fact[1], []) + self._atoms.get(None, []):
+                    binding = _unify(rule.body[i], fact)
+                    if binding is None:
+                        continue
+                    for head in self._heads(store, rule, i, binding):
+                        if head not in store and head not in self.blocked:
+                            store.add(*head)
+                            self.derived.add(head)
+                            found.append(head)
+            out += found
+            new = found
+        return out
+
+    def _heads(self, store, rule, i, binding):
+        rest = [_subst(a, binding) for j, a in enumerate(rule.body) if j != i]
+        if not rest:
+            yield _subst(rule.head, binding)
+            return
+        # variables already fixed by the delta fact are constants to the planner
+        for sol in Plan(store, rest).run():
+            full = dict(binding)
+            full.update({f"?{k}": v for k, v in sol.items()})
+            head = _subst(rule.head, full)
+            if not any(is_var(t) for t in head):
+                yield head
+
+    def rematerialize(self, store):
+        """Recompute every derived triple from the asserted ones (after a delete
+        – a derived fact may have lost its last support).  Returns (dropped,
+        added): derived triples gone from / new to the store."""
+        old, self.derived = self.derived, set()
+        for t in old:
+            store.remove(*t)
+        # a blocked conclusion comes back once the fact that beat it is gone
+        self.blocked = {t: w for t, w in self.blocked.items() if w in store}
+        seeds = [(s, p, o) for s, p, o, _ in store.match()]
+        self.materialize(store, seeds)
+        return old - self.derived, self.derived - old
+
+    def block(self, triple, winner):
+        """Never derive `triple` again while the asserted `winner` (the
+        triple it contradicted) is in the store."""
+        self.blocked[triple] = winner
+        self.derived.discard(triple)
+
+    def is_blocking(self, triple):
+        return triple in self.blocked.values()
+
+    def assert_fact(self, triple):
+        """An asserted copy of a derived triple makes it a base fact."""
+        self.derived.discard(triple)
+
+def load_rules(path=RULES_VAULT):
+    """Rules from a seed-vault file ({"rules": [{name, head, body}, …]});
+    a missing file means no rules."""
+    path = pathlib.Path(path)
+    if not path.exists():
+        return []
+    return [Rule.from_dict(d) for d in json.loads(path.read_text()).get("rules", [])]
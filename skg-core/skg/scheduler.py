@@ -0,0 +1,170 @@
+# cognition/skg/scheduler.py  –  one background thread for every periodic SKG job
+import threading, time
+
+CPU_BUDGET  = 0.10          # default share of one core a job may use over time
+BUSY_RETRY  = 5.0           # seconds before a deferred job is tried again
+
+class Deferred(Exception):
+    """Raised by a job that should not run right now (e.g. the write lock is
+    busy serving requests); it is retried after BUSY_RETRY, not counted as an error."""
+
+class Job:
+    """A named periodic task.  `fn(job)` may poll `job.cancelled` to stop early."""
+
+    def __init__(self, name, fn, interval, cpu_budget=CPU_BUDGET, delay=None):
+        self.name       = name
+        self.fn         = fn
+        self.interval   = interval
+        self.cpu_budget = cpu_budget
+        self.cancelled  = threading.Event()
+        self.next_run   = time.monotonic() + (interval if delay is None else delay)
+        self.runs       = 0
+        self.deferrals  = 0
+        self.cpu_secs   = 0.0       # thread CPU time over all runs
+        self.last_cpu   = 0.0
+        self.last_wall  = 0.0
+        self.last_run   = None      # wall-clock time the last run finished
+        self.last_error = None
+        self.throttled  = False     # next run pushed back to honour the budget
+
+    def status(self):
+        return {
+            "name": self.name,
+            "interval": self.interval,
+            "cpu_budget": self.cpu_budget,
+            "runs": self.runs,
+            "deferrals": self.deferrals,
+            "cpu_secs": round(self.cpu_secs, 4),
+            "last_cpu_secs": round(self.last_cpu, 4),
+            "last_wall_secs": round(self.last_wall, 4),
+            "last_run": self.last_run,
+            "next_run_in": round(max(self.next_run - time.monotonic(), 0.0), 2),
+            "throttled": self.throttled,
+            "cancelled": self.cancelled.is_set(),
+            "last_error": self.last_error,
+        }
+
+class Scheduler:
+    """Owns every background job of a core on a single daemon thread.
+
+    * single instance – registering a name that is already scheduled returns
+      the existing job instead of starting a second copy;
+    * cancellation    – `cancel(name)` unschedules a job and sets its
+      `cancelled` event so a running job can stop cooperatively;
+    * CPU budgets     – after each run the job's next start is pushed back until
+      its thread CPU time / elapsed time is within `cpu_budget`, so background
+      work cannot crowd out the request path however slow a run gets."""
+
+    def __init__(self, name="skg-jobs"):
+        self.name     = name
+        self._jobs    = {}
+        self._cond    = threading.Condition()
+        self._thread  = None
+        self._running = None
+        self._stopping = False
+
+    def register(self, name, fn, interval, cpu_budget=CPU_BUDGET, delay=None):
+        with self._cond:
+            job = self._jobs.get(name)
+            if job is not None and not job.cancelled.is_set():
+                return job
+            job = self._jobs[name] = Job(name, fn, interval, cpu_budget, delay)
+            self._ensure_thread()
+            self._cond.notify_all()
+            return job
+
+    def cancel(self, name):
+        """Unschedule `name`; returns False if no such job was scheduled."""
+        with self._cond:
+            job = self._jobs.pop(name, None)
+            if job is None:
+                return False
+            job.cancelled.set()
+            self._cond.notify_all()
+            return True
+
+    def run_now(self, name):
+        with self._cond:
+            job = self._jobs.get(name)
+            if job is None:
+                return False
+            job.next_run = time.monotonic()
+            self._cond.notify_all()
+            return True
+
+    def get(self, name):
+        return self._jobs.get(name)
+
+    def __contains__(self, name):
+        return name in self._jobs
+
+    def status(self):
+        with self._cond:
+            jobs = [job.status() for job in self._jobs.values()]
+            return {"running": self._running,
+                    "alive": self._thread is not None and self._thread.is_alive(),
+                    "jobs": sorted(jobs, key=lambda j: j["name"])}
+
+    def stop(self, timeout=None):
+        with self._cond:
+            self._stopping = True
+            for job in self._jobs.values():
+                job.cancelled.set()
+            self._jobs.clear()
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    # ---- worker ----
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+            self._thread.start()
+
+    def _next_due(self):
+        with self._cond:
+            while not self._stopping:
+                if self._jobs:
+                    job = min(self._jobs.values(), key=lambda j: j.next_run)
+                    wait = job.next_run - time.monotonic()
+                    if wait <= 0:
+                        self._running = job.name
+                        return job
+                    self._cond.wait(wait)
+                else:
+                    self._cond.wait()
+            return None
+
+    def _loop(self):
+        while True:
+            job = self._next_due()
+            if job is None:
+                return
+            self._run(job)
+            with self._cond:
+                self._running = None
+
+    def _run(self, job):
+        cpu0, wall0 = time.thread_time(), time.monotonic()
+        try:
+            job.fn(job)
+        except Deferred:
+            job.deferrals += 1
+            job.next_run = time.monotonic() + min(BUSY_RETRY, job.interval)
+            return
+        except Exception as e:
+            job.last_error = f"{type(e).__name__}: {e}"
+            print(f"[SKG] job {job.name} failed: {job.last_error}")
+        else:
+            job.last_error = None
+        job.last_cpu  = time.thread_time() - cpu0
+        job.last_wall = time.monotonic() - wall0
+        job.cpu_secs += job.last_cpu
+        job.runs += 1
+        job.last_run = time.time()
+        # rest long enough that this run's CPU is at most `cpu_budget` of the cycle
+        rest = job.last_cpu / job.cpu_budget - job.last_wall if job.cpu_budget else 0.0
+        job.throttled = rest > job.interval
+        job.next_run = time.monotonic() + max(job.interval, rest)
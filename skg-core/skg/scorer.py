@@ -0,0 +1,107 @@
+# cognition/skg/scorer.py  –  persistent, warm-started GNN node scorer for edge proposals
+import os, pathlib, time
+import numpy as np
+import scipy.sparse as sp
+import torch, torch.nn as nn
+from torch_geometric.nn import GCNConv
+
+GNN_HIDDEN     = 32
+N_FEATURES     = 5          # out/in degree, out/in weight, self-loop
+COLD_EPOCHS    = 50         # first fit of a level's model
+FINETUNE_EPOCHS = 5         # warm-start refresh
+RETRAIN_EDGES  = 256        # base-edge changes before a refresh is due
+RETRAIN_SECS   = 600        # …or this long since the last one
+
+class EdgeScoreGNN(nn.Module):
+    def __init__(self, in_dim, hidden=GNN_HIDDEN):
+        super().__init__()
+        self.conv1 = GCNConv(in_dim, hidden)
+        self.conv2 = GCNConv(hidden, 1)
+    def forward(self, x, edge_index):
+        x = self.conv1(x, edge_index).relu()
+        return torch.sigmoid(self.conv2(x, edge_index)).squeeze(-1)
+
+def node_features(adj):
+    """Compact (N, N_FEATURES) features from a sparse level – O(nnz), no eye(N)."""
+    adj  = sp.csr_matrix(adj, dtype=float)
+    mask = (adj != 0).astype(float)
+    cols = [mask.sum(axis=1), mask.sum(axis=0).T, abs(adj).sum(axis=1), abs(adj).sum(axis=0).T]
+    feats = [np.log1p(np.asarray(c).ravel()) for c in cols]
+    feats.append((adj.diagonal() != 0).astype(float))
+    return torch.tensor(np.column_stack(feats), dtype=torch.float)
+
+def _edge_index(adj):
+    coo = sp.coo_matrix(adj)
+    return torch.tensor(np.vstack([coo.row, coo.col]), dtype=torch.long)
+
+class EdgeScorer:
+    """One EdgeScoreGNN per level, kept across expansions and checkpointed to
+    `path`.  `scores()` is inference only once a level has been fit (the one
+    cold fit of a new level aside); warm-started refits of `due()` levels
+    happen only in `retrain()`, off the expansion path."""
+
+    def __init__(self, path=None):
+        self.path    = pathlib.Path(path) if path else None
+        self.models  = {}           # level → EdgeScoreGNN
+        self.trained = {}           # level → wall time of last fit
+        self.seen    = {}           # level → `changes` at its last fit
+        self.changes = 0            # base-edge changes so far
+        self.load()
+
+    def touch(self, n=1):
+        self.changes += n
+
+    def due(self, level):
+        if level not in self.trained:
+            return True
+        return (self.changes - self.seen.get(level, 0) >= RETRAIN_EDGES or
+                time.time() - self.trained[level] >= RETRAIN_SECS)
+
+    def scores(self, adj, level):
+        if level not in self.models:
+            self.fit(adj, level, COLD_EPOCHS)
+        model = self.models[level]
+        with torch.no_grad():
+            return model(node_features(adj), _edge_index(adj)).numpy()
+
+    def fit(self, adj, level, epochs=FINETUNE_EPOCHS):
+        model = self.models.setdefault(level, EdgeScoreGNN(N_FEATURES))
+        x, edge_index = node_features(adj), _edge_index(adj)
+        # dummy target = degree (in + out), scaled into the sigmoid's range
+        mask = sp.csr_matrix(adj) != 0
+        degree = np.asarray(mask.sum(axis=0)).ravel() + np.asarray(mask.sum(axis=1)).ravel()
+        target = torch.tensor(degree / max(degree.max(), 1), dtype=torch.float)
+        opt = torch.optim.Adam(model.parameters(), lr=0.01)
+        for _ in range(epochs):
+            opt.zero_grad()
+            loss = nn.MSELoss()(model(x, edge_index), target)
+            loss.backward(); opt.step()
+        self.trained[level] = time.time()
+        self.seen[level] = self.changes
+        self.save()
+
+    def retrain(self, adjs):
+        """Scheduled refresh: warm-start every level whose refit is due.
+        `adjs` is the level store; level k is scored on Kᵏ⁻¹."""
+        for level in list(self.models):
+            if level - 1 in adjs and self.due(level):
+                self.fit(adjs[level - 1], level, FINETUNE_EPOCHS)
+
+    def save(self):
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        torch.save({"models": {k: m.state_dict() for k, m in self.models.items()},
+                    "trained": self.trained}, tmp)
+        os.replace(tmp, self.path)
+
+    def load(self):
+        if self.path is None or not self.path.exists():
+            return
+        ckpt = torch.load(self.path, weights_only=True)
+        for level, state in ckpt["models"].items():
+            model = EdgeScoreGNN(N_FEATURES)
+            model.load_state_dict(state)
+            self.models[level] = model
+        self.trained.update(ckpt.get("trained", {}))
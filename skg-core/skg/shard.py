@@ -0,0 +1,268 @@
+# cognition/skg/shard.py  –  subject-hash sharded SKG: one SKGCore per worker process
+import multiprocessing as mp
+import os, pathlib, threading, zlib
+from collections import defaultdict
+
+from .ingest import IngestQueue
+
+GHOST_PRED   = "~ghost"     # boundary edges copied in from the shard that owns them
+START_METHOD = os.environ.get("SKG_SHARD_START", "spawn")   # no fork of a threaded parent
+
+def shard_of(label, count):
+    """Owning shard of a subject – crc32, so stable across processes and restarts."""
+    return zlib.crc32(str(label).encode()) % count
+
+# ----------  worker side ----------
+class _Shard:
+    """Request handlers around the SKGCore one worker process owns."""
+
+    def __init__(self, index, count, db_path):
+        from .core import SKGCore
+        self.index, self.count = index, count
+        self.core = SKGCore(db_path)
+
+    def owns(self, label):
+        return shard_of(label, self.count) == self.index
+
+    def add(self, triples):
+        self.core.add_triples(triples)
+        return self.core.version
+
+    def remove(self, triples):
+        self.core.remove_triples(triples)
+        return self.core.version
+
+    def query(self, pat, k, level):
+        """Rows this shard is authoritative for: owned subjects, no ghost copies."""
+        if (list(pat) + [None] * 3)[1] == GHOST_PRED:
+            return []
+        want = k
+        while True:
+            rows = self.core.query(pat, want, level)
+            keep = [(u, v, d) for u, v, d in rows
+                    if self.owns(u) and d.get("predicate") != GHOST_PRED]
+            if len(keep) >= k or len(rows) < want:
+                return keep[:k]
+            want *= 4
+
+    def out_edges(self, nodes):
+        """{node: [objects]} over real (non-ghost) K⁰ edges of owned nodes."""
+        store = self.core.store
+        return {x: sorted({o for _, p, o, _ in store.match(x, None, None) if p != GHOST_PRED})
+                for x in nodes}
+
+    def ghosts(self, edges):
+        """Replace the ghost out-edges of each boundary node with `edges[node]`."""
+        store, add, drop = self.core.store, [], []
+        for x, objs in edges.items():
+            have = {o for _, _, o, _ in store.match(x, GHOST_PRED, None)}
+            want = set(objs)
+            add += [(x, GHOST_PRED, o) for o in sorted(want - have)]
+            drop += [(x, GHOST_PRED, o) for o in sorted(have - want)]
+        if drop:
+            self.core.remove_triples(drop)
+        if add:
+            self.core.add_triples(add)
+        return len(add), len(drop)
+
+    def ghost_subjects(self):
+        """Boundary nodes this shard holds ghost out-edges of."""
+        return sorted({s for s, _, _, _ in self.core.store.match(None, GHOST_PRED, None)})
+
+    def stats(self):
+        core = self.core
+        ghosts = core.store.estimate(p=GHOST_PRED)
+        state = core.state()
+        return {
+            "shard": self.index,
+            "triples": len(core.store) - ghosts,
+            "ghost_edges": ghosts,
+            "nodes": len(core.nodes),
+            "depth": core.depth,
+            "version": core.version,
+            "levels": {k: state.shape(k) for k in state.levels},
+            "invented_predicates": list(core.invented_predicates),
+        }
+
+def _serve(conn, index, count, db_path):
+    shard = _Shard(index, count, db_path)
+    while True:
+        op, args = conn.recv()
+        if op == "close":
+            shard.core.close()
+            conn.send(("ok", None))
+            return
+        try:
+            conn.send(("ok", getattr(shard, op)(*args)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+# ----------  router side ----------
+class ShardError(RuntimeError):
+    pass
+
+class _LevelStats:
+    """Aggregated level sizes with the nx methods the API's stats code calls."""
+    def __init__(self, nodes=0, edges=0):
+        self.nodes, self.edges = nodes, edges
+    def number_of_nodes(self):
+        return self.nodes
+    def number_of_edges(self):
+        return self.edges
+
+class ShardRouter:
+    """Front end for `count` shard processes.  Writes are partitioned by subject
+    hash and fanned out; pattern queries go to the subject's owner when the
+    subject is bound and are scatter-gathered otherwise.  After every write the
+    out-edges of boundary nodes (objects owned by another shard) are copied to
+    the shards that reference them as ghost edges, so each shard's two-hop
+    expansion sees across the partition."""
+
+    def __init__(self, count, db_path=None):
+        from .core import DB_FILE
+        base = pathlib.Path(db_path or DB_FILE)
+        self.count = count
+        ctx = mp.get_context(START_METHOD)
+        self._conns, self._procs, self._locks = [], [], []
+        for i in range(count):
+            parent, child = ctx.Pipe()
+            path = base.with_name(f"{base.stem}.shard{i}{base.suffix}")
+            proc = ctx.Process(target=_serve, args=(child, i, count, str(path)),
+                               name=f"skg-shard-{i}", daemon=True)
+            proc.start()
+            self._conns.append(parent); self._procs.append(proc)
+            self._locks.append(threading.Lock())
+        self._write_lock = threading.Lock()
+        self.needs   = defaultdict(set)    # boundary node → shards holding its ghost copy
+        self.version = 0
+        self.ingest  = IngestQueue(self)
+        # ghost edges persist in the shard DBs – so does who needs which node
+        for i, nodes in self._call_all("ghost_subjects").items():
+            for x in nodes:
+                self.needs[x].add(i)
+
+    # ---- transport ----
+    def _call_many(self, requests):
+        """{shard: (op, args)} → {shard: result}; all sent before any is awaited."""
+        for i, req in requests.items():
+            self._locks[i].acquire()
+            self._conns[i].send(req)
+        out, error = {}, None
+        for i in requests:
+            try:
+                status, value = self._conns[i].recv()
+            finally:
+                self._locks[i].release()
+            if status != "ok":
+                error = error or ShardError(f"shard {i}: {value}")
+            out[i] = value
+        if error:
+            raise error
+        return out
+
+    def _call_all(self, op, *args):
+        return self._call_many({i: (op, args) for i in range(self.count)})
+
+    # ---- writes ----
+    def add_triples(self, triples):
+        with self._write_lock:
+            parts = defaultdict(list)
+            for s, p, o in triples:
+                parts[shard_of(s, self.count)].append((s, p, o))
+            self._call_many({i: ("add", (rows,)) for i, rows in parts.items()})
+            touched = set()
+            for s, _, o in triples:
+                owner = shard_of(s, self.count)
+                if shard_of(o, self.count) != owner and owner not in self.needs[o]:
+                    self.needs[o].add(owner)
+                    touched.add(o)
+                if s in self.needs:
+                    touched.add(s)
+            self._exchange(touched)
+            self.version += 1
+            return self.version
+
+    def remove_triples(self, triples):
+        with self._write_lock:
+            parts = defaultdict(list)
+            for s, p, o in triples:
+                parts[shard_of(s, self.count)].append((s, p, o))
+            self._call_many({i: ("remove", (rows,)) for i, rows in parts.items()})
+            self._exchange({s for s, _, _ in triples if s in self.needs})
+            self.version += 1
+            return self.version
+
+    def _exchange(self, nodes):
+        """Push the current out-edges of boundary `nodes` to every shard that
+        references them."""
+        if not nodes:
+            return
+        by_owner = defaultdict(list)
+        for x in nodes:
+            by_owner[shard_of(x, self.count)].append(x)
+        edges = {}
+        for found in self._call_many({i: ("out_edges", (xs,)) for i, xs in by_owner.items()}).values():
+            edges.update(found)
+        pushes = defaultdict(dict)
+        for x in nodes:
+            for i in self.needs.get(x, ()):
+                pushes[i][x] = edges.get(x, [])
+        if pushes:
+            self._call_many({i: ("ghosts", (batch,)) for i, batch in pushes.items()})
+
+    def submit(self, triples):
+        return self.ingest.submit(triples)
+
+    def wait_for(self, ticket=None, timeout=None):
+        return self.ingest.wait(ticket, timeout)
+
+    # ---- reads ----
+    def query(self, pat, k=10, level=0, state=None):
+        s = (list(pat) + [None] * 3)[0]
+        if s is not None:
+            return self._call_many({shard_of(s, self.count): ("query", (pat, k, level))}).popitem()[1]
+        rows = []
+        for i, part in sorted(self._call_all("query", pat, k, level).items()):
+            rows.extend(part)
+        return rows[:k]
+
+    def stats(self):
+        return [v for _, v in sorted(self._call_all("stats").items())]
+
+    def status(self):
+        return {"shards": self.count,
+                "alive": [p.is_alive() for p in self._procs],
+                "boundary_nodes": len(self.needs),
+                "version": self.version,
+                "ingest": self.ingest.status(),
+                "stats": self.stats()}
+
+    @property
+    def levels(self):
+        merged = {}
+        for st in self.stats():
+            for k, (nodes, edges) in st["levels"].items():
+                lvl = merged.setdefault(int(k), _LevelStats())
+                lvl.nodes += nodes
+                lvl.edges += edges
+        return merged
+
+    @property
+    def total_edges(self):
+        return sum(st["triples"] for st in self.stats())
+
+    @property
+    def depth(self):
+        return max((st["depth"] for st in self.stats()), default=0)
+
+    @property
+    def invented_predicates(self):
+        return sorted({p for st in self.stats() for p in st["invented_predicates"]})
+
+    def close(self):
+        self.ingest.close()
+        try:
+            self._call_all("close")
+        finally:
+            for proc in self._procs:
+                proc.join(timeout=10)
@@ -0,0 +1,117 @@
+# cognition/skg/snapshot.py  –  versioned, memory-mappable binary snapshots of every level
+import json, os, pathlib, shutil, zlib
+from datetime import datetime
+import numpy as np
+import scipy.sparse as sp
+
+FORMAT = 1
+KEEP   = 2                      # generations kept on disk
+
+# layout:  <root>/LATEST                    → name of the newest generation
+#          <root>/<gen>/meta.json           depth, bootstrapped, invented predicates, …
+#          <root>/<gen>/nodes_blob.npy      utf-8 labels, concatenated
+#          <root>/<gen>/nodes_offsets.npy   int64, len(nodes) + 1
+#          <root>/<gen>/level_<k>_{indptr,indices,data}.npy
+#          <root>/<gen>/top_<k>.npy         cached proposal targets (incremental mode)
+# plain .npy (not .npz) so every array opens with np.load(mmap_mode="r").
+
+def fingerprint(rows):
+    """Order-independent checksum of (s, p, o) rows – ties a snapshot to the DB."""
+    fp = 0
+    for s, p, o in rows:
+        fp ^= zlib.crc32(f"{s}\t{p}\t{o}".encode())
+    return fp
+
+def asserted(core):
+    """(count, fingerprint) of the core's asserted triples – rule-derived ones
+    are re-derived on load, so a snapshot is tied to the asserted ones only."""
+    derived = getattr(getattr(core, "rules", None), "derived", ())
+    rows = [(s, p, o) for s, p, o, _ in core.store.match() if (s, p, o) not in derived]
+    return len(rows), fingerprint(rows)
+
+def latest(root):
+    """Path of the newest complete generation under `root`, or None."""
+    root = pathlib.Path(root)
+    try:
+        name = (root / "LATEST").read_text().strip()
+    except FileNotFoundError:
+        return None
+    path = root / name
+    return path if (path / "meta.json").exists() else None
+
+def read_meta(path):
+    return json.loads((pathlib.Path(path) / "meta.json").read_text())
+
+def save(core, root):
+    """Write a new generation for `core` and point LATEST at it."""
+    root = pathlib.Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    prev = latest(root)
+    gen  = read_meta(prev)["generation"] + 1 if prev else 1
+    name = f"{gen:08d}"
+    tmp  = root / (name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir()
+
+    encoded = [str(label).encode() for label in core.nodes]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    np.save(tmp / "nodes_blob.npy", np.frombuffer(b"".join(encoded), dtype=np.uint8))
+    np.save(tmp / "nodes_offsets.npy", offsets)
+
+    for k in range(core.depth):
+        adj = sp.csr_matrix(core.adjs[k])
+        for part in ("indptr", "indices", "data"):
+            np.save(tmp / f"level_{k}_{part}.npy", getattr(adj, part))
+        if k in core._top:
+            np.save(tmp / f"top_{k}.npy", core._top[k])
+
+    triples, fp = asserted(core)
+    meta = {
+        "format": FORMAT,
+        "generation": gen,
+        "created": datetime.now().isoformat(),
+        "depth": core.depth,
+        "bootstrapped": core.bootstrapped,
+        "total_edges": core.total_edges,
+        "invented_predicates": list(getattr(core, "invented_predicates", [])),
+        "nodes": len(core.nodes),
+        "triples": triples,
+        "fingerprint": fp,
+        "shape": [core.adjs[0].shape[0] if 0 in core.adjs else 0] * 2,
+        "prune": core.prune_strategy,
+        "propose": core.propose_strategy,
+    }
+    (tmp / "meta.json").write_text(json.dumps(meta, indent=2))
+    os.replace(tmp, root / name)
+    pointer = root / "LATEST.tmp"
+    pointer.write_text(name)
+    os.replace(pointer, root / "LATEST")
+
+    # readers that still map an older generation keep their pages after unlink
+    gens = sorted(p for p in root.iterdir() if p.is_dir() and p.name.isdigit())
+    for old in gens[:-KEEP]:
+        shutil.rmtree(old, ignore_errors=True)
+    return root / name
+
+def load_labels(path):
+    path = pathlib.Path(path)
+    blob = np.load(path / "nodes_blob.npy", mmap_mode="r")
+    offsets = np.load(path / "nodes_offsets.npy")
+    raw = blob.tobytes() if blob.size else b""
+    return [raw[a:b].decode() for a, b in zip(offsets[:-1], offsets[1:])]
+
+def load_levels(path, depth, n):
+    """{k: csr_matrix} over read-only mmapped arrays (no copy of the data)."""
+    path = pathlib.Path(path)
+    adjs = {}
+    for k in range(depth):
+        parts = [np.load(path / f"level_{k}_{part}.npy", mmap_mode="r")
+                 for part in ("data", "indices", "indptr")]
+        adjs[k] = sp.csr_matrix(tuple(parts), shape=(n, n), copy=False)
+    return adjs
+
+def load_top(path, depth):
+    path = pathlib.Path(path)
+    return {k: np.load(path / f"top_{k}.npy") for k in range(1, depth)
+            if (path / f"top_{k}.npy").exists()}
@@ -0,0 +1,106 @@
+# cognition/skg/state.py  –  immutable, versioned view of the levels for concurrent readers
+import numpy as np
+import scipy.sparse as sp
+
+class GraphState:
+    """What a reader pins: the level matrices as of one published version.
+
+    Writers never modify a published CSR matrix in place – every update builds
+    new matrices and publishes a new GraphState – so a pinned state stays
+    consistent however long the read takes and however many expansions run
+    meanwhile.  Node ids ≥ `n` did not exist at this version."""
+
+    __slots__ = ("version", "depth", "adjs", "labels", "n", "_csc", "_graphs", "_oriented")
+
+    def __init__(self, version, depth, adjs, labels):
+        self.version = version
+        self.depth   = depth
+        self.adjs    = dict(adjs)
+        self.labels  = labels       # NodeDict.labels() array – replaced, never mutated
+        self.n       = len(labels)
+        self._csc    = {}
+        self._graphs = {}
+        self._oriented = {}
+
+    @property
+    def levels(self):
+        return sorted(self.adjs)
+
+    def shape(self, level):
+        adj = self.adjs[level]
+        return adj.shape[0], adj.nnz
+
+    def graph(self, level):
+        """nx view of one level, built on first use and cached with the state."""
+        if level not in self._graphs:
+            import networkx as nx
+            adj = self.adjs[level]
+            labels = self.labels[:adj.shape[0]]
+            G = nx.DiGraph()
+            G.add_nodes_from(labels)
+            coo = adj.tocoo()
+            G.add_weighted_edges_from(zip(labels[coo.row], labels[coo.col], coo.data.tolist()))
+            self._graphs[level] = nx.freeze(G)
+        return self._graphs[level]
+
+    def adjacency(self, level, direction="out"):
+        """Level matrix with rows along `direction` ("out" | "in" | "both");
+        the reversed and symmetrized forms are built once per version."""
+        from .traverse import oriented
+        adj = self.adjs[level]
+        if direction == "out":
+            return adj
+        key = (level, direction)
+        if key not in self._oriented:
+            csc = self._csc.get(level)
+            if csc is None:
+                csc = self._csc[level] = adj.tocsc()
+            self._oriented[key] = oriented(adj, direction, csc)
+        return self._oriented[key]
+
+    def query(self, nodes, pat, k=10, level=1):
+        """Level ≥ 1 pattern match straight from the pinned CSR matrices;
+        same (u, v, {"weight": w}) rows as the nx views.  Derived levels carry
+        no predicates, so a bound predicate never matches."""
+        adj = self.adjs.get(level)
+        if adj is None:
+            return []
+        s, p, o = (list(pat) + [None] * 3)[:3]
+        if p is not None:
+            return []
+        si, oi = self._id(nodes, s, adj), self._id(nodes, o, adj)
+        if si == -1 or oi == -1:
+            return []
+        if si is not None:
+            lo, hi = adj.indptr[si], adj.indptr[si + 1]
+            cols, data = adj.indices[lo:hi], adj.data[lo:hi]
+            if oi is not None:
+                keep = cols == oi
+                cols, data = cols[keep], data[keep]
+            rows = np.full(len(cols), si)
+        elif oi is not None:
+            csc = self._csc.get(level)
+            if csc is None:
+                csc = self._csc[level] = adj.tocsc()
+            lo, hi = csc.indptr[oi], csc.indptr[oi + 1]
+            rows, data = csc.indices[lo:hi], csc.data[lo:hi]
+            cols = np.full(len(rows), oi)
+        else:
+            coo = _head(adj, k)
+            rows, cols, data = coo.row, coo.col, coo.data
+        rows, cols, data = rows[:k], cols[:k], data[:k]
+        return [(self.labels[i], self.labels[j], {"weight": float(w)})
+                for i, j, w in zip(rows.tolist(), cols.tolist(), data.tolist())]
+
+    @staticmethod
+    def _id(nodes, label, adj):
+        """None for a wildcard, -1 for a label this version has never seen."""
+        if label is None:
+            return None
+        i = nodes.id(label, -1)
+        return i if i < adj.shape[0] else -1
+
+def _head(adj, k):
+    """First k stored entries (row-major) as COO, without expanding the rest."""
+    last = int(np.searchsorted(adj.indptr, k, side="left"))
+    return sp.csr_matrix(adj[:max(last, 1)]).tocoo()
@@ -0,0 +1,179 @@
+# cognition/skg/store.py  –  base triple store with SPO / POS / OSP permutation indexes
+from .nodes import NodeDict
+
+def _bump(counts, key, delta):
+    n = counts.get(key, 0) + delta
+    if n:
+        counts[key] = n
+    else:
+        counts.pop(key, None)
+
+class TripleStore:
+    """K⁰ triples keyed by interned ids.  Every (s, p, o) lives in three nested
+    hash indexes so any pattern with a bound term is a direct lookup:
+
+        spo[s][p][o] = weight      subject-first
+        pos[p][o][s]               predicate-first
+        osp[o][s][p]               object-first  (also the (s, o) → predicates index)
+
+    Inner dicts double as insertion-ordered sets.  Per-term triple counts back
+    `estimate()` so callers can pick the most selective access path.
+
+    While `changes` is a list, every add (re-weights included) and every
+    successful remove appends its label triple to it – the owner drains it
+    to learn which index keys a write touched."""
+
+    def __init__(self, nodes=None):
+        self.nodes = nodes if nodes is not None else NodeDict()
+        self.preds = NodeDict()
+        self.spo, self.pos, self.osp = {}, {}, {}
+        self._ns, self._np, self._no = {}, {}, {}
+        self._size = 0
+        self.changes = None
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, triple):
+        s, p, o = triple
+        ids = self._ids(s, p, o)
+        return ids is not None and ids[2] in self.spo.get(ids[0], {}).get(ids[1], {})
+
+    # ---- writes ----
+    def add(self, s, p, o, weight=1.0):
+        """Insert or re-weight a triple.  Returns True if it was new."""
+        si, pi, oi = self.nodes.intern(s), self.preds.intern(p), self.nodes.intern(o)
+        objs = self.spo.setdefault(si, {}).setdefault(pi, {})
+        new = oi not in objs
+        objs[oi] = weight
+        if new:
+            self.pos.setdefault(pi, {}).setdefault(oi, {})[si] = None
+            self.osp.setdefault(oi, {}).setdefault(si, {})[pi] = None
+            _bump(self._ns, si, 1); _bump(self._np, pi, 1); _bump(self._no, oi, 1)
+            self._size += 1
+        if self.changes is not None:
+            self.changes.append((s, p, o))
+        return new
+
+    def remove(self, s, p, o):
+        """Delete a triple.  Returns True if it was present."""
+        ids = self._ids(s, p, o)
+        if ids is None:
+            return False
+        si, pi, oi = ids
+        objs = self.spo.get(si, {}).get(pi)
+        if not objs or oi not in objs:
+            return False
+        for index, a, b, c in ((self.spo, si, pi, oi), (self.pos, pi, oi, si), (self.osp, oi, si, pi)):
+            inner = index[a][b]
+            del inner[c]
+            if not inner:
+                del index[a][b]
+                if not index[a]:
+                    del index[a]
+        _bump(self._ns, si, -1); _bump(self._np, pi, -1); _bump(self._no, oi, -1)
+        self._size -= 1
+        if self.changes is not None:
+            self.changes.append((s, p, o))
+        return True
+
+    # ---- reads ----
+    def weight(self, s, p, o, default=None):
+        ids = self._ids(s, p, o)
+        if ids is None:
+            return default
+        return self.spo.get(ids[0], {}).get(ids[1], {}).get(ids[2], default)
+
+    def predicates(self, s, o):
+        """Predicates linking s → o, straight from the OSP index."""
+        si, oi = self.nodes.id(s), self.nodes.id(o)
+        if si is None or oi is None:
+            return []
+        return [self.preds.label(pi) for pi in self.osp.get(oi, {}).get(si, ())]
+
+    def estimate(self, s=None, p=None, o=None):
+        """Upper bound on the number of triples matching a label pattern."""
+        ids = self._ids(s, p, o, partial=True)
+        if ids is None:
+            return 0
+        si, pi, oi = ids
+        bounds = [self._size]
+        if si is not None: bounds.append(self._ns.get(si, 0))
+        if pi is not None: bounds.append(self._np.get(pi, 0))
+        if oi is not None: bounds.append(self._no.get(oi, 0))
+        if si is not None and pi is not None:
+            bounds.append(len(self.spo.get(si, {}).get(pi, ())))
+        if pi is not None and oi is not None:
+            bounds.append(len(self.pos.get(pi, {}).get(oi, ())))
+        if oi is not None and si is not None:
+            bounds.append(len(self.osp.get(oi, {}).get(si, ())))
+        return min(bounds)
+
+    def distinct(self, position):
+        """Number of distinct terms in position "s", "p" or "o"."""
+        return len({"s": self._ns, "p": self._np, "o": self._no}[position])
+
+    def match_ids(self, s=None, p=None, o=None):
+        """Yield (s, p, o, weight) id tuples for an id pattern (None = wildcard),
+        reading from whichever index has the bound terms as its prefix."""
+        spo = self.spo
+        if s is not None:
+            by_p = spo.get(s, {})
+            if p is not None:
+                objs = by_p.get(p, {})
+                if o is not None:
+                    if o in objs:
+                        yield s, p, o, objs[o]
+                    return
+                for oi, w in objs.items():
+                    yield s, p, oi, w
+            elif o is not None:
+                for pi in self.osp.get(o, {}).get(s, ()):
+                    yield s, pi, o, by_p[pi][o]
+            else:
+                for pi, objs in by_p.items():
+                    for oi, w in objs.items():
+                        yield s, pi, oi, w
+        elif p is not None:
+            by_o = self.pos.get(p, {})
+            if o is not None:
+                for si in by_o.get(o, ()):
+                    yield si, p, o, spo[si][p][o]
+            else:
+                for oi, subs in by_o.items():
+                    for si in subs:
+                        yield si, p, oi, spo[si][p][oi]
+        elif o is not None:
+            for si, preds in self.osp.get(o, {}).items():
+                for pi in preds:
+                    yield si, pi, o, spo[si][pi][o]
+        else:
+            for si, by_p in spo.items():
+                for pi, objs in by_p.items():
+                    for oi, w in objs.items():
+                        yield si, pi, oi, w
+
+    def match(self, s=None, p=None, o=None):
+        """Label-level `match_ids`: yields (s, p, o, weight) with labels."""
+        ids = self._ids(s, p, o, partial=True)
+        if ids is None:
+            return
+        node, pred = self.nodes.label, self.preds.label
+        for si, pi, oi, w in self.match_ids(*ids):
+            yield node(si), pred(pi), node(oi), w
+
+    def _ids(self, s, p, o, partial=False):
+        """Resolve labels to ids; None if a bound label is unknown.  With
+        `partial`, unbound (None) terms stay None instead of failing."""
+        out = []
+        for label, table in ((s, self.nodes), (p, self.preds), (o, self.nodes)):
+            if label is None:
+                if not partial:
+                    return None
+                out.append(None)
+                continue
+            i = table.id(label)
+            if i is None:
+                return None
+            out.append(i)
+        return tuple(out)
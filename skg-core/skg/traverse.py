@@ -0,0 +1,147 @@
+# cognition/skg/traverse.py  –  vectorized frontier expansion over a level's CSR matrix
+import time
+from collections import namedtuple
+import numpy as np
+import scipy.sparse as sp
+
+MAX_HOPS     = 6            # hard cap on hops per request
+STREAM_CHUNK = 1000         # nodes per streamed batch
+
+Hop = namedtuple("Hop", "depth nodes via weights")   # one batch of newly reached nodes
+
+def oriented(adj, direction, csc=None):
+    """`adj` as a CSR matrix whose rows are the edges to follow: "out" as
+    stored, "in" reversed (from its CSC form, no copy), "both" symmetrized."""
+    if direction == "out":
+        return adj
+    if csc is None:
+        csc = adj.tocsc()
+    rev = sp.csr_matrix((csc.data, csc.indices, csc.indptr), shape=adj.shape[::-1], copy=False)
+    if direction == "in":
+        return rev
+    if direction == "both":
+        return (adj + rev).tocsr()
+    raise ValueError(f"direction must be 'out', 'in' or 'both', not {direction!r}")
+
+def gather(adj, frontier, fanout=None):
+    """(src, dst, weight) of every stored edge leaving `frontier`, at most the
+    `fanout` heaviest per row.  One gather over the CSR arrays, no Python loop
+    per node.  Returns the arrays and whether some row was clipped."""
+    starts = adj.indptr[frontier]
+    counts = adj.indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    ends = np.cumsum(counts)
+    offs = np.arange(total) + np.repeat(starts - (ends - counts), counts)
+    src, dst, w = np.repeat(frontier, counts), adj.indices[offs], adj.data[offs]
+    if fanout is None or not total or counts.max() <= fanout:
+        return src, dst, w, False
+    seg = np.repeat(np.arange(len(frontier)), counts)
+    order = np.lexsort((-w, seg))                  # heaviest first within each row
+    rank = np.arange(total) - np.repeat(ends - counts, counts)
+    keep = order[rank < fanout]
+    return src[keep], dst[keep], w[keep], True
+
+def _seeds(seeds, n):
+    seeds = np.unique(np.atleast_1d(np.asarray(seeds, dtype=np.int64)))
+    if seeds.size and (seeds.min() < 0 or seeds.max() >= n):
+        raise IndexError(f"seed id out of range for a {n}-node level")
+    return seeds
+
+class Expansion:
+    """Breadth-first expansion from `seeds`, one vectorized gather per hop.
+    Iterating yields `Hop`s of first-reached nodes (with the node each was
+    reached from and the edge weight), in batches of at most `chunk`.
+
+    Limits: `hops` levels, `fanout` heaviest edges per expanded node,
+    `max_nodes` reached nodes in total and `timeout` seconds (checked between
+    hops).  After iteration `truncated` names the limit that cut the
+    expansion short ("max_nodes" or "timeout", None if it ran to the end)
+    and `clipped` tells whether `fanout` dropped any edge."""
+
+    def __init__(self, adj, seeds, hops=1, fanout=None, max_nodes=None, timeout=None,
+                 labels=None, chunk=STREAM_CHUNK):
+        if not 0 <= hops <= MAX_HOPS:
+            raise ValueError(f"hops must be between 0 and {MAX_HOPS}")
+        self.adj, self.seeds = adj, _seeds(seeds, adj.shape[0])
+        self.hops, self.fanout, self.max_nodes = hops, fanout, max_nodes
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.labels, self.chunk = labels, chunk
+        self.truncated, self.clipped, self.reached = None, False, 0
+
+    def _out(self, depth, nodes, via, weights):
+        if self.labels is not None:
+            nodes, via = self.labels[nodes], self.labels[via]
+        for i in range(0, len(nodes), self.chunk):
+            yield Hop(depth, nodes[i:i + self.chunk], via[i:i + self.chunk],
+                      weights[i:i + self.chunk])
+
+    def __iter__(self):
+        seen = np.zeros(self.adj.shape[0], dtype=bool)
+        seen[self.seeds] = True
+        frontier = self.seeds
+        for depth in range(1, self.hops + 1):
+            if not frontier.size:
+                return
+            if self.deadline is not None and time.monotonic() > self.deadline:
+                self.truncated = "timeout"
+                return
+            src, dst, w, clipped = gather(self.adj, frontier, self.fanout)
+            self.clipped |= clipped
+            new = ~seen[dst]
+            src, dst, w = src[new], dst[new], w[new]
+            dst, first = np.unique(dst, return_index=True)   # first edge that reached each
+            src, w = src[first], w[first]
+            if self.max_nodes is not None and self.reached + dst.size > self.max_nodes:
+                cut = max(self.max_nodes - self.reached, 0)
+                src, dst, w = src[:cut], dst[:cut], w[:cut]
+                self.truncated = "max_nodes"
+            seen[dst] = True
+            self.reached += dst.size
+            yield from self._out(depth, dst, src, w)
+            if self.truncated:
+                return
+            frontier = dst
+
+def paths(adj, source, target, max_hops=MAX_HOPS, max_paths=10, fanout=None, timeout=None):
+    """Shortest paths source → target as lists of node ids, generated lazily
+    (at most `max_paths`).  A breadth-first sweep keeps, per hop, every edge
+    into a newly reached node; once `target` is reached the kept edges form
+    a DAG that is walked backwards.  Yields nothing if `target` is further
+    than `max_hops` (or the `timeout` runs out first)."""
+    n = adj.shape[0]
+    source, target = int(_seeds(source, n)[0]), int(_seeds(target, n)[0])
+    if source == target:
+        yield [source]
+        return
+    deadline = None if timeout is None else time.monotonic() + timeout
+    seen = np.zeros(n, dtype=bool)
+    seen[source] = True
+    frontier, layers = np.array([source]), []
+    for _ in range(min(max_hops, MAX_HOPS)):
+        if not frontier.size or (deadline is not None and time.monotonic() > deadline):
+            return
+        src, dst, _, _ = gather(adj, frontier, fanout)
+        new = ~seen[dst]
+        src, dst = src[new], dst[new]
+        order = np.argsort(dst, kind="stable")
+        layers.append((dst[order], src[order]))    # predecessors, grouped by node
+        frontier = np.unique(dst)
+        seen[frontier] = True
+        if seen[target]:
+            break
+    else:
+        return
+    yield from _walk_back(layers, target, max_paths)
+
+def _walk_back(layers, target, max_paths):
+    emitted, stack = 0, [(len(layers) - 1, [target])]
+    while stack and emitted < max_paths:
+        depth, suffix = stack.pop()
+        if depth < 0:
+            yield suffix
+            emitted += 1
+            continue
+        dst, src = layers[depth]
+        lo, hi = np.searchsorted(dst, suffix[0]), np.searchsorted(dst, suffix[0], side="right")
+        for prev in src[lo:hi][::-1].tolist():
+            stack.append((depth - 1, [prev] + suffix))
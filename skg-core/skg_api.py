@@ -4,11 +4,14 @@ Provides direct access to SKG core functionality via HTTP endpoints
 """
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Union, Any, Dict
 import asyncio
+import json
+import threading
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 # Import SKG core components
@@ -23,6 +26,8 @@ try:
     from skg.core import SKGCore
     from skg.invent_predicate import maybe_invent_predicate
     from skg.curiosity import start_curiosity
+    from skg.shard import ShardRouter
+    from skg.ingest import IngestError
 except ImportError as e:
     print(f"Warning: SKG imports failed: {e}")
     # Fallback to create minimal interface
@@ -38,6 +43,24 @@ except ImportError as e:
         
         def expand_recursive(self):
             pass
+        
+        def query(self, pat, k=10, level=0):
+            return []
+        
+        def begin_bulk(self):
+            pass
+
+        version = 0
+
+        def submit(self, triples):
+            self.add_triples(triples)
+            return 0
+
+        def wait_for(self, ticket=None, timeout=None):
+            return self.version
+        
+        def end_bulk(self):
+            return 0
     
     def maybe_invent_predicate(skg, thresh=0.3):
         return []
@@ -45,15 +68,41 @@ except ImportError as e:
     def start_curiosity(skg):
         pass
 
+    ShardRouter = None
+
+    class IngestError(RuntimeError):
+        pass
+
+# Global SKG instance – SKG_SHARDS > 1 runs one SKGCore process per shard.
+# Built at startup, never on import: shard workers are spawned processes that
+# re-import this module as __mp_main__ when it is run as a script.
+SKG_SHARDS = int(os.getenv("SKG_SHARDS", "1"))
+skg_core = None
+_core_lock = threading.Lock()
+
+def get_core():
+    """The service's SKG, built on first call."""
+    global skg_core
+    with _core_lock:
+        if skg_core is None:
+            skg_core = ShardRouter(SKG_SHARDS) if SKG_SHARDS > 1 and ShardRouter else SKGCore()
+    return skg_core
+
+@asynccontextmanager
+async def lifespan(app):
+    await asyncio.to_thread(get_core)
+    yield
+    close = getattr(skg_core, 'close', None)
+    if close is not None:
+        await asyncio.to_thread(close)
+
 app = FastAPI(
     title="SKG API Service",
     description="Super-Knowledge Graph API for AGI-level knowledge management",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# Global SKG instance
-skg_core = SKGCore()
-
 # Request/Response Models
 class Triple(BaseModel):
     s: str  # subject
@@ -68,6 +117,11 @@ class QueryPattern(BaseModel):
     k: Optional[int] = 10
     level: Optional[int] = None
 
+class BGPQuery(BaseModel):
+    patterns: List[List[Optional[str]]]   # [["?x", "worksAt", "?y"], ["?y", "locatedIn", "?z"]]
+    limit: Optional[int] = 100
+    explain: Optional[bool] = False
+
 class ExpandRequest(BaseModel):
     force_bootstrap: Optional[bool] = False
     target_level: Optional[int] = 2
@@ -82,6 +136,8 @@ class TripleResponse(BaseModel):
     triple_id: Optional[str] = None
     level_assigned: int
     bootstrap_check: Dict[str, Any]
+    ticket: Optional[int] = None      # pass to /ingest/wait for read-your-writes
+    version: Optional[int] = None     # graph version the write is visible in (if waited)
 
 class QueryResponse(BaseModel):
     results: List[Dict[str, Any]]
@@ -94,6 +150,10 @@ class StatsResponse(BaseModel):
     bootstrap_status: Dict[str, Any]
     curiosity_goals: List[str]
 
+def _job_scheduled(name):
+    scheduler = getattr(skg_core, 'scheduler', None)
+    return scheduler is not None and name in scheduler
+
 @app.get("/health")
 async def health_check():
     """System health check and status"""
@@ -102,7 +162,7 @@ async def health_check():
         "timestamp": datetime.now().isoformat(),
         "services": {
             "skg_core": "operational",
-            "curiosity_daemon": "active" if hasattr(skg_core, 'curiosity_daemon') else "inactive",
+            "curiosity_daemon": "active" if _job_scheduled("curiosity") else "inactive",
             "contradiction_detector": "monitoring"
         },
         "metrics": {
@@ -112,75 +172,127 @@ async def health_check():
         }
     }
 
+def _bootstrap_check(**extra):
+    total_facts = getattr(skg_core, 'total_edges', 0)
+    bootstrap_threshold = 50  # Hardcoded threshold from core
+    check = {
+        "total_facts": total_facts,
+        "cascade_triggered": total_facts >= bootstrap_threshold and getattr(skg_core, 'bootstrapped', False),
+        "threshold": bootstrap_threshold
+    }
+    check.update(extra)
+    return check
+
+async def _enqueue(triples, wait, timeout):
+    """Queue triples on the coalescing ingest worker; optionally wait until applied"""
+    ticket = skg_core.submit(triples)
+    version = None
+    if wait:
+        try:
+            version = await asyncio.to_thread(skg_core.wait_for, ticket, timeout)
+        except IngestError as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        if version is None:
+            raise HTTPException(status_code=504, detail=f"Ticket {ticket} not applied within {timeout}s")
+    return ticket, version
+
 @app.post("/add", response_model=TripleResponse)
-async def add_triple(triple: Triple):
-    """Add a single knowledge triple"""
+async def add_triple(triple: Triple, wait: bool = False, timeout: float = 30.0):
+    """Add a single knowledge triple (acknowledged once queued; wait=true for read-your-writes)"""
     try:
-        start_time = time.time()
-        
-        # Add triple to SKG
-        skg_core.add_triples([(triple.s, triple.p, triple.o)])
-        
-        # Check if bootstrap was triggered
-        total_facts = getattr(skg_core, 'total_edges', 0)
-        bootstrap_threshold = 50  # Hardcoded threshold from core
-        bootstrap_triggered = total_facts >= bootstrap_threshold and not getattr(skg_core, 'bootstrapped', False)
-        
-        if bootstrap_triggered:
-            try:
-                skg_core.expand_recursive()
-            except Exception as exp_error:
-                print(f"Expansion error: {exp_error}")
-        
+        ticket, version = await _enqueue([(triple.s, triple.p, triple.o)], wait, timeout)
         return TripleResponse(
             success=True,
             triple_id=f"{triple.s}-{triple.p}-{triple.o}",
             level_assigned=0,  # New triples start at K⁰
-            bootstrap_check={
-                "total_facts": total_facts,
-                "cascade_triggered": bootstrap_triggered,
-                "threshold": bootstrap_threshold
-            }
+            bootstrap_check=_bootstrap_check(),
+            ticket=ticket,
+            version=version
         )
-        
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.post("/add_batch", response_model=TripleResponse)
-async def add_batch_triples(batch: BatchTriples):
+async def add_batch_triples(batch: BatchTriples, wait: bool = False, timeout: float = 30.0):
     """Add multiple triples in a single operation"""
     try:
         # Convert list format to tuple format
         triples = [(t[0], t[1], t[2]) for t in batch.triples]
-        
-        # Add all triples
-        skg_core.add_triples(triples)
-        
-        # Check bootstrap status
-        total_facts = getattr(skg_core, 'total_edges', 0)
-        bootstrap_threshold = 50
-        bootstrap_triggered = total_facts >= bootstrap_threshold and not getattr(skg_core, 'bootstrapped', False)
-        
-        if bootstrap_triggered:
-            try:
-                skg_core.expand_recursive()
-            except Exception as exp_error:
-                print(f"Batch expansion error: {exp_error}")
-        
+        ticket, version = await _enqueue(triples, wait, timeout)
         return TripleResponse(
             success=True,
             triple_id=f"batch_{len(triples)}_triples",
             level_assigned=0,
-            bootstrap_check={
-                "total_facts": total_facts,
-                "cascade_triggered": bootstrap_triggered,
-                "triples_added": len(triples)
-            }
+            bootstrap_check=_bootstrap_check(triples_added=len(triples)),
+            ticket=ticket,
+            version=version
         )
-        
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@app.get("/ingest/wait")
+async def wait_for_ingest(ticket: Optional[int] = None, timeout: float = 30.0):
+    """Block until a write ticket (default: everything queued) is applied"""
+    try:
+        version = await asyncio.to_thread(skg_core.wait_for, ticket, timeout)
+    except IngestError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    if version is None:
+        raise HTTPException(status_code=504, detail=f"Ticket {ticket} not applied within {timeout}s")
+    return {"ticket": ticket, "version": version}
+
+@app.get("/ingest/status")
+async def ingest_status():
+    """Ingest queue depth, applied tickets and the current graph version"""
+    ingest = getattr(skg_core, 'ingest', None)
+    if ingest is None:
+        return {"version": getattr(skg_core, 'version', 0), "pending": 0}
+    return ingest.status()
+
+@app.post("/bulk/begin")
+async def begin_bulk_load():
+    """Open a bulk-load session: /bulk/add only appends until /bulk/commit"""
+    if not hasattr(skg_core, 'begin_bulk'):
+        raise HTTPException(status_code=501, detail="Bulk load needs a single SKGCore")
+    if getattr(skg_core, '_bulk', 0):
+        raise HTTPException(status_code=409, detail="Bulk load already in progress")
+    skg_core.begin_bulk()
+    return {"success": True, "bulk_active": True, "total_facts": getattr(skg_core, 'total_edges', 0)}
+
+@app.post("/bulk/add")
+async def bulk_add_triples(batch: BatchTriples):
+    """Append triples to the open bulk-load session (no repair or expansion)"""
+    if not getattr(skg_core, '_bulk', 0):
+        raise HTTPException(status_code=409, detail="No bulk load in progress - call /bulk/begin")
+    try:
+        await asyncio.to_thread(skg_core.add_triples, [(t[0], t[1], t[2]) for t in batch.triples])
+        return {"success": True, "triples_added": len(batch.triples),
+                "pending": getattr(skg_core, '_bulk_added', 0)}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/bulk/commit")
+async def commit_bulk_load():
+    """Close the bulk-load session: one repair, expansion and invention pass"""
+    if not getattr(skg_core, '_bulk', 0):
+        raise HTTPException(status_code=409, detail="No bulk load in progress - call /bulk/begin")
+    try:
+        start_time = time.time()
+        added = await asyncio.to_thread(skg_core.end_bulk)
+        return {
+            "success": True,
+            "triples_added": added,
+            "total_facts": getattr(skg_core, 'total_edges', 0),
+            "depth": getattr(skg_core, 'depth', 0),
+            "flush_time_ms": round((time.time() - start_time) * 1000, 2)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/query", response_model=QueryResponse)
 async def query_graph(pat: str = "[null,null,null]", k: int = 10, level: Optional[int] = None):
     """Query the knowledge graph with pattern matching"""
@@ -202,66 +314,28 @@ async def query_graph(pat: str = "[null,null,null]", k: int = 10, level: Optiona
         except Exception:
             pattern = [None, None, None]
         
-        # Query the graph (with safe fallback)
+        # Query the graph (with safe fallback) – one pinned version for every level
         results = []
+        state = skg_core.state() if hasattr(skg_core, 'state') else None
+        known = set(skg_core.levels) if state is None else set(state.levels) | ({0} if 0 in skg_core.levels else set())
+        levels = [level] if level is not None and level in known else sorted(known)
         
-        if level is not None and level in skg_core.levels:
-            # Query specific level
-            graph = skg_core.levels.get(level)
-            if graph and hasattr(graph, 'edges'):
-                count = 0
-                try:
-                    for u, v, data in graph.edges(data=True):
-                        if count >= k:
-                            break
-                            
-                        # Match pattern
-                        predicate = data.get('predicate', '') if isinstance(data, dict) else ''
-                        
-                        if (pattern[0] is None or str(u) == str(pattern[0])) and \
-                           (pattern[1] is None or str(predicate) == str(pattern[1])) and \
-                           (pattern[2] is None or str(v) == str(pattern[2])):
-                            
-                            results.append({
-                                "subject": str(u),
-                                "predicate": str(predicate),
-                                "object": str(v),
-                                "level": level,
-                                "confidence": data.get('confidence', 1.0) if isinstance(data, dict) else 1.0
-                            })
-                            count += 1
-                except Exception as query_error:
-                    print(f"Level {level} query error: {query_error}")
-        else:
-            # Query all levels
-            total_count = 0
-            
+        for level_num in levels:
+            if len(results) >= k:
+                break
             try:
-                for level_num, graph in skg_core.levels.items():
-                    if total_count >= k:
-                        break
-                    
-                    if graph and hasattr(graph, 'edges'):
-                        for u, v, data in graph.edges(data=True):
-                            if total_count >= k:
-                                break
-                                
-                            predicate = data.get('predicate', '') if isinstance(data, dict) else ''
-                            
-                            if (pattern[0] is None or str(u) == str(pattern[0])) and \
-                               (pattern[1] is None or str(predicate) == str(pattern[1])) and \
-                               (pattern[2] is None or str(v) == str(pattern[2])):
-                                
-                                results.append({
-                                    "subject": str(u),
-                                    "predicate": str(predicate),
-                                    "object": str(v),
-                                    "level": level_num,
-                                    "confidence": data.get('confidence', 1.0) if isinstance(data, dict) else 1.0
-                                })
-                                total_count += 1
+                pinned = {"state": state} if state is not None else {}
+                for u, v, data in skg_core.query(pattern, k - len(results), level=level_num, **pinned):
+                    results.append({
+                        "subject": str(u),
+                        "predicate": str(data.get('predicate', '')),
+                        "object": str(v),
+                        "level": level_num,
+                        "confidence": data.get('confidence', 1.0),
+                        "derived": data.get('derived', False)
+                    })
             except Exception as query_error:
-                print(f"Multi-level query error: {query_error}")
+                print(f"Level {level_num} query error: {query_error}")
         
         query_time = (time.time() - start_time) * 1000
         
@@ -274,25 +348,110 @@ async def query_graph(pat: str = "[null,null,null]", k: int = 10, level: Optiona
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@app.post("/query/bgp")
+async def query_bgp(query: BGPQuery):
+    """Conjunctive multi-pattern query with ?variables, joined server-side"""
+    if not hasattr(skg_core, 'select'):
+        raise HTTPException(status_code=501, detail="Multi-pattern queries need a single SKGCore")
+    try:
+        start_time = time.time()
+        results = await asyncio.to_thread(skg_core.select, query.patterns, query.limit)
+        body = {
+            "results": results,
+            "total_matches": len(results),
+            "query_time_ms": round((time.time() - start_time) * 1000, 2)
+        }
+        if query.explain:
+            body["plan"] = skg_core.explain(query.patterns)
+        return body
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _ndjson(lines, start_time, summary):
+    """Stream `lines` as NDJSON, then one {"done": true, …} line from `summary()`."""
+    for line in lines:
+        yield json.dumps(line, default=str) + "\n"
+    tail = {"done": True, **summary(), "elapsed_ms": round((time.time() - start_time) * 1000, 2)}
+    yield json.dumps(tail) + "\n"
+
+def _traversal_args(predicates, timeout_ms):
+    preds = [p.strip() for p in predicates.split(",") if p.strip()] if predicates else None
+    return preds, None if timeout_ms is None else timeout_ms / 1000
+
+@app.get("/neighbors")
+async def neighbors(node: str, hops: int = 1, level: int = 0, predicates: Optional[str] = None,
+                    direction: str = "out", fanout: Optional[int] = None,
+                    max_nodes: Optional[int] = 100_000, timeout_ms: Optional[float] = 1000):
+    """Ego network of a node, streamed as NDJSON batches per hop"""
+    if not hasattr(skg_core, 'neighbors'):
+        raise HTTPException(status_code=501, detail="Traversals need a single SKGCore")
+    start_time = time.time()
+    preds, timeout = _traversal_args(predicates, timeout_ms)
+    try:
+        expansion = skg_core.neighbors(node, hops, level, preds, direction, fanout, max_nodes, timeout)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    lines = ({"hop": h.depth, "nodes": h.nodes.tolist(), "via": h.via.tolist(),
+              "weights": h.weights.tolist()} for h in expansion)
+    summary = lambda: {"reached": expansion.reached, "truncated": expansion.truncated,
+                       "clipped": expansion.clipped}
+    return StreamingResponse(_ndjson(lines, start_time, summary), media_type="application/x-ndjson")
+
+@app.get("/paths")
+async def paths(source: str, target: str, max_hops: int = 4, max_paths: int = 10, level: int = 0,
+                predicates: Optional[str] = None, direction: str = "out",
+                fanout: Optional[int] = None, timeout_ms: Optional[float] = 1000):
+    """Shortest paths between two nodes, streamed as NDJSON (one path per line)"""
+    if not hasattr(skg_core, 'paths'):
+        raise HTTPException(status_code=501, detail="Traversals need a single SKGCore")
+    start_time = time.time()
+    preds, timeout = _traversal_args(predicates, timeout_ms)
+    try:
+        found = skg_core.paths(source, target, max_hops, max_paths, level, preds, direction,
+                               fanout, timeout)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    count = [0]
+    def lines():
+        for path in found:
+            count[0] += 1
+            yield {"path": path, "length": len(path) - 1}
+    return StreamingResponse(_ndjson(lines(), start_time, lambda: {"paths": count[0]}),
+                             media_type="application/x-ndjson")
+
+@app.get("/rules")
+async def list_rules():
+    """Inference rules materialized into K⁰ and how many triples they derived"""
+    rules = getattr(skg_core, 'rules', None)
+    if rules is None:
+        return {"rules": [], "derived_triples": 0}
+    return {
+        "rules": [{"name": r.name, "head": list(r.head), "body": [list(a) for a in r.body]}
+                  for r in rules.rules],
+        "derived_triples": len(rules.derived)
+    }
+
 @app.get("/stats", response_model=StatsResponse)
 async def get_statistics():
     """Get comprehensive graph statistics"""
     try:
         levels_info = {}
-        for level_num, graph in skg_core.levels.items():
-            try:
-                if graph and hasattr(graph, 'number_of_nodes'):
-                    levels_info[str(level_num)] = {
-                        "nodes": graph.number_of_nodes(),
-                        "edges": graph.number_of_edges()
-                    }
-                else:
-                    levels_info[str(level_num)] = {
-                        "nodes": 0,
-                        "edges": 0
-                    }
-            except Exception:
-                levels_info[str(level_num)] = {"nodes": 0, "edges": 0}
+        # pinned sizes – the nx views are edited in place by the writer threads
+        state = skg_core.state() if hasattr(skg_core, 'state') else None
+        if state is not None:
+            for level_num in state.levels:
+                nodes, edges = state.shape(level_num)
+                levels_info[str(level_num)] = {"nodes": nodes, "edges": edges}
+        else:
+            for level_num, graph in skg_core.levels.items():
+                levels_info[str(level_num)] = {
+                    "nodes": graph.number_of_nodes(),
+                    "edges": graph.number_of_edges()
+                }
         
         return StatsResponse(
             levels=levels_info,
@@ -319,12 +478,14 @@ async def expand_graph(request: ExpandRequest):
         if hasattr(skg_core, 'invention_threshold'):
             skg_core.invention_threshold = request.invention_threshold
         
-        # Trigger expansion
-        skg_core.expand_recursive()
-        
-        # Force predicate invention if requested
-        if request.invention_threshold:
-            maybe_invent_predicate(skg_core, thresh=request.invention_threshold)
+        def expand():
+            skg_core.expand_recursive()
+            # Force predicate invention if requested
+            if request.invention_threshold:
+                maybe_invent_predicate(skg_core, thresh=request.invention_threshold)
+
+        # Trigger expansion – off the event loop, it waits for the write lock
+        await asyncio.to_thread(expand)
         
         return {
             "success": True,
@@ -337,39 +498,26 @@ async def expand_graph(request: ExpandRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.get("/export")
-async def export_graph(format: str = "json", level: Optional[int] = None):
-    """Export the complete knowledge graph"""
+async def export_graph(format: str = "json", level: Optional[str] = None, start: int = 0,
+                       stop: Optional[int] = None, min_weight: Optional[float] = None,
+                       compress: bool = False):
+    """Stream the knowledge graph: json, ndjson, graphml or columnar (npz of
+    interned ids + string tables).  `level` takes one level or a comma list;
+    start/stop select subject ids, min_weight drops lighter edges."""
+    from skg.export import Export, FORMATS, MEDIA_TYPES
+    fmt = format.lower()
+    if fmt not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Supported formats: {', '.join(FORMATS)}")
+    if not hasattr(skg_core, 'store'):
+        raise HTTPException(status_code=501, detail="Export needs a single SKGCore")
     try:
-        if format.lower() not in ["json", "graphml", "pickle"]:
-            raise HTTPException(status_code=400, detail="Supported formats: json, graphml, pickle")
-        
-        if level is not None and level in skg_core.levels:
-            # Export specific level
-            graph = skg_core.levels[level]
-            export_data = {
-                "level": level,
-                "nodes": list(graph.nodes()),
-                "edges": [(u, v, data) for u, v, data in graph.edges(data=True)]
-            }
-        else:
-            # Export all levels
-            export_data = {}
-            for level_num, graph in skg_core.levels.items():
-                export_data[f"level_{level_num}"] = {
-                    "nodes": list(graph.nodes()),
-                    "edges": [(u, v, data) for u, v, data in graph.edges(data=True)]
-                }
-            
-            export_data["metadata"] = {
-                "bootstrap_triggered": skg_core.bootstrap_triggered,
-                "invented_predicates": list(skg_core.invented_predicates),
-                "export_timestamp": datetime.now().isoformat()
-            }
-        
-        return JSONResponse(content=export_data)
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        levels = None if level is None else [int(k) for k in level.split(",") if k.strip()]
+        export = Export(skg_core, levels, start, stop, min_weight)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    body = export.columnar(compress) if fmt == "columnar" else getattr(export, fmt)()
+    headers = {"Content-Disposition": "attachment; filename=skg-export.npz"} if fmt == "columnar" else None
+    return StreamingResponse(body, media_type=MEDIA_TYPES[fmt], headers=headers)
 
 @app.post("/curiosity/seed")
 async def seed_curiosity(request: CuriosityRequest):
@@ -381,15 +529,15 @@ async def seed_curiosity(request: CuriosityRequest):
             unknown_triples.append(('PATTERN_X', 'involves', unknown))
             unknown_triples.append((unknown, 'type', 'UNKNOWN_ENTITY'))
         
-        skg_core.add_triples(unknown_triples)
+        await asyncio.to_thread(skg_core.add_triples, unknown_triples)
         
         # Start or restart curiosity daemon
         try:
             if hasattr(skg_core, 'start_curiosity_daemon'):
-                skg_core.start_curiosity_daemon()
+                await asyncio.to_thread(skg_core.start_curiosity_daemon)
             else:
                 # Use imported function
-                start_curiosity(skg_core)
+                await asyncio.to_thread(start_curiosity, skg_core)
         except Exception as curiosity_error:
             print(f"Curiosity daemon error: {curiosity_error}")
         
@@ -412,7 +560,7 @@ async def get_curiosity_goals():
         return {
             "active_goals": goals,
             "goal_count": len(goals),
-            "daemon_status": "active" if hasattr(skg_core, '_curiosity_daemon') else "inactive",
+            "daemon_status": "active" if _job_scheduled("curiosity") else "inactive",
             "last_analysis": datetime.now().isoformat()
         }
         
@@ -425,7 +573,7 @@ async def force_predicate_invention(threshold: float = 0.3):
     try:
         # Force predicate invention
         invented_count_before = len(skg_core.invented_predicates)
-        maybe_invent_predicate(skg_core, thresh=threshold)
+        await asyncio.to_thread(maybe_invent_predicate, skg_core, threshold)
         invented_count_after = len(skg_core.invented_predicates)
         
         new_predicates = invented_count_after - invented_count_before
@@ -441,6 +589,102 @@ async def force_predicate_invention(threshold: float = 0.3):
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@app.post("/admin/snapshot")
+async def save_snapshot():
+    """Write a memory-mappable binary snapshot of every SKG level"""
+    if not hasattr(skg_core, 'snapshot_dir'):
+        raise HTTPException(status_code=501, detail="Snapshots need a single SKGCore")
+    try:
+        start_time = time.time()
+        path = await asyncio.to_thread(skg_core.save_snapshot)
+        return {
+            "success": True,
+            "path": str(path),
+            "generation": int(path.name),
+            "depth": skg_core.depth,
+            "write_time_ms": round((time.time() - start_time) * 1000, 2)
+        }
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/admin/snapshot/load")
+async def load_snapshot():
+    """Map the newest snapshot's levels into the running SKG"""
+    if not hasattr(skg_core, 'snapshot_dir'):
+        raise HTTPException(status_code=501, detail="Snapshots need a single SKGCore")
+    try:
+        start_time = time.time()
+        meta = await asyncio.to_thread(skg_core.load_snapshot)
+        return {"success": True, "snapshot": meta,
+                "load_time_ms": round((time.time() - start_time) * 1000, 2)}
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/admin/snapshot")
+async def snapshot_status():
+    """Metadata of the newest snapshot on disk"""
+    if not hasattr(skg_core, 'snapshot_dir'):
+        raise HTTPException(status_code=501, detail="Snapshots need a single SKGCore")
+    from skg import snapshot
+    path = snapshot.latest(skg_core.snapshot_dir)
+    if path is None:
+        raise HTTPException(status_code=404, detail="No snapshot written yet")
+    return {"path": str(path), "snapshot": snapshot.read_meta(path)}
+
+@app.get("/shards")
+async def shard_status():
+    """Per-shard triple, ghost-edge and level counts (single-process: one shard)"""
+    status = getattr(skg_core, 'status', None)
+    if status is None:
+        return {"shards": 1, "version": getattr(skg_core, 'version', 0),
+                "total_triples": getattr(skg_core, 'total_edges', 0)}
+    return await asyncio.to_thread(status)
+
+@app.get("/admin/cache")
+async def cache_status():
+    """Query result cache: size, hits, misses, invalidations"""
+    cache = getattr(skg_core, 'cache', None)
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+@app.get("/admin/jobs")
+async def job_status():
+    """Background jobs: schedule, CPU used against budget, last error"""
+    scheduler = getattr(skg_core, 'scheduler', None)
+    if scheduler is None:
+        return {"running": None, "alive": False, "jobs": []}
+    return scheduler.status()
+
+@app.post("/admin/jobs/start")
+async def start_jobs():
+    """Schedule every background job (no-op for jobs already scheduled)"""
+    if not hasattr(skg_core, 'start_background'):
+        raise HTTPException(status_code=501, detail="Background jobs not available")
+    return skg_core.start_background().status()
+
+@app.post("/admin/jobs/{name}/run")
+async def run_job_now(name: str):
+    """Move a scheduled job's next run to now"""
+    scheduler = getattr(skg_core, 'scheduler', None)
+    if scheduler is None or not scheduler.run_now(name):
+        raise HTTPException(status_code=404, detail=f"No scheduled job {name!r}")
+    return {"success": True, "job": name}
+
+@app.post("/admin/jobs/{name}/cancel")
+async def cancel_job(name: str):
+    """Cancel a scheduled job (a running one stops at its next check)"""
+    scheduler = getattr(skg_core, 'scheduler', None)
+    if scheduler is None or not scheduler.cancel(name):
+        raise HTTPException(status_code=404, detail=f"No scheduled job {name!r}")
+    return {"success": True, "job": name, "cancelled": True}
+
 @app.get("/")
 async def root():
     """API root - service information"""
@@ -452,16 +696,26 @@ async def root():
             "health": "GET /health - System health check",
             "add": "POST /add - Add single knowledge triple",
             "add_batch": "POST /add_batch - Add multiple triples",
+            "ingest": "GET /ingest/status, GET /ingest/wait - Async write queue",
+            "bulk": "POST /bulk/begin, /bulk/add, /bulk/commit - Deferred bulk load",
             "query": "GET /query - Query knowledge graph",
+            "query_bgp": "POST /query/bgp - Multi-pattern query with ?variables",
+            "neighbors": "GET /neighbors - Ego network, streamed NDJSON",
+            "paths": "GET /paths - Shortest paths, streamed NDJSON",
+            "rules": "GET /rules - Inference rules and derived triple count",
             "stats": "GET /stats - Graph statistics",
             "expand": "POST /expand - Trigger recursive expansion",
-            "export": "GET /export - Export graph data",
+            "export": "GET /export - Streamed json/ndjson/graphml/columnar export",
             "curiosity": "POST /curiosity/seed, GET /curiosity/goals",
-            "predicate": "POST /predicate/invent"
+            "predicate": "POST /predicate/invent",
+            "snapshot": "GET/POST /admin/snapshot, POST /admin/snapshot/load",
+            "cache": "GET /admin/cache - Query cache hit/miss metrics",
+            "jobs": "GET /admin/jobs, POST /admin/jobs/start, POST /admin/jobs/{name}/run|cancel",
+            "shards": "GET /shards - Per-shard status (SKG_SHARDS > 1)"
         },
         "documentation": "/docs"
     }
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8004)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("SKG_API_PORT", "8004")))
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Shared SKG test fixtures – skg-core on the path, a fresh SKGCore per test on a temporary database
+"""
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'skg-core'))
+
+import pytest
+
+
+@pytest.fixture
+def skg_options():
+    """How the `skg` fixture builds its core; override in a module to vary it.
+
+        rules       rule list replacing the vault rules (None: the vault's)
+        invent      False disables predicate invention
+        curiosity   True keeps the curiosity daemon
+        core        keyword arguments for SKGCore(…)
+    """
+    return {}
+
+
+@pytest.fixture
+def no_daemons(monkeypatch):
+    from skg import core as skg_core
+    monkeypatch.setattr(skg_core, "start_curiosity", lambda core: None)
+
+
+@pytest.fixture
+def skg(tmp_path, monkeypatch, skg_options):
+    from skg import core as skg_core
+    monkeypatch.setattr(skg_core, "DB_FILE", tmp_path / "skg.db")
+    if not skg_options.get("curiosity", False):
+        monkeypatch.setattr(skg_core, "start_curiosity", lambda core: None)
+    if skg_options.get("rules") is not None:
+        rules = list(skg_options["rules"])
+        monkeypatch.setattr(skg_core, "load_rules", lambda: rules)
+    if not skg_options.get("invent", True):
+        monkeypatch.setattr(skg_core, "maybe_invent_predicate", lambda core, thresh=0.8: None)
+    core = skg_core.SKGCore(**skg_options.get("core", {}))
+    yield core
+    core.close()
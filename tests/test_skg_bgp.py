@@ -0,0 +1,107 @@
+"""
+Basic-graph-pattern queries – variables, planner order, join methods and LIMIT
+"""
+import pytest
+
+from skg import core as skg_core
+from skg import bgp
+from skg.store import TripleStore
+
+
+@pytest.fixture
+def store():
+    st = TripleStore()
+    for i in range(200):
+        st.add(f"p{i}", "worksAt", f"c{i % 20}")
+    for c in range(20):
+        st.add(f"c{c}", "locatedIn", "berlin" if c < 3 else f"city{c}")
+    st.add("berlin", "isA", "capital")
+    st.add("p7", "knows", "p7")
+    return st
+
+
+def _brute(store, patterns):
+    """Reference answer: nested loops over every triple."""
+    triples = [(s, p, o) for s, p, o, _ in store.match()]
+    sols = [{}]
+    for pat in patterns:
+        nxt = []
+        for sol in sols:
+            for t in triples:
+                cand, ok = dict(sol), True
+                for term, val in zip(pat, t):
+                    if term is None:
+                        continue
+                    if bgp.is_var(term):
+                        if cand.setdefault(term[1:], val) != val:
+                            ok = False
+                    elif term != val:
+                        ok = False
+                if ok:
+                    nxt.append(cand)
+        sols = nxt
+    return sols
+
+
+def _key(rows):
+    return sorted(tuple(sorted(r.items())) for r in rows)
+
+
+def test_two_pattern_join_matches_brute_force(store):
+    q = [["?x", "worksAt", "?y"], ["?y", "locatedIn", "berlin"]]
+    rows = bgp.select(store, q)
+    assert len(rows) == 30
+    assert _key(rows) == _key(_brute(store, q))
+
+
+def test_planner_starts_with_the_most_selective_pattern(store):
+    plan = bgp.plan(store, [["?x", "worksAt", "?y"], ["?y", "locatedIn", "berlin"],
+                            ["berlin", "isA", "?kind"]])
+    order = [s.pattern.terms for s in plan.steps]
+    assert order[0] == ("berlin", "isA", "?kind")
+    assert order[1] == ("?y", "locatedIn", "berlin")
+    # berlin's one fact × its three companies, then an index probe per company
+    assert [s.method for s in plan.steps] == ["scan", "hash", "index"]
+
+
+@pytest.mark.parametrize("method", ["index", "hash", "merge"])
+def test_join_methods_agree(store, method):
+    q = [["?x", "worksAt", "?y"], ["?y", "locatedIn", "?z"]]
+    plan = bgp.plan(store, q)
+    plan.steps[1].method = method
+    got = [dict(zip(plan.vars, sol)) for sol in plan.solutions()]
+    assert len(got) == 200
+    labels = [{v[1:]: (store.preds if plan.space[v] == "pred" else store.nodes).label(i)
+               for v, i in sol.items()} for sol in got]
+    assert _key(labels) == _key(_brute(store, q))
+
+
+def test_limit_stops_early(store, monkeypatch):
+    pulled = []
+    real = store.match_ids
+    monkeypatch.setattr(store, "match_ids", lambda *a: (pulled.append(1) or t for t in real(*a)))
+    rows = bgp.select(store, [["?x", "worksAt", "?y"]], limit=5)
+    assert len(rows) == 5 and len(pulled) == 5
+
+
+def test_repeated_variable_and_anonymous_terms(store):
+    assert bgp.select(store, [["?x", "knows", "?x"]]) == [{"x": "p7"}]
+    assert bgp.select(store, [["?c", "locatedIn", None]], limit=3) == [{"c": "c0"}, {"c": "c1"}, {"c": "c2"}]
+
+
+def test_unknown_constant_and_bad_queries(store):
+    assert bgp.select(store, [["?x", "worksAt", "nowhere"]]) == []
+    with pytest.raises(ValueError):
+        bgp.select(store, [["?x", "?x", "?y"]])
+    with pytest.raises(ValueError):
+        bgp.select(store, [])
+
+
+def test_core_select_and_explain(tmp_path, monkeypatch):
+    monkeypatch.setattr(skg_core, "DB_FILE", tmp_path / "skg.db")
+    monkeypatch.setattr(skg_core, "start_curiosity", lambda core: None)
+    skg = skg_core.SKGCore()
+    skg.add_triples([("ann", "worksAt", "acme"), ("acme", "locatedIn", "oslo"), ("bob", "worksAt", "initech")])
+    q = [["?who", "worksAt", "?co"], ["?co", "locatedIn", "?city"]]
+    assert skg.select(q) == [{"who": "ann", "co": "acme", "city": "oslo"}]
+    assert [s["method"] for s in skg.explain(q)][0] == "scan"
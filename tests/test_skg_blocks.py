@@ -0,0 +1,47 @@
+"""
+Lazy block operator – products, rows and slices match the explicit block matrix
+"""
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, eigs
+
+from skg.blocks import BlockOperator
+
+
+@pytest.fixture
+def op():
+    rng = np.random.default_rng(1)
+    return BlockOperator([sp.random(6, 6, density=0.4, random_state=rng, format="csr")
+                          for _ in range(3)])
+
+
+def test_products_match_dense(op):
+    dense = op.to_dense()
+    x = np.arange(op.shape[1], dtype=float)
+    X = np.column_stack([x, -x])
+    assert isinstance(op, LinearOperator)
+    assert np.allclose(op @ x, dense @ x)
+    assert np.allclose(op.matmat(X), dense @ X)
+    assert np.allclose(op.rmatvec(x), dense.T @ x)
+    assert np.allclose(op.T @ x, dense.T @ x)
+    # off-by-two blocks stay empty
+    assert not dense[:6, 12:].any()
+
+
+def test_rows_and_slices(op):
+    dense = op.to_dense()
+    assert np.allclose(op.getrow(7).toarray(), dense[7:8])
+    assert np.allclose(op[[13, 2, 8]].toarray(), dense[[13, 2, 8]])
+    assert np.allclose(op[4:10, 3:15].toarray(), dense[4:10, 3:15])
+    assert op[-1, 17] == dense[-1, 17]
+
+
+def test_core_block_matrix_is_lazy(skg):
+    skg.add_triples([(f"n{i}", "rel", f"n{(i * 3) % 12}") for i in range(12)])
+    block = skg.block_matrix()
+    assert isinstance(block, BlockOperator)
+    assert all(np.shares_memory(lvl.data, skg.adjs[k].data) for k, lvl in enumerate(block.levels))
+    vals = eigs(block, k=2, return_eigenvectors=False)
+    assert len(vals) == 2
+    assert np.allclose(block @ np.ones(block.shape[1]), skg.block_matrix(dense=True).sum(axis=1))
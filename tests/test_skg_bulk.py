@@ -0,0 +1,44 @@
+"""
+Bulk load – append-only session, one repair/expansion flush at the end
+"""
+import pytest
+
+from skg import core as skg_core
+
+
+def test_bulk_load_defers_expansion(skg, monkeypatch):
+    calls = []
+    monkeypatch.setattr(skg, "expand_recursive", lambda: calls.append(skg.depth))
+    with skg.bulk_load():
+        for i in range(30):
+            skg.add_triples([(f"n{i}", "rel", f"n{i + 1}"), (f"n{i}", "tag", "hub")])
+        assert calls == [] and 1 not in skg.adjs
+    assert calls == [1]
+    assert skg.total_edges == 60
+    assert skg.adjs[0].nnz == skg.levels[0].number_of_edges()
+
+
+def test_bulk_load_flush_builds_levels(skg):
+    with skg.bulk_load():
+        skg.add_triples([(f"n{i}", "rel", f"n{(i * 3) % 40}") for i in range(60)])
+    assert skg.depth == skg_core.MAX_DEPTH
+    assert skg.bootstrapped
+    assert len(skg.query([None, "rel", None], k=100)) >= 60
+
+
+def test_bulk_http_session(tmp_path, monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+    monkeypatch.setattr(skg_core, "DB_FILE", tmp_path / "api.db")
+    import skg_api
+    monkeypatch.setattr(skg_api, "skg_core", skg_core.SKGCore())
+    client = TestClient(skg_api.app)
+
+    assert client.post("/bulk/add", json={"triples": [["a", "r", "b"]]}).status_code == 409
+    assert client.post("/bulk/begin").status_code == 200
+    assert client.post("/bulk/begin").status_code == 409
+    client.post("/bulk/add", json={"triples": [["a", "r", "b"], ["b", "r", "c"]]})
+    client.post("/bulk/add", json={"triples": [["c", "r", "a"]]})
+    body = client.post("/bulk/commit").json()
+    assert body["triples_added"] == 3
+    assert body["depth"] == skg_core.MAX_DEPTH
@@ -0,0 +1,90 @@
+"""
+Query result cache – LRU, version-checked puts, invalidation by touched index keys, metrics
+"""
+import pytest
+
+from skg.cache import QueryCache, dependencies, index_keys, pattern_key, EVERYTHING
+
+
+@pytest.fixture
+def skg_options():
+    return {"rules": []}
+
+
+def test_pattern_keys_are_the_patterns_a_triple_matches():
+    keys = index_keys(("a", "r", "b"))
+    assert len(keys) == 8 and EVERYTHING in keys
+    assert pattern_key(["a", None, "b"]) in keys and pattern_key(["a"]) == (0, "a", None, None)
+    assert pattern_key(["", None, None]) != pattern_key([None, None, None])
+    assert pattern_key([7, None, None]) in index_keys((7, "r", "b"))
+    assert pattern_key(["x", None, None]) not in keys
+    assert dependencies(["a"], 2) == {("level", 2)}
+
+
+def test_lru_eviction_and_counters():
+    cache = QueryCache(size=2)
+    for i in range(3):
+        cache.put(i, [i], {pattern_key([str(i)])}, 0)
+    assert cache.get(0) is None and cache.get(2) == [2]
+    assert cache.get(1) == [1]
+    cache.put(3, [3], (), 0)                        # 2 is now least recently used
+    assert cache.get(2) is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (2, 2, 2, 2)
+
+
+def test_invalidation_is_precise_and_stale_puts_are_refused():
+    cache = QueryCache()
+    cache.put("a?", ["a"], {pattern_key(["a", None, None])}, 1)
+    cache.put("?r?", ["r"], {pattern_key([None, "r", None])}, 1)
+    cache.put("k1", ["k1"], {("level", 1)}, 1)
+    assert cache.invalidate([("b", "s", "c")], version=2) == 0
+    assert cache.get("a?", 2) == ["a"]
+    assert cache.get("a?", 0) is None              # never newer than the reader's pin
+    assert cache.invalidate([("a", "s", "c")], levels=[1], version=3) == 2
+    assert cache.get("a?") is None and cache.get("k1") is None and cache.get("?r?") == ["r"]
+    assert not cache.put("a?", ["old"], set(), 2)  # computed before the version-3 write
+    assert cache.stats()["rejected"] == 1
+
+
+def test_core_query_is_served_until_a_write_touches_it(skg):
+    skg.add_triples([("a", "r", "b"), ("c", "r", "d")])
+    first = skg.query(["a", None, None], 10, level=0)
+    assert skg.query(["a", None, None], 10, level=0) == first
+    assert skg.cache.hits == 1
+    skg.add_triples([("c", "r", "e")])              # other subject – entry survives
+    assert skg.query(["a", None, None], 10, level=0) == first and skg.cache.hits == 2
+    skg.add_triples([("a", "r", "f")])
+    assert len(skg.query(["a", None, None], 10, level=0)) == 2
+    skg.remove_triples([("a", "r", "f")])
+    assert skg.query(["a", None, None], 10, level=0) == first
+
+
+def test_empty_label_is_not_a_wildcard(skg):
+    skg.add_triples([("a", "r", "b")])
+    assert skg.query(["", None, None], 10, level=0) == []
+    assert len(skg.query([None, None, None], 10, level=0)) == 1
+
+
+def test_derived_level_entries_follow_rebuilds(skg):
+    skg.add_triples([("a", "r", "b"), ("b", "r", "c")])
+    state = skg.state()
+    before = skg.query([None, None, None], 50, level=1)
+    assert skg.query([None, None, None], 50, level=1, state=state) == before
+    skg.add_triples([("c", "r", "d")])
+    assert skg.state().adjs[1] is not state.adjs[1]
+    assert skg.query([None, None, None], 50, level=1) != before
+    assert skg.query([None, None, None], 50, level=1, state=state) == before   # old pin, recomputed
+
+
+def test_http_cache_metrics(skg, monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+    import skg_api
+    monkeypatch.setattr(skg_api, "skg_core", skg)
+    client = TestClient(skg_api.app)
+    skg.add_triples([("a", "r", "b")])
+    for _ in range(3):
+        client.get("/query", params={"pat": '["a", null, null]', "level": 0, "k": 5})
+    stats = client.get("/admin/cache").json()
+    assert stats["enabled"] and stats["hits"] == 2 and stats["misses"] == 1
@@ -0,0 +1,87 @@
+"""
+Incremental communities – seeded label propagation and fingerprint-deduplicated invention
+"""
+import threading
+
+import numpy as np
+import scipy.sparse as sp
+
+from skg import core as skg_core
+from skg.communities import CommunityIndex, fingerprint
+from skg.invent_predicate import maybe_invent_predicate
+
+
+def _cliques(n=2, size=6, bridge=True):
+    N = n * size
+    dense = np.zeros((N, N))
+    for c in range(n):
+        block = slice(c * size, (c + 1) * size)
+        dense[block, block] = 1.0
+    np.fill_diagonal(dense, 0)
+    if bridge:
+        dense[size - 1, size] = 1.0
+    return sp.csr_matrix(dense)
+
+
+def test_label_propagation_finds_cliques():
+    index = CommunityIndex()
+    index.update(_cliques())
+    assert len(set(index.labels[:6])) == 1 and len(set(index.labels[6:])) == 1
+    assert index.labels[0] != index.labels[6]
+    dens = index.density(_cliques(), {index.labels[0]})
+    assert dens[index.labels[0]] == (6, 1.0)
+
+
+def test_update_only_touches_changed_communities():
+    index = CommunityIndex()
+    index.update(_cliques(3))
+    first = index.labels.copy()
+    grown = sp.lil_matrix((19, 19))
+    grown[:18, :18] = _cliques(3)
+    grown[13, 17] = 0.0                     # edit inside the third clique
+    grown[12, 18] = grown[18, 12] = grown[13, 18] = 1.0    # …and a new node joins it
+    grown = sp.csr_matrix(grown)
+    grown.eliminate_zeros()
+    touched = index.update(grown)
+    assert first[0] not in touched and first[6] not in touched
+    assert index.labels[18] == index.labels[12]
+    assert (index.labels[:12] == first[:12]).all()
+
+
+def test_fingerprint_is_stable_and_order_free():
+    assert fingerprint(["b", "a", "c"]) == fingerprint(("c", "a", "b"))
+    assert fingerprint(["a", "b"]) != fingerprint(["a", "b", "c"])
+    assert len(fingerprint(["a"])) == 16
+
+
+def test_invention_is_deduplicated(tmp_path, monkeypatch):
+    monkeypatch.setattr(skg_core, "DB_FILE", tmp_path / "skg.db")
+    monkeypatch.setattr(skg_core, "start_curiosity", lambda core: None)
+    skg = skg_core.SKGCore()
+    clique = [f"c{i}" for i in range(5)]
+    skg.add_triples([(a, "knows", b) for a in clique for b in clique if a != b])
+    maybe_invent_predicate(skg, thresh=0.5)
+    names = list(skg.invented_predicates)
+    assert names and all(len(n) == len("cluster_") + 16 for n in names)
+    members = skg.store.estimate(p="member_of")
+    maybe_invent_predicate(skg, thresh=0.5)
+    assert skg.invented_predicates == names
+    assert skg.store.estimate(p="member_of") == members
+
+    skg.close()
+    again = skg_core.SKGCore()                          # names come back from the marker triples
+    assert sorted(again.invented_predicates) == sorted(names)
+    maybe_invent_predicate(again, thresh=0.5)
+    assert again.store.estimate(p="member_of") == members
+
+
+def test_invention_waits_for_the_write_lock(skg):
+    clique = [f"c{i}" for i in range(5)]
+    skg.add_triples([(a, "knows", b) for a in clique for b in clique if a != b])
+    done = threading.Event()
+    with skg._write_lock:                               # a writer – e.g. the ingest worker – is busy
+        worker = threading.Thread(target=lambda: (maybe_invent_predicate(skg, thresh=0.5), done.set()))
+        worker.start()
+        assert not done.wait(0.3)
+    worker.join(30)
+    assert done.is_set() and skg.invented_predicates
@@ -0,0 +1,55 @@
+"""
+Contradiction repair – checks only each new triple's own (s, o) pair
+"""
+from skg import contradiction
+
+
+def test_vault_table_is_loaded():
+    assert contradiction.MUTEX_PRED["loves"] == "hates"
+    assert len(contradiction.MUTEX_PRED) > 40
+    assert "likes" in contradiction._CONFLICTS["dislikes"]
+    for p in ("hired", "buys", "imports", "marriedTo", "citizenOf", "memberOf", "wins", "remembers", "bornIn"):
+        assert p not in contradiction._CONFLICTS    # events that co-occur over a history
+
+
+def test_a_history_of_events_is_not_a_contradiction(skg):
+    history = [("alice", "marriedTo", "bob"), ("alice", "divorcedFrom", "bob"),
+               ("dante", "citizenOf", "florence"), ("dante", "exiledFrom", "florence")]
+    skg.add_triples(history)
+    assert all(t in skg.store for t in history)
+
+
+def test_mutex_pair_is_repaired_on_ingest(skg):
+    skg.add_triples([("ann", "loves", "bob"), ("ann", "knows", "bob")])
+    skg.add_triples([("ann", "hates", "bob"), ("cat", "hates", "bob")])
+    preds = {d["predicate"] for _, _, d in skg.query(["ann", None, "bob"])}
+    assert preds == {"loves", "knows"}
+    assert skg.query(["cat", "hates", "bob"])
+    assert skg.levels[0].has_edge("ann", "bob")
+
+
+def test_heavier_triple_wins(skg):
+    skg.add_triples([("ann", "loves", "bob")])
+    skg.store.add("ann", "hates", "bob", weight=2.0)
+    removed = contradiction.detect_and_repair(skg)
+    assert removed == [("ann", "bob")]
+    assert skg.store.predicates("ann", "bob") == ["hates"]
+
+
+def test_only_new_triples_are_checked(skg, monkeypatch):
+    skg.add_triples([(f"n{i}", "loves", f"m{i}") for i in range(50)])
+    seen = []
+    real = skg.store.predicates
+    monkeypatch.setattr(skg.store, "predicates", lambda s, o: seen.append((s, o)) or real(s, o))
+    skg.add_triples([("x", "hates", "y")])
+    assert seen == [("x", "y")]
+
+
+def test_load_mutex_table(tmp_path, monkeypatch):
+    monkeypatch.setattr(contradiction, "MUTEX_PRED", dict(contradiction.MUTEX_PRED))
+    monkeypatch.setattr(contradiction, "_CONFLICTS", dict(contradiction._CONFLICTS))
+    vault = tmp_path / "mutex.json"
+    vault.write_text('{"mutex": [["sings", "hums"]]}')
+    assert contradiction.load_mutex_table(vault) == 1
+    assert contradiction._CONFLICTS["hums"] == {"sings"}
+    assert contradiction.load_mutex_table(tmp_path / "missing.json") == 0
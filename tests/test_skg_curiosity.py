@@ -0,0 +1,52 @@
+"""
+Curiosity – UNKNOWN index kept on insert/delete, bounded deduplicated goal queue
+"""
+import threading
+
+from skg.curiosity import GoalQueue, spawn_goals, start_curiosity
+
+
+def test_index_follows_inserts_and_deletes(skg):
+    skg.add_triples([("a", "r", "b"), ("UNKNOWN_1", "near", "a"), ("b", "r", "UNKNOWN_2")])
+    assert len(skg.unknowns) == 2
+    assert skg.unknowns.entities() == {"UNKNOWN_1", "UNKNOWN_2"}
+    skg.remove_triples([("UNKNOWN_1", "near", "a")])
+    assert skg.unknowns.entities() == {"UNKNOWN_2"}
+
+
+def test_goals_are_incremental_and_deduplicated(skg):
+    skg.add_triples([("UNKNOWN_1", "near", "a"), ("a", "r", "b")])
+    first = spawn_goals(skg)
+    assert first == ["Research identity of UNKNOWN_1 connected to a"]
+    assert spawn_goals(skg) == []                 # nothing changed since the last tick
+    skg.add_triples([("UNKNOWN_1", "near", "a")])
+    assert spawn_goals(skg) == [] and len(skg.curiosity_goals) == 1
+    skg.remove_triples([("UNKNOWN_1", "near", "a")])
+    spawn_goals(skg)
+    assert len(skg.curiosity_goals) == 0          # withdrawn with its triple
+
+
+def test_goals_ranked_by_centrality(skg):
+    skg.add_triples([("hub", "r", f"n{i}") for i in range(5)])
+    skg.add_triples([("UNKNOWN_lone", "near", "x"), ("UNKNOWN_hub", "near", "hub"),
+                     ("UNKNOWN_hub", "near", "n1")])
+    spawn_goals(skg)
+    assert next(iter(skg.curiosity_goals)).startswith("Research identity of UNKNOWN_hub")
+
+
+def test_goal_queue_is_bounded():
+    q = GoalQueue(maxlen=3)
+    for i in range(10):
+        q.push(f"g{i}", priority=i)
+    q.push("g9", priority=0)                      # duplicate, lower rank – ignored
+    assert list(q) == ["g9", "g8", "g7"]
+    q.append("g5")                                # list-style callers still work
+    assert len(q) == 3 and "g5" not in q
+
+
+def test_start_is_one_job_and_never_a_thread(skg):
+    threads = threading.active_count()
+    first = start_curiosity(skg)
+    assert start_curiosity(skg) is first and "curiosity" in skg.scheduler
+    assert start_curiosity(object()) is None            # no scheduler – nothing is spawned
+    assert threading.active_count() <= threads + 1      # at most the scheduler's own worker
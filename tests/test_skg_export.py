@@ -0,0 +1,97 @@
+"""
+Streaming export – chunked JSON / NDJSON / GraphML, columnar npz round trip, level and range filters
+"""
+import io
+import json
+
+import numpy as np
+import pytest
+
+from skg import export as skg_export
+from skg.export import Export, read_columnar
+from skg.rules import Rule
+
+TRANSITIVE = Rule("isA_transitive", ["?x", "isA", "?z"], [["?x", "isA", "?y"], ["?y", "isA", "?z"]])
+
+
+@pytest.fixture
+def skg_options():
+    return {"rules": [TRANSITIVE]}
+
+
+@pytest.fixture
+def skg(skg):
+    skg.add_triples([(f"n{i}", "r", f"n{i + 1}") for i in range(30)] + [("a", "isA", "b"), ("b", "isA", "c")])
+    return skg
+
+
+def _k0(core):
+    return sorted((s, p, o) for s, p, o, _ in core.store.match())
+
+
+def test_json_streams_one_document_in_many_chunks(skg, monkeypatch):
+    monkeypatch.setattr(skg_export, "EXPORT_CHUNK", 4)
+    monkeypatch.setattr(skg_export, "K0_SUBJECTS", 3)
+    pieces = list(Export(skg).json())
+    assert len(pieces) > 10
+    doc = json.loads("".join(pieces))
+    assert sorted((u, d["predicate"], v) for u, v, d in doc["level_0"]["edges"]) == _k0(skg)
+    assert [u for u, v, d in doc["level_0"]["edges"] if d.get("derived")] == ["a"]
+    for k in skg.state().levels[1:]:
+        assert len(doc[f"level_{k}"]["edges"]) == skg.state().adjs[k].nnz
+    assert doc["metadata"]["version"] == skg.version
+
+
+def test_filtered_multi_chunk_json_stays_valid(skg, monkeypatch):
+    monkeypatch.setattr(skg_export, "EXPORT_CHUNK", 3)
+    monkeypatch.setattr(skg_export, "K0_SUBJECTS", 2)
+    skg.store.add("n0", "r", "n1", weight=2.0)
+    doc = json.loads("".join(Export(skg, [0, 1], min_weight=2).json()))
+    assert [(u, v) for u, v, _ in doc["level_0"]["edges"]] == [("n0", "n1")]
+    assert all(d["weight"] >= 2 for _, _, d in doc["level_1"]["edges"])
+
+
+def test_ndjson_level_range_and_weight_filters(skg):
+    ids = [skg.nodes.id(f"n{i}") for i in range(5)]
+    lines = [json.loads(l) for l in "".join(Export(skg, [0], start=min(ids), stop=max(ids) + 1).ndjson()).splitlines()]
+    assert lines[0]["metadata"]["levels"] == [0]
+    assert {(l["s"], l["o"]) for l in lines[1:]} == {(f"n{i}", f"n{i + 1}") for i in range(5)}
+    heavy = Export(skg, [1], min_weight=1.1)
+    weights = [l["weight"] for l in map(json.loads, "".join(heavy.ndjson()).splitlines()[1:])]
+    assert weights and min(weights) >= 1.1
+    with pytest.raises(ValueError):
+        Export(skg, [9])
+
+
+def test_columnar_round_trip(skg):
+    for compress in (False, True):
+        meta, levels = read_columnar(io.BytesIO(b"".join(Export(skg).columnar(compress))))
+        assert meta["levels"] == skg.state().levels
+        k0 = levels[0]
+        assert k0["src"].dtype == object and k0["weight"].dtype == np.float64
+        assert sorted(zip(k0["src"], k0["pred"], k0["dst"])) == _k0(skg)
+        assert k0["derived"].sum() == 1
+        assert len(levels[1]["src"]) == skg.state().adjs[1].nnz and "pred" not in levels[1]
+
+
+def test_graphml_parses(skg):
+    nx = pytest.importorskip("networkx")
+    g = nx.read_graphml(io.StringIO("".join(Export(skg, [0]).graphml())))
+    assert sorted((u, d["predicate"], v) for u, v, d in g.edges(data=True)) == _k0(skg)
+
+
+def test_http_export_streams_every_format(skg, monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+    import skg_api
+    monkeypatch.setattr(skg_api, "skg_core", skg)
+    client = TestClient(skg_api.app)
+
+    assert "level_0" in client.get("/export", params={"level": "0,1"}).json()
+    resp = client.get("/export", params={"format": "ndjson", "level": "0"})
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert len(resp.text.splitlines()) == len(skg.store) + 1
+    resp = client.get("/export", params={"format": "columnar", "compress": True})
+    assert read_columnar(io.BytesIO(resp.content))[0]["levels"] == skg.state().levels
+    assert client.get("/export", params={"format": "pickle"}).status_code == 400
+    assert client.get("/export", params={"level": "7"}).status_code == 400
@@ -0,0 +1,42 @@
+"""
+Cold start – importing and using skg-core must not load torch, Flask or networkx eagerly
+"""
+import json
+import os
+import subprocess
+import sys
+
+SKG_CORE = os.path.join(os.path.dirname(__file__), '..', 'skg-core')
+
+
+def _run(code, tmp_path):
+    env = dict(os.environ, PYTHONPATH=SKG_CORE, UCM_SKG_DB=str(tmp_path / "skg.db"))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         env=env, cwd=tmp_path, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_import_loads_no_heavy_dependency(tmp_path):
+    loaded = _run("import sys, json, skg.core\n"
+                  "print(json.dumps([m for m in ('torch', 'torch_geometric', 'flask', 'networkx')"
+                  " if m in sys.modules]))", tmp_path)
+    assert loaded == []
+
+
+def test_package_exports_resolve_lazily(tmp_path):
+    state = _run("import sys, json, skg\n"
+                 "before = 'skg.core' in sys.modules\n"
+                 "cls = skg.SKGCore\n"
+                 "print(json.dumps([before, cls.__module__, 'SKGCore' in dir(skg)]))", tmp_path)
+    assert state == [False, "skg.core", True]
+
+
+def test_heuristic_core_runs_without_torch(tmp_path):
+    loaded = _run("import sys, json\n"
+                  "from skg.core import SKGCore\n"
+                  "skg = SKGCore()\n"
+                  "skg.add_triples([(f'n{i}', 'rel', f'n{(i * 7) % 30}') for i in range(60)])\n"
+                  "skg.scheduler.stop()\n"
+                  "assert skg.depth > 1 and skg.query([None, None, None], 1, level=1) is not None\n"
+                  "print(json.dumps([m for m in ('torch', 'flask') if m in sys.modules]))", tmp_path)
+    assert loaded == []
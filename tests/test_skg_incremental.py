@@ -0,0 +1,53 @@
+"""
+Incremental level maintenance – dirty-row updates must match a rebuild
+"""
+import numpy as np
+import pytest
+
+from skg import core as skg_core
+
+
+@pytest.fixture
+def skg_options():
+    # invented predicates are extra writes – keep the update count to ours
+    return {"invent": False}
+
+
+def _rebuild(skg, k):
+    prev = skg.adjs[k-1]
+    new = prev + skg._cross_links(prev) + skg._propose_edges(prev, top=skg._top[k])
+    return skg._prune(new)
+
+
+def test_single_add_updates_without_rebuild(skg):
+    skg.add_triples([(f"n{i}", "rel", f"n{(i * 7) % 30}") for i in range(40)])
+    trained = dict(skg._top)
+    skg.add_triples([("n3", "rel", "fresh"), ("fresh", "rel", "n9")])
+
+    assert skg._updates_since_rebuild == 1
+    assert all(skg._top[k][:len(trained[k])].tolist() == trained[k].tolist() for k in trained)
+    n = skg.adjs[0].shape[0]
+    for k in range(1, skg.depth):
+        assert skg.adjs[k].shape == (n, n)
+        assert np.allclose(skg.adjs[k].toarray(), _rebuild(skg, k).toarray())
+        assert skg.levels[k].number_of_edges() == skg.adjs[k].nnz
+
+
+def test_full_rebuild_fallback(skg, monkeypatch):
+    monkeypatch.setattr(skg_core, "FULL_REBUILD_EVERY", 2)
+    skg.add_triples([(f"n{i}", "rel", f"n{(i * 7) % 30}") for i in range(40)])
+    skg.add_triples([("n1", "rel", "n2")])
+    skg.add_triples([("n2", "rel", "n3")])
+    assert skg._updates_since_rebuild == 2
+    skg.add_triples([("n3", "rel", "n4")])
+    assert skg._updates_since_rebuild == 0
+
+
+def test_incremental_mode_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setattr(skg_core, "DB_FILE", tmp_path / "skg.db")
+    monkeypatch.setattr(skg_core, "maybe_invent_predicate", lambda core, thresh=0.8: None)
+    skg = skg_core.SKGCore(incremental=False)
+    skg.add_triples([("a", "r", "b"), ("b", "r", "c")])
+    skg.add_triples([("c", "r", "a")])
+    assert skg._updates_since_rebuild == 0
+    assert skg.depth == skg_core.MAX_DEPTH
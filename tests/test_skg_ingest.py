@@ -0,0 +1,101 @@
+"""
+Coalescing ingest queue – bursts become one add_triples batch, tickets give read-your-writes
+"""
+import threading
+
+import pytest
+
+from skg.ingest import IngestError
+
+
+def test_burst_is_coalesced(skg, monkeypatch):
+    batches = []
+    add = skg.add_triples
+    monkeypatch.setattr(skg, "add_triples", lambda triples: (batches.append(len(triples)), add(triples)))
+    skg.ingest.debounce = 0.2
+    tickets = [skg.submit([(f"n{i}", "rel", f"n{i + 1}")]) for i in range(500)]
+    assert tickets == list(range(1, 501))
+    version = skg.wait_for(tickets[-1], timeout=30)
+    assert version == skg.version
+    assert sum(batches) == 500 and len(batches) <= 2
+    assert len(skg.query(["n7", "rel", None])) == 1
+
+
+def test_wait_times_out_while_pending(skg, monkeypatch):
+    gate = threading.Event()
+    monkeypatch.setattr(skg, "add_triples", lambda triples: gate.wait())
+    ticket = skg.submit([("a", "r", "b")])
+    assert skg.wait_for(ticket, timeout=0.2) is None
+    assert skg.ingest.pending == 1
+    gate.set()
+    assert skg.wait_for(ticket, timeout=5) is not None
+    assert skg.ingest.pending == 0
+
+
+def test_failed_batch_does_not_block_waiters(skg, monkeypatch):
+    monkeypatch.setattr(skg, "add_triples", lambda triples: 1 / 0)
+    ticket = skg.submit([("a", "r", "b")])
+    with pytest.raises(IngestError):
+        skg.wait_for(ticket, timeout=5)
+    assert "ZeroDivisionError" in skg.ingest.status()["last_error"]
+    assert skg.ingest.pending == 0
+
+
+def test_malformed_triples_are_refused_before_queueing(skg):
+    with pytest.raises(ValueError):
+        skg.submit([("a", "r", "b"), ("bad", "triple")])
+    with pytest.raises(ValueError):
+        skg.add_triples([("a", "r", "b"), ("c", None, "d")])
+    with pytest.raises(ValueError):                 # hashable, but SQLite cannot bind it
+        skg.add_triples([("a", "r", "b"), (("x", "y"), "r", "d")])
+    assert skg.ingest.submitted == 0 and len(skg.store) == 0 and 0 not in skg.adjs
+    skg.add_triples([("a", "r", 7), ("a", "weight", 1.5)])
+    assert len(skg.store) == 2
+
+
+def test_a_failing_submission_fails_only_its_own_ticket(skg, monkeypatch):
+    add = skg.add_triples
+    def picky(triples):
+        if any(s == "poison" for s, _, _ in triples):
+            raise RuntimeError("refused")
+        return add(triples)
+    monkeypatch.setattr(skg, "add_triples", picky)
+    skg.ingest.debounce = 0.2
+    good = skg.submit([("a", "r", "b")])
+    bad = skg.submit([("poison", "r", "b")])
+    later = skg.submit([("c", "r", "d")])
+    assert skg.wait_for(good, timeout=10) is not None
+    with pytest.raises(IngestError, match="refused"):
+        skg.wait_for(bad, timeout=10)
+    assert skg.wait_for(later, timeout=10) is not None
+    assert ("a", "r", "b") in skg.store and ("c", "r", "d") in skg.store
+    assert ("poison", "r", "b") not in skg.store
+
+
+def test_http_add_read_your_writes(skg, monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+    import skg_api
+    monkeypatch.setattr(skg_api, "skg_core", skg)
+    client = TestClient(skg_api.app)
+
+    body = client.post("/add", json={"s": "a", "p": "r", "o": "b"}).json()
+    assert body["success"] and body["ticket"] == 1
+    client.post("/add_batch", json={"triples": [["b", "r", "c"]]})
+    waited = client.get("/ingest/wait", params={"timeout": 10}).json()
+    assert waited["version"] == skg.version
+    body = client.post("/add?wait=true", json={"s": "c", "p": "r", "o": "a"}).json()
+    assert body["version"] is not None
+    assert client.get("/query", params={"pat": '["c", null, null]', "level": 0}).json()["total_matches"] == 1
+    assert client.get("/ingest/status").json()["pending"] == 0
+
+
+def test_http_wait_reports_a_failed_write(skg, monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+    import skg_api
+    monkeypatch.setattr(skg_api, "skg_core", skg)
+    monkeypatch.setattr(skg, "add_triples", lambda triples: 1 / 0)
+    client = TestClient(skg_api.app)
+    resp = client.post("/add?wait=true", json={"s": "a", "p": "r", "o": "b"})
+    assert resp.status_code == 500 and "ZeroDivisionError" in resp.json()["detail"]
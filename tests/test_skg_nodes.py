@@ -0,0 +1,33 @@
+"""
+Interned node dictionary – one id space for every SKG level
+"""
+import numpy as np
+
+from skg.nodes import NodeDict
+
+
+def test_node_dict_round_trip():
+    nodes = NodeDict(["a", "b"])
+    assert nodes.intern("a") == 0
+    assert nodes.intern("c") == 2
+    assert nodes.ids(["c", "zz", "b"]).tolist() == [2, -1, 1]
+    assert nodes.ids(["a"]).dtype == np.int32
+    assert nodes.labels([2, 0]).tolist() == ["c", "a"]
+    assert "zz" not in nodes and len(nodes) == 3
+
+
+def test_levels_share_labels_and_rows(skg):
+    skg.add_triples([("a", "r", "b"), ("b", "r", "c"), ("c", "r", "a")])
+    for k in range(skg.depth):
+        assert set(skg.levels[k].nodes) == {"a", "b", "c"}
+        i, j = skg.nodes.id("a"), skg.nodes.id("b")
+        assert skg.adjs[k][i, j] > 0
+        assert skg.levels[k].has_edge("a", "b")
+
+
+def test_query_uses_node_dictionary(skg):
+    skg.add_triples([("a", "likes", "b"), ("a", "hates", "c"), ("d", "likes", "b")])
+    assert [(u, v) for u, v, _ in skg.query(["a", None, None])] == [("a", "b"), ("a", "c")]
+    assert [(u, v) for u, v, _ in skg.query([None, "likes", "b"])] == [("a", "b"), ("d", "b")]
+    assert skg.query(["nobody", None, None]) == []
+    assert len(skg.query([None, None, None], k=2)) == 2
@@ -0,0 +1,94 @@
+"""
+Partitioned expansion – per-component work on a process pool matches the serial build
+"""
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from skg import core as skg_core
+from skg import partition
+
+
+@pytest.fixture
+def skg_options():
+    return {"core": {"workers": 2}}
+
+
+def _islands(k=6, size=8, seed=3):
+    rng = np.random.default_rng(seed)
+    blocks = [sp.random(size, size, density=0.3, random_state=rng, format="csr") for _ in range(k)]
+    return sp.block_diag(blocks, format="csr")
+
+
+def test_component_groups_keep_components_whole():
+    adj = _islands()
+    groups = partition.component_groups(adj, 4)
+    assert len(groups) == 4
+    assert sorted(np.concatenate(groups).tolist()) == list(range(adj.shape[0]))
+    _, labels = sp.csgraph.connected_components(adj, directed=True, connection="weak")
+    for g in groups:
+        for other in groups:
+            if other is not g:
+                assert not set(labels[g]) & set(labels[other])
+
+
+def test_parallel_level_matches_serial(skg):
+    prev = _islands()
+    top = (np.arange(prev.shape[0]) % 5 == 0).astype(float)
+    serial = (prev + skg._cross_links(prev) + skg._propose_edges(prev, top=top)).tocsr()
+    try:
+        parallel = partition.expand_level(prev, top, workers=2, proposer=skg.proposer)
+        assert partition.pool(2)._mp_context.get_start_method() != "fork"   # the core runs threads
+    finally:
+        partition.shutdown()
+    assert np.allclose(parallel.toarray(), serial.toarray())
+
+
+def test_core_uses_pool_for_large_levels(skg, monkeypatch):
+    monkeypatch.setattr(partition, "PARALLEL_MIN_NNZ", 0)
+    calls = []
+    expand = partition.expand_level
+    monkeypatch.setattr(partition, "expand_level",
+                        lambda prev, top, workers, proposer:
+                        calls.append(workers) or expand(prev, top, workers, proposer))
+    try:
+        skg.add_triples([(f"a{i}", "rel", f"a{(i + 1) % 6}") for i in range(6)] +
+                        [(f"b{i}", "rel", f"b{(i + 1) % 6}") for i in range(6)])
+    finally:
+        partition.shutdown()
+    assert calls and set(calls) == {2}
+    assert skg.depth == skg_core.MAX_DEPTH
+    assert skg.adjs[1].nnz >= skg.adjs[0].nnz
+
+
+SCRIPT = """
+import json, os, sys
+sys.path.insert(0, {path!r})
+with open({log!r}, "a") as f:                  # the side effect a preloaded __main__ would repeat
+    f.write(f"{{os.getpid()}}\\n")
+if __name__ == "__main__":
+    from multiprocessing import forkserver
+    from skg import partition
+    server = partition.pool(2).submit(os.getppid).result()
+    print(json.dumps({{"server": server, "preload": forkserver._forkserver._preload_modules}}))
+    partition.shutdown()
+"""
+
+
+@pytest.mark.skipif("forkserver" not in multiprocessing.get_all_start_methods(), reason="no forkserver")
+def test_forkserver_never_runs_the_callers_main(tmp_path):
+    log = tmp_path / "imports.log"
+    script = tmp_path / "main.py"
+    script.write_text(SCRIPT.format(path=os.path.join(os.path.dirname(__file__), "..", "skg-core"), log=str(log)))
+    env = {k: v for k, v in os.environ.items() if k != "SKG_POOL_START"}
+    out = subprocess.run([sys.executable, str(script)], capture_output=True, text=True,
+                         env=env, cwd=tmp_path, check=True)
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    assert result["preload"] == ["skg.partition"]
+    assert str(result["server"]) not in log.read_text().split()
@@ -0,0 +1,56 @@
+"""
+Durable base triples – write-through to SQLite, warm start on construction
+"""
+import sqlite3
+
+import pytest
+
+from skg import core as skg_core
+
+
+pytestmark = pytest.mark.usefixtures("no_daemons")
+
+
+def test_triples_survive_restart(tmp_path):
+    db = tmp_path / "skg.db"
+    skg = skg_core.SKGCore(db)
+    skg.add_triples([("a", "r", "b"), ("b", "r", "c"), ("a", "s", "b")])
+    skg.remove_triples([("a", "s", "b")])
+    skg.close()
+
+    c = sqlite3.connect(db)
+    assert c.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert c.execute("SELECT COUNT(*) FROM triples").fetchone()[0] == 2
+    c.close()
+
+    again = skg_core.SKGCore(db)
+    assert again.total_edges == 2
+    assert {(s, p, o) for s, p, o, _ in again.store.match()} == {("a", "r", "b"), ("b", "r", "c")}
+    assert again.depth == skg_core.MAX_DEPTH
+    assert again.adjs[0].nnz == 2
+
+
+def test_repaired_triples_are_deleted(tmp_path):
+    db = tmp_path / "skg.db"
+    skg = skg_core.SKGCore(db)
+    skg.add_triples([("ann", "loves", "bob")])
+    skg.add_triples([("ann", "hates", "bob")])
+    skg.close()
+    assert skg_core.SKGCore(db).store.predicates("ann", "bob") == ["loves"]
+
+
+def test_warm_start_streams_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(skg_core, "LOAD_BATCH", 7)
+    db = tmp_path / "skg.db"
+    skg = skg_core.SKGCore(db)
+    with skg.bulk_load():
+        skg.add_triples([(f"n{i}", "r", f"n{i + 1}") for i in range(30)])
+    skg.close()
+    assert len(skg_core.SKGCore(db).store) == 30
+
+
+def test_persist_can_be_disabled(tmp_path):
+    db = tmp_path / "skg.db"
+    skg = skg_core.SKGCore(db, persist=False)
+    skg.add_triples([("a", "r", "b")])
+    assert skg_core.SKGCore(db).total_edges == 0
@@ -0,0 +1,107 @@
+"""
+Edge proposers – torch-free link-prediction heuristics and the optional GCN backend
+"""
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from skg import core as skg_core
+from skg import propose, scorer
+from skg.propose import make_proposer, link_mask, PROPOSAL_WEIGHT
+
+
+def _graph(edges, n):
+    rows, cols = zip(*edges)
+    return sp.csr_matrix((np.ones(len(edges)), (rows, cols)), shape=(n, n))
+
+
+# 0 → {1, 2},  1 → 3,  2 → {3, 4},  3 → 5,  4 → 0
+EDGES = [(0, 1), (0, 2), (1, 3), (2, 3), (2, 4), (4, 0), (3, 5)]
+
+
+def _scores(name, **kw):
+    p = make_proposer(name, target_pct=None, **kw)
+    mask = link_mask(_graph(EDGES, 6))
+    return p.scores(mask, np.arange(6), p.targets(mask, 1)).toarray()
+
+
+def test_common_neighbors_counts_two_hop_paths():
+    s = _scores("common_neighbors")
+    assert s[0, 3] == 2            # 0→1→3 and 0→2→3
+    assert s[0, 4] == 1            # 0→2→4
+    assert s[4, 1] == 1 and s[4, 2] == 1
+    assert np.all(np.diag(s) == 0)
+
+
+def test_adamic_adar_discounts_hubs():
+    s = _scores("adamic_adar")
+    # 0→3 through 1 (out-degree 1) and 2 (out-degree 2)
+    assert s[0, 3] == pytest.approx(1 / np.log(2) + 1 / np.log(3))
+    assert s[2, 5] == pytest.approx(1 / np.log(2))
+
+
+def test_jaccard_normalises_by_union():
+    s = _scores("jaccard")
+    # out(0) = {1, 2}, in(3) = {1, 2} → identical sets
+    assert s[0, 3] == pytest.approx(1.0)
+    # out(2) = {3, 4}, in(0) = {4}: one shared of two
+    assert s[2, 0] == pytest.approx(0.5)
+
+
+def test_katz_reaches_beyond_two_hops():
+    s = _scores("katz", beta=0.5, hops=3)
+    assert s[0, 5] == pytest.approx(2 * 0.5 ** 3)    # two walks of length 3
+    assert _scores("common_neighbors")[0, 5] == 0
+
+
+def test_fanout_keeps_best_links_per_row():
+    adj = sp.random(60, 60, density=0.15, random_state=np.random.default_rng(1), format="csr")
+    p = make_proposer("adamic_adar", fanout=3, target_pct=None)
+    out = p.propose(link_mask(adj))
+    assert np.diff(out.indptr).max() <= 3
+    assert set(out.data.tolist()) <= {PROPOSAL_WEIGHT}
+    assert (out.multiply(link_mask(adj))).nnz == 0        # only new links
+
+
+def test_proposals_point_at_high_degree_targets():
+    adj = sp.random(60, 60, density=0.1, random_state=np.random.default_rng(4), format="csr")
+    p, mask = make_proposer("common_neighbors"), link_mask(adj)
+    top = p.targets(mask, 1)
+    assert 0 < top.sum() <= 0.1 * 60
+    cols = np.unique(p.propose(mask, top=top).indices)
+    assert cols.size and np.all(top[cols] == 1)
+
+
+@pytest.mark.parametrize("name", ["common_neighbors", "adamic_adar", "jaccard", "katz", "none"])
+def test_row_subset_matches_full(name):
+    adj = sp.random(40, 40, density=0.1, random_state=np.random.default_rng(2), format="csr")
+    p, mask = make_proposer(name), link_mask(adj)
+    rows, top = np.array([3, 7, 11, 30]), np.ones(40)
+    full = p.propose(mask, top=top)
+    assert np.allclose(p.propose(mask, rows, top).toarray(), full[rows].toarray())
+
+
+def test_unknown_proposer_rejected():
+    with pytest.raises(ValueError):
+        make_proposer("psychic")
+    with pytest.raises(TypeError):                  # a heuristic must define its path product
+        propose.HeuristicProposer()
+
+
+def test_heuristic_core_never_builds_the_gnn(skg, monkeypatch):
+    def boom(*a, **kw):
+        raise AssertionError("GNN scorer constructed")
+    monkeypatch.setattr(scorer, "EdgeScorer", boom)
+    skg.add_triples([(f"n{i}", "rel", f"n{(i * 7) % 30}") for i in range(60)] +
+                    [(f"n{i}", "rel", "hub") for i in range(0, 30, 3)])
+    assert skg.depth == skg_core.MAX_DEPTH
+    assert skg.adjs[1].nnz > skg.adjs[0].nnz
+
+
+def test_gcn_backend_stays_available(tmp_path, monkeypatch):
+    monkeypatch.setattr(skg_core, "DB_FILE", tmp_path / "skg.db")
+    monkeypatch.setattr(skg_core, "start_curiosity", lambda core: None)
+    skg = skg_core.SKGCore(propose="gcn")
+    skg.add_triples([(f"n{i}", "rel", f"n{(i * 7) % 30}") for i in range(60)])
+    assert isinstance(skg.proposer, propose.GCNProposer)
+    assert skg.proposer._scorer is not None and skg.proposer._scorer.models
@@ -0,0 +1,65 @@
+"""
+Pruning strategies – streaming quantile sketch, absolute threshold, top-k per row
+"""
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from skg import core as skg_core
+from skg.prune import QuantileSketch, make_pruner
+
+
+def test_sketch_quantile_within_relative_error():
+    values = np.random.default_rng(0).lognormal(size=20_000)
+    sketch = QuantileSketch(alpha=0.01)
+    sketch.add(values)
+    for q in (0.05, 0.5, 0.95):
+        exact = np.quantile(values, q)
+        assert abs(sketch.quantile(q) - exact) <= 0.03 * exact
+
+
+def test_sketch_removal_is_exact():
+    sketch = QuantileSketch()
+    sketch.add([1.0, 2.0, 3.0])
+    before = dict(sketch.counts)
+    sketch.add([0.01, 0.02])
+    sketch.remove([0.01, 0.02])
+    assert sketch.counts == before and sketch.total == 3
+
+
+def test_quantile_pruner_keeps_ties():
+    pruner = make_pruner("quantile")
+    adj = sp.csr_matrix(np.full((4, 4), 0.5))
+    pruner.observe(adj.data)
+    assert pruner.prune(adj).nnz == 16
+
+
+def test_threshold_and_topk():
+    adj = sp.csr_matrix(np.array([[0.05, 0.3, 0.9], [0.2, 0.0, 0.1], [0.0, 0.0, 0.0]]))
+    kept = make_pruner("threshold", min_weight=0.15).prune(adj)
+    assert sorted(kept.data.tolist()) == [0.2, 0.3, 0.9]
+    kept = make_pruner("topk", k=1).prune(adj).toarray()
+    assert kept[0].tolist() == [0, 0, 0.9] and kept[1].tolist() == [0.2, 0, 0]
+    with pytest.raises(ValueError):
+        make_pruner("nope")
+
+
+def test_sketch_follows_incremental_updates(skg):
+    skg.add_triples([(f"n{i}", "rel", f"n{(i * 7) % 30}") for i in range(40)])
+    skg.add_triples([("n3", "rel", "fresh"), ("fresh", "rel", "n9")])
+    assert skg._updates_since_rebuild == 1
+    for k in range(1, skg.depth):
+        expected = QuantileSketch()
+        expected.add(skg.adjs[k].data)
+        assert skg._pruners[k].sketch.counts == expected.counts
+
+
+def test_core_topk_strategy(tmp_path, monkeypatch):
+    monkeypatch.setattr(skg_core, "DB_FILE", tmp_path / "skg.db")
+    monkeypatch.setattr(skg_core, "start_curiosity", lambda core: None)
+    monkeypatch.setattr(skg_core, "make_pruner",
+                        lambda strategy, **kw: make_pruner(strategy, k=2))
+    skg = skg_core.SKGCore(prune="topk")
+    skg.add_triples([("hub", "rel", f"n{i}") for i in range(10)])
+    for k in range(1, skg.depth):
+        assert np.diff(skg.adjs[k].indptr).max() <= 2
@@ -0,0 +1,126 @@
+"""
+Rule materialization – semi-naive forward chaining, derived tags, retraction, vault rules
+"""
+import sqlite3
+
+import pytest
+
+from skg import core as skg_core
+from skg import rules as skg_rules
+from skg.rules import Rule, RuleEngine, load_rules
+from skg.store import TripleStore
+
+TRANSITIVE = Rule("isA_transitive", ["?x", "isA", "?z"], [["?x", "isA", "?y"], ["?y", "isA", "?z"]])
+
+
+@pytest.fixture
+def skg_options():
+    return {"rules": [TRANSITIVE]}
+
+
+def _chain(store, engine, n):
+    facts = [(f"c{i}", "isA", f"c{i + 1}") for i in range(n)]
+    for t in facts:
+        store.add(*t)
+    return engine.materialize(store, facts)
+
+
+def test_rules_must_be_range_restricted():
+    with pytest.raises(ValueError):
+        Rule("bad", ["?x", "isA", "?w"], [["?x", "isA", "?y"]])
+    with pytest.raises(ValueError):
+        Rule("bad", ["?x", "isA"], [["?x", "isA", "?y"]])
+
+
+def test_transitive_closure():
+    store, engine = TripleStore(), RuleEngine([TRANSITIVE])
+    derived = _chain(store, engine, 5)            # c0 … c5
+    assert len(derived) == 15 - 5                  # all pairs i < j minus the asserted links
+    assert ("c0", "isA", "c5") in store and engine.is_derived(("c0", "isA", "c5"))
+    assert not engine.is_derived(("c0", "isA", "c1"))
+
+
+def test_insert_is_incremental():
+    store, engine = TripleStore(), RuleEngine([TRANSITIVE])
+    _chain(store, engine, 5)
+    store.add("c5", "isA", "c6")
+    new = engine.materialize(store, [("c5", "isA", "c6")])
+    assert sorted(new) == sorted((f"c{i}", "isA", "c6") for i in range(5))
+    assert engine.materialize(store, [("c5", "isA", "c6")]) == []    # nothing new twice
+
+
+def test_rematerialize_drops_unsupported():
+    store, engine = TripleStore(), RuleEngine([TRANSITIVE])
+    _chain(store, engine, 3)                                          # c0 … c3
+    store.remove("c1", "isA", "c2")
+    dropped, added = engine.rematerialize(store)
+    assert ("c0", "isA", "c2") in dropped and ("c0", "isA", "c3") in dropped
+    assert not added and ("c0", "isA", "c2") not in store
+
+
+def test_vault_rules_load():
+    names = {r.name for r in load_rules()}
+    assert "isA_transitive" in names and "member_of_inherits_subgroup" in names
+    assert load_rules(skg_rules.VAULT_ROOT / "missing.json") == []
+
+
+def test_core_tags_and_never_persists_derived(skg):
+    skg.add_triples([("cat", "isA", "mammal"), ("mammal", "isA", "animal")])
+    rows = skg.query(["cat", "isA", None], k=10)
+    tags = {v: d.get("derived", False) for _, v, d in rows}
+    assert tags == {"mammal": False, "animal": True}
+    assert skg.total_edges == 2
+    assert skg.adjs[0][skg.nodes.id("cat"), skg.nodes.id("animal")] > 0
+    stored = sqlite3.connect(skg.db_path).execute("SELECT s, p, o FROM triples").fetchall()
+    assert ("cat", "isA", "animal") not in stored
+
+
+def test_core_retracts_when_premise_removed(skg):
+    skg.add_triples([("cat", "isA", "mammal"), ("mammal", "isA", "animal")])
+    skg.remove_triples([("mammal", "isA", "animal")])
+    assert ("cat", "isA", "animal") not in skg.store
+    assert skg.adjs[0][skg.nodes.id("cat"), skg.nodes.id("animal")] == 0
+    assert skg.total_edges == 1
+
+
+def test_asserting_a_derived_fact_makes_it_base(skg):
+    skg.add_triples([("cat", "isA", "mammal"), ("mammal", "isA", "animal")])
+    skg.add_triples([("cat", "isA", "animal")])
+    skg.remove_triples([("mammal", "isA", "animal")])
+    assert ("cat", "isA", "animal") in skg.store
+    assert not skg.rules.is_derived(("cat", "isA", "animal"))
+
+
+def test_warm_start_and_bulk_rederive(skg):
+    with skg.bulk_load():
+        skg.add_triples([("cat", "isA", "mammal"), ("mammal", "isA", "animal")])
+        assert ("cat", "isA", "animal") not in skg.store      # deferred to the flush
+    assert skg.rules.is_derived(("cat", "isA", "animal"))
+    skg.close()
+    again = skg_core.SKGCore()
+    assert again.rules.is_derived(("cat", "isA", "animal"))
+    assert again.total_edges == 2
+
+
+
+def test_bulk_flush_derives_from_the_session_only(skg, monkeypatch):
+    skg.add_triples([(f"x{i}", "r", f"x{i + 1}") for i in range(20)] + [("cat", "isA", "mammal")])
+    deltas = []
+    derive = skg._derive
+    monkeypatch.setattr(skg, "_derive", lambda delta: deltas.append(list(delta)) or derive(delta))
+    with skg.bulk_load():
+        skg.add_triples([("mammal", "isA", "animal")])
+    assert deltas == [[("mammal", "isA", "animal")]]
+    assert skg.rules.is_derived(("cat", "isA", "animal"))   # joined against the older fact
+
+def test_asserted_fact_beats_a_contradicting_derivation(skg):
+    skg.add_triples([("a", "isNotA", "c")])
+    skg.add_triples([("a", "isA", "b"), ("b", "isA", "c")])
+    assert ("a", "isNotA", "c") in skg.store and ("a", "isA", "c") not in skg.store
+    skg.close()
+    again = skg_core.SKGCore()                      # whole-store repair on the bulk flush
+    assert ("a", "isNotA", "c") in again.store and ("a", "isA", "c") not in again.store
+    stored = sqlite3.connect(again.db_path).execute("SELECT s, p, o FROM triples").fetchall()
+    assert ("a", "isNotA", "c") in stored
+    again.remove_triples([("a", "isNotA", "c")])    # the blocked conclusion returns
+    assert again.rules.is_derived(("a", "isA", "c"))
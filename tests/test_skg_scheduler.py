@@ -0,0 +1,77 @@
+"""
+Background job scheduler – single instance, cancellation, CPU budgets, status
+"""
+import time
+
+import pytest
+
+from skg import core as skg_core
+from skg.scheduler import Deferred, Scheduler
+
+
+@pytest.fixture
+def jobs():
+    scheduler = Scheduler()
+    yield scheduler
+    scheduler.stop(timeout=5)
+
+
+def _wait(cond, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not cond() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return cond()
+
+
+def test_single_instance_and_cancel(jobs):
+    runs = []
+    job = jobs.register("tick", lambda job: runs.append(1), interval=0.01, delay=0)
+    thread = jobs._thread
+    assert jobs.register("tick", lambda job: None, interval=5) is job
+    assert jobs._thread is thread
+    assert _wait(lambda: len(runs) >= 3)
+    assert jobs.cancel("tick") and job.cancelled.is_set()
+    seen = len(runs)
+    time.sleep(0.1)
+    assert len(runs) <= seen + 1
+    assert not jobs.cancel("tick")
+
+
+def test_cpu_budget_throttles(jobs):
+    def burn(job):
+        end = time.thread_time() + 0.05
+        while time.thread_time() < end:
+            pass
+    job = jobs.register("burn", burn, interval=0.01, cpu_budget=0.1, delay=0)
+    assert _wait(lambda: job.runs >= 1)
+    status = {j["name"]: j for j in jobs.status()["jobs"]}["burn"]
+    assert status["throttled"] and status["next_run_in"] > 0.2
+    assert job.runs == 1
+
+
+def test_errors_and_deferrals_are_recorded(jobs):
+    def busy(job):
+        raise Deferred()
+    deferred = jobs.register("busy", busy, interval=0.01, delay=0)
+    broken = jobs.register("broken", lambda job: 1 / 0, interval=10, delay=0)
+    assert _wait(lambda: deferred.deferrals >= 2 and broken.runs == 1)
+    assert deferred.runs == 0 and "ZeroDivisionError" in broken.last_error
+
+
+def test_core_background_jobs_are_idempotent(tmp_path, monkeypatch):
+    monkeypatch.setattr(skg_core, "DB_FILE", tmp_path / "skg.db")
+    skg = skg_core.SKGCore()
+    skg.add_triples([(f"n{i}", "rel", f"n{i + 1}") for i in range(60)])   # bootstrap
+    names = {j["name"] for j in skg.scheduler.status()["jobs"]}
+    assert names == {"curiosity", "invent", "retrain", "rebuild", "snapshot"}
+    first = skg.scheduler.get("curiosity")
+    skg.start_curiosity_daemon()
+    skg.start_background()
+    assert skg.scheduler.get("curiosity") is first
+    skg.stop_curiosity_daemon()
+    assert "curiosity" not in skg.scheduler
+    skg.scheduler.run_now("snapshot")
+    assert _wait(lambda: skg.scheduler.get("snapshot").runs == 1)
+    assert skg.snapshot_dir.exists()
+    skg.close()
+    assert skg.scheduler.status()["jobs"] == []
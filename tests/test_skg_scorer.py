@@ -0,0 +1,42 @@
+"""
+Edge scorer – compact features, warm start, checkpoint round trip
+"""
+import numpy as np
+import scipy.sparse as sp
+
+from skg import scorer as skg_scorer
+from skg.scorer import EdgeScorer, node_features, N_FEATURES
+
+
+def _ring(n):
+    rows = np.arange(n)
+    return sp.csr_matrix((np.ones(n), (rows, (rows + 1) % n)), shape=(n, n))
+
+
+def test_features_do_not_grow_with_graph():
+    assert tuple(node_features(_ring(10)).shape) == (10, N_FEATURES)
+    assert tuple(node_features(_ring(5000)).shape) == (5000, N_FEATURES)
+
+
+def test_scores_never_refit_a_fitted_level(tmp_path, monkeypatch):
+    scorer = EdgeScorer(tmp_path / "gnn.pt")
+    fits = []
+    real_fit = scorer.fit
+    monkeypatch.setattr(scorer, "fit", lambda *a, **kw: fits.append(a[1]) or real_fit(*a, **kw))
+    scorer.scores(_ring(20), 1)
+    scorer.scores(_ring(21), 1)
+    assert fits == [1]
+    scorer.touch(skg_scorer.RETRAIN_EDGES)
+    scorer.scores(_ring(22), 1)
+    assert fits == [1] and scorer.due(1)          # due, but left to the scheduled retrain
+    scorer.retrain({0: _ring(22)})
+    assert fits == [1, 1] and not scorer.due(1)
+
+
+def test_checkpoint_round_trip(tmp_path):
+    path = tmp_path / "gnn.pt"
+    first = EdgeScorer(path)
+    expected = first.scores(_ring(30), 2)
+    second = EdgeScorer(path)
+    assert 2 in second.models and not second.due(2)
+    assert np.allclose(second.scores(_ring(30), 2), expected)
@@ -0,0 +1,135 @@
+"""
+Sharded SKG – subject-hash routing, scatter-gather queries and boundary-edge exchange
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import pytest
+
+from skg.shard import ShardRouter, shard_of
+
+
+def _owned_by(shard, count, prefix, n=1):
+    """First `n` labels `prefix0, prefix1, …` that hash to `shard`."""
+    out, i = [], 0
+    while len(out) < n:
+        label = f"{prefix}{i}"
+        if shard_of(label, count) == shard:
+            out.append(label)
+        i += 1
+    return out
+
+
+@pytest.fixture(scope="module")
+def router(tmp_path_factory):
+    r = ShardRouter(2, db_path=tmp_path_factory.mktemp("shards") / "skg.db")
+    yield r
+    r.close()
+
+
+def test_shard_of_is_stable():
+    assert shard_of("alice", 4) == shard_of("alice", 4)
+    assert {shard_of(f"n{i}", 4) for i in range(64)} == {0, 1, 2, 3}
+
+
+def test_writes_route_by_subject(router):
+    a, = _owned_by(0, 2, "a")
+    b, = _owned_by(1, 2, "b")
+    router.add_triples([(a, "likes", "x"), (b, "likes", "y")])
+    stats = router.stats()
+    assert stats[0]["triples"] >= 1 and stats[1]["triples"] >= 1
+    assert router.query([a, None, None], k=5) == [(a, "x", {"predicate": "likes", "weight": 1.0})]
+    assert [v for _, v, _ in router.query([b, None, None], k=5)] == ["y"]
+
+
+def test_scatter_gather_merges_shards(router):
+    subs = _owned_by(0, 2, "s", 3) + _owned_by(1, 2, "t", 3)
+    router.add_triples([(s, "tagged", "topic") for s in subs])
+    rows = router.query([None, "tagged", None], k=10)
+    assert sorted(u for u, _, _ in rows) == sorted(subs)
+    assert len(router.query([None, "tagged", None], k=4)) == 4
+
+
+def test_boundary_edges_are_exchanged(router):
+    u, = _owned_by(0, 2, "u")
+    v, = _owned_by(1, 2, "v")
+    before = router.stats()[0]["ghost_edges"]
+    # u → v crosses shards: shard 0 now needs v's out-edges
+    router.add_triples([(u, "knows", v), (v, "knows", "w1"), (v, "knows", "w2")])
+    assert router.stats()[0]["ghost_edges"] == before + 2
+    assert 0 in router.needs[v]
+    # ghost copies never answer queries – only the owner does
+    assert sorted(o for _, o, _ in router.query([v, None, None], k=10)) == ["w1", "w2"]
+    assert router.query([None, "~ghost", None]) == []
+
+    router.remove_triples([(v, "knows", "w1")])
+    assert router.stats()[0]["ghost_edges"] == before + 1
+
+
+def test_submit_and_wait(router):
+    s, = _owned_by(1, 2, "q")
+    ticket = router.submit([(s, "is", "queued")])
+    version = router.wait_for(ticket, timeout=30)
+    assert version is not None and version >= ticket
+    assert router.query([s, None, None]) != []
+    assert router.status()["alive"] == [True, True]
+
+
+
+def test_http_single_core_endpoints_answer_501(router, monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+    import skg_api
+    monkeypatch.setattr(skg_api, "skg_core", router)
+    client = TestClient(skg_api.app)
+    assert client.post("/bulk/begin").status_code == 501
+    assert client.get("/export").status_code == 501
+    assert client.get("/admin/snapshot").status_code == 501
+    assert client.post("/admin/snapshot").status_code == 501
+
+def test_boundary_registry_survives_a_restart(tmp_path):
+    u, = _owned_by(0, 2, "u")
+    v, = _owned_by(1, 2, "v")
+    first = ShardRouter(2, db_path=tmp_path / "skg.db")
+    try:
+        first.add_triples([(u, "knows", v), (v, "knows", "w1")])
+        assert first.stats()[0]["ghost_edges"] == 1
+    finally:
+        first.close()
+    again = ShardRouter(2, db_path=tmp_path / "skg.db")
+    try:
+        assert again.needs[v] == {0}
+        again.add_triples([(v, "knows", "w2")])       # pushed to shard 0 again
+        assert again.stats()[0]["ghost_edges"] == 2
+    finally:
+        again.close()
+
+
+def test_api_script_serves_shards(tmp_path):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("uvicorn")
+    with socket.socket() as sock:                   # a free port
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    script = os.path.join(os.path.dirname(__file__), '..', 'skg-core', 'skg_api.py')
+    env = dict(os.environ, SKG_SHARDS="2", SKG_API_PORT=str(port), UCM_SKG_DB=str(tmp_path / "skg.db"))
+    proc = subprocess.Popen([sys.executable, script], env=env, cwd=tmp_path,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    try:
+        deadline, status = time.time() + 60, None
+        while status is None and time.time() < deadline:
+            assert proc.poll() is None, proc.stderr.read()
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/shards", timeout=5) as resp:
+                    status = json.loads(resp.read())
+            except OSError:
+                time.sleep(0.2)
+        assert status and status["shards"] == 2 and status["alive"] == [True, True]
+    finally:
+        proc.terminate()
+        proc.wait(30)
@@ -0,0 +1,95 @@
+"""
+Binary snapshots – mmap warm start without re-expansion
+"""
+import numpy as np
+import pytest
+
+from skg import core as skg_core
+from skg import snapshot
+
+
+pytestmark = pytest.mark.usefixtures("no_daemons")
+
+
+TRIPLES = [(f"n{i}", "rel", f"n{(i * 7) % 25}") for i in range(30)]
+
+
+def test_save_and_warm_start_from_snapshot(tmp_path, monkeypatch):
+    db = tmp_path / "skg.db"
+    skg = skg_core.SKGCore(db)
+    skg.add_triples(TRIPLES)
+    path = skg.save_snapshot()
+    skg.close()
+    assert snapshot.read_meta(path)["generation"] == 1
+
+    monkeypatch.setattr(skg_core.SKGCore, "expand_recursive",
+                        lambda self: pytest.fail("warm start re-expanded"))
+    again = skg_core.SKGCore(db)
+    assert again.depth == skg.depth
+    assert list(again.nodes) == list(skg.nodes)
+    for k in range(skg.depth):
+        assert not again.adjs[k].data.flags.writeable      # read-only mmap pages
+        assert np.allclose(again.adjs[k].toarray(), skg.adjs[k].toarray())
+        assert set(again.levels[k].edges) == set(skg.levels[k].edges)
+    for k in range(1, skg.depth):                           # sketches re-seeded from the levels
+        assert again._pruners[k].sketch.counts == skg._pruners[k].sketch.counts
+
+
+def test_stale_snapshot_is_ignored(tmp_path):
+    db = tmp_path / "skg.db"
+    skg = skg_core.SKGCore(db)
+    skg.add_triples(TRIPLES)
+    skg.save_snapshot()
+    skg.add_triples([("late", "rel", "n1")])
+    skg.close()
+    again = skg_core.SKGCore(db)
+    assert again.adjs[0].shape[0] == len(again.nodes)
+    assert again.levels[1].has_node("late")
+
+
+def test_updates_after_mmap_load(tmp_path):
+    db = tmp_path / "skg.db"
+    skg = skg_core.SKGCore(db)
+    skg.add_triples(TRIPLES)
+    skg.save_snapshot()
+    skg.close()
+    again = skg_core.SKGCore(db)
+    again.add_triples([("n1", "rel", "fresh")])
+    assert again.adjs[1].shape[0] == len(again.nodes)
+    assert again.levels[1].has_node("fresh")
+
+
+def test_old_generations_are_pruned(tmp_path):
+    skg = skg_core.SKGCore(tmp_path / "skg.db")
+    skg.add_triples(TRIPLES[:5])
+    for _ in range(4):
+        last = skg.save_snapshot()
+    gens = sorted(p.name for p in skg.snapshot_dir.iterdir() if p.is_dir())
+    assert gens == ["00000003", "00000004"]
+    assert snapshot.latest(skg.snapshot_dir) == last
+
+
+def test_no_snapshot_of_an_open_bulk_load(tmp_path):
+    db = tmp_path / "skg.db"
+    skg = skg_core.SKGCore(db)
+    skg.add_triples(TRIPLES[:10])
+    with skg.bulk_load():
+        skg.add_triples(TRIPLES[10:])
+        with pytest.raises(RuntimeError):
+            skg.save_snapshot()                         # K⁰ is stale until the flush
+    skg.save_snapshot()
+    skg.close()
+    again = skg_core.SKGCore(db)
+    assert again.adjs[0].nnz == again.levels[0].number_of_edges() == len(set(TRIPLES))
+
+
+def test_runtime_load_of_an_outdated_snapshot_is_refused(tmp_path):
+    skg = skg_core.SKGCore(tmp_path / "skg.db")
+    skg.add_triples(TRIPLES)
+    skg.save_snapshot()
+    skg.add_triples([("late", "rel", "n1")])
+    with pytest.raises(ValueError):
+        skg.load_snapshot()
+    assert skg.adjs[0].nnz == skg.levels[0].number_of_edges() == len(skg.store)
+    skg.save_snapshot()
+    assert skg.load_snapshot()["triples"] == len(skg.store)
@@ -0,0 +1,41 @@
+"""
+Sparse level store – K⁰…Kᴹᴬˣ must stay scipy.sparse end to end
+"""
+import numpy as np
+import scipy.sparse as sp
+import pytest
+
+from skg import core as skg_core
+
+
+@pytest.fixture
+def skg_options():
+    return {"curiosity": True}
+
+
+def test_levels_are_sparse(skg):
+    skg.add_triples([("a", "r", "b"), ("b", "r", "c"), ("c", "r", "a"), ("c", "r", "d")])
+    assert skg.depth == skg_core.MAX_DEPTH
+    for lvl in range(skg.depth):
+        assert sp.issparse(skg.adjs[lvl])
+        assert skg.adjs[lvl].shape == (4, 4)
+
+
+def test_block_matrix_dense_only_on_request(skg):
+    skg.add_triples([("a", "r", "b"), ("b", "r", "c")])
+    block = skg.block_matrix()
+    assert sp.issparse(block.tocsr())
+    assert block.shape == (3 * skg.depth, 3 * skg.depth)
+    dense = skg.block_matrix(dense=True)
+    assert isinstance(dense, np.ndarray)
+    assert np.allclose(block.tocsr().toarray(), dense)
+    # off-by-two blocks stay empty
+    assert not dense[:3, 6:9].any()
+
+
+def test_prune_keeps_sparse_and_drops_low_weights(skg):
+    adj = sp.csr_matrix(np.array([[0, 0.01, 1.0], [1.0, 0, 1.0], [1.0, 1.0, 0]]))
+    pruned = skg._prune(adj)
+    assert sp.issparse(pruned)
+    assert pruned[0, 1] == 0
+    assert pruned.nnz == 5
@@ -0,0 +1,99 @@
+"""
+Snapshot-isolated reads – a pinned GraphState never changes under a writer
+"""
+import threading
+
+import networkx as nx
+import pytest
+
+from skg.state import GraphState
+
+BASE = [(f"n{i}", "rel", f"n{(i * 7) % 30}") for i in range(40)]
+
+
+@pytest.fixture
+def skg(skg):
+    skg.add_triples(BASE)
+    return skg
+
+
+def test_state_query_matches_level_views(skg):
+    state = skg.state()
+    assert state.version == skg.version and state.depth == skg.depth
+    for k in range(1, skg.depth):
+        G = skg.levels[k]
+        out = {(u, v) for u, v, _ in state.query(skg.nodes, ["n3", None, None], k=100, level=k)}
+        assert out == set(G.out_edges("n3"))
+        into = {(u, v) for u, v, _ in skg.query([None, None, "n3"], k=100, level=k)}
+        assert into == set(G.in_edges("n3"))
+        assert len(skg.query([None, None, None], k=5, level=k)) == min(5, G.number_of_edges())
+        assert skg.query(["n3", "rel", None], level=k) == []
+
+
+def test_pinned_state_is_unchanged_by_writes(skg):
+    pinned = skg.state()
+    before = {k: pinned.adjs[k].toarray().copy() for k in pinned.levels}
+    rows = pinned.query(skg.nodes, ["n3", None, None], k=100, level=1)
+    skg.add_triples([("n3", "rel", "fresh"), ("fresh", "rel", "n9")])
+    skg.remove_triples([("n1", "rel", "n7")])
+    assert skg.state().version > pinned.version
+    assert all((pinned.adjs[k].toarray() == before[k]).all() for k in before)
+    assert pinned.query(skg.nodes, ["n3", None, None], k=100, level=1) == rows
+    # a node born after the pinned version is unknown to it
+    assert pinned.query(skg.nodes, ["fresh", None, None], level=1) == []
+    assert skg.query(["fresh", None, None], level=1)
+
+
+def test_reads_never_fail_during_writes(skg):
+    errors, done = [], threading.Event()
+
+    def reader():
+        while not done.is_set():
+            try:
+                state = skg.state()
+                for k in state.levels:
+                    skg.query([None, None, "n3"], k=50, level=k, state=state)
+                    state.graph(k).number_of_edges()
+                skg.query([None, "rel", None], k=50)
+            except Exception as e:       # pragma: no cover - the failure we guard against
+                errors.append(e)
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for i in range(30):
+        skg.add_triples([(f"w{i}", "rel", f"n{i % 30}")])
+    done.set()
+    for t in threads:
+        t.join()
+    assert errors == []
+
+
+def test_derived_views_are_built_on_demand(skg, monkeypatch):
+    built = []
+    graph = GraphState.graph
+    monkeypatch.setattr(GraphState, "graph", lambda self, k: built.append(k) or graph(self, k))
+    skg.add_triples([("n3", "rel", "fresh")])
+    skg.depth = 1
+    skg.expand_recursive()
+    assert built == []                              # expansions keep no nx copy of the weights
+    G = skg.levels[1]
+    assert built == [1] and nx.is_frozen(G)
+    assert G.number_of_edges() == skg.state().shape(1)[1] and G.has_node("fresh")
+    assert skg.levels[1] is G and set(skg.levels) == set(skg.state().levels)
+
+def test_edges_and_stats_read_the_pinned_state(skg, monkeypatch):
+    pinned = skg.state()
+    rows = skg.edges(1, pinned)
+    assert len(rows) == pinned.shape(1)[1]
+    assert sorted((u, d["predicate"], v) for u, v, d in skg.edges(0)) == sorted(set(BASE))
+    skg.add_triples([("n3", "rel", "fresh")])
+    assert skg.edges(1, pinned) == rows
+
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+    import skg_api
+    monkeypatch.setattr(skg_api, "skg_core", skg)
+    levels = TestClient(skg_api.app).get("/stats").json()["levels"]
+    state = skg.state()
+    assert levels == {str(k): dict(zip(("nodes", "edges"), state.shape(k))) for k in state.levels}
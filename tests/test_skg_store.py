@@ -0,0 +1,58 @@
+"""
+Triple store – SPO / POS / OSP indexes kept in step on insert and delete
+"""
+import pytest
+
+from skg import core as skg_core
+from skg.store import TripleStore
+
+TRIPLES = [
+    ("alice", "worksAt", "mit"),
+    ("bob", "worksAt", "mit"),
+    ("alice", "knows", "bob"),
+    ("alice", "likes", "bob"),
+    ("carol", "worksAt", "cmu"),
+]
+
+
+@pytest.fixture
+def store():
+    st = TripleStore()
+    for t in TRIPLES:
+        st.add(*t)
+    return st
+
+
+@pytest.mark.parametrize("pattern", [
+    (None, None, None), ("alice", None, None), (None, "worksAt", None),
+    (None, None, "bob"), ("alice", "knows", None), (None, "worksAt", "mit"),
+    ("alice", None, "bob"), ("alice", "likes", "bob"), ("zed", None, None),
+])
+def test_match_agrees_with_scan(store, pattern):
+    expected = {t for t in TRIPLES
+                if all(q is None or q == v for q, v in zip(pattern, t))}
+    got = {(s, p, o) for s, p, o, _ in store.match(*pattern)}
+    assert got == expected
+    assert store.estimate(*pattern) >= len(expected)
+
+
+def test_remove_updates_every_index(store):
+    assert store.remove("alice", "knows", "bob")
+    assert not store.remove("alice", "knows", "bob")
+    assert ("alice", "knows", "bob") not in store
+    assert store.predicates("alice", "bob") == ["likes"]
+    assert [t[:3] for t in store.match(None, "knows", None)] == []
+    assert len(store) == len(TRIPLES) - 1
+    assert store.estimate(None, "knows", None) == 0
+
+
+def test_core_query_returns_every_predicate(tmp_path, monkeypatch):
+    monkeypatch.setattr(skg_core, "DB_FILE", tmp_path / "skg.db")
+    skg = skg_core.SKGCore()
+    skg.add_triples(TRIPLES)
+    assert {d["predicate"] for _, _, d in skg.query(["alice", None, "bob"])} == {"knows", "likes"}
+    skg.remove_triples([("alice", "likes", "bob"), ("alice", "knows", "bob")])
+    assert skg.query(["alice", None, "bob"]) == []
+    assert not skg.levels[0].has_edge("alice", "bob")
+    i, j = skg.nodes.id("alice"), skg.nodes.id("bob")
+    assert skg.adjs[0][i, j] == 0
@@ -0,0 +1,109 @@
+"""
+Neighbourhood and path traversal – vectorized CSR frontiers, limits, predicate filters, HTTP streaming
+"""
+import json
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from skg import traverse
+from skg.traverse import Expansion, gather, oriented
+
+
+@pytest.fixture
+def skg_options():
+    return {"rules": []}
+
+
+def _adj(edges, n, weights=None):
+    rows, cols = zip(*edges)
+    data = np.ones(len(edges)) if weights is None else np.asarray(weights, dtype=float)
+    return sp.csr_matrix((data, (rows, cols)), shape=(n, n))
+
+
+def _reached(expansion):
+    return {x: h.depth for h in expansion for x in h.nodes.tolist()}
+
+
+def test_gather_matches_row_slices_and_keeps_heaviest():
+    adj = _adj([(0, 1), (0, 2), (0, 3), (2, 4), (3, 0)], 5, [1, 5, 3, 2, 4])
+    src, dst, w, clipped = gather(adj, np.array([0, 2]))
+    assert not clipped
+    assert sorted(zip(src.tolist(), dst.tolist())) == [(0, 1), (0, 2), (0, 3), (2, 4)]
+    src, dst, w, clipped = gather(adj, np.array([0, 2]), fanout=2)
+    assert clipped and sorted(zip(src.tolist(), dst.tolist())) == [(0, 2), (0, 3), (2, 4)]
+
+
+def test_expansion_is_breadth_first_with_first_parent():
+    adj = _adj([(0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (4, 0)], 5)
+    hops = list(Expansion(adj, 0, hops=3))
+    assert _reached(iter(hops)) == {1: 1, 2: 1, 3: 2, 4: 3}
+    assert hops[1].via.tolist() == [1]                # seed and revisits never re-emitted
+    assert _reached(Expansion(oriented(adj, "in"), 3, hops=1)) == {1: 1, 2: 1}
+    assert _reached(Expansion(oriented(adj, "both"), 0, hops=1)) == {1: 1, 2: 1, 4: 1}
+
+
+def test_expansion_limits():
+    star = _adj([(0, i) for i in range(1, 101)] + [(i, i + 100) for i in range(1, 101)], 201)
+    capped = Expansion(star, 0, hops=2, max_nodes=150, chunk=40)
+    batches = list(capped)
+    assert capped.truncated == "max_nodes" and capped.reached == 150
+    assert max(len(h.nodes) for h in batches) == 40
+    fanned = Expansion(star, 0, hops=2, fanout=5)
+    assert len(_reached(fanned)) == 10 and fanned.clipped and fanned.truncated is None
+    late = Expansion(star, 0, hops=2, timeout=-1)
+    assert list(late) == [] and late.truncated == "timeout"
+    with pytest.raises(ValueError):
+        Expansion(star, 0, hops=traverse.MAX_HOPS + 1)
+
+
+def test_paths_are_all_shortest():
+    adj = _adj([(0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (0, 4), (4, 5)], 6)
+    assert sorted(traverse.paths(adj, 0, 3)) == [[0, 1, 3], [0, 2, 3]]
+    assert list(traverse.paths(adj, 0, 5)) == [[0, 4, 5]]
+    assert len(list(traverse.paths(adj, 0, 3, max_paths=1))) == 1
+    assert list(traverse.paths(adj, 5, 0)) == []
+    assert list(traverse.paths(adj, 0, 5, max_hops=1)) == []
+
+
+def test_ego_network_of_a_10k_hub_is_one_gather():
+    n = 20_001
+    adj = _adj([(0, i) for i in range(1, n)], n)
+    expansion = Expansion(adj, 0, hops=2)
+    assert sum(len(h.nodes) for h in expansion) == n - 1
+
+
+def test_core_neighbors_predicate_filter_and_levels(skg):
+    skg.add_triples([("a", "knows", "b"), ("b", "knows", "c"), ("a", "likes", "d"), ("d", "knows", "e")])
+    assert _reached(skg.neighbors("a", hops=2)) == {"b": 1, "d": 1, "c": 2, "e": 2}
+    assert _reached(skg.neighbors("a", hops=2, predicates=["knows"])) == {"b": 1, "c": 2}
+    assert _reached(skg.neighbors("c", hops=2, predicates=["knows"], direction="in")) == {"b": 1, "a": 2}
+    assert list(skg.paths("a", "e")) == [["a", "d", "e"]]
+    assert list(skg.paths("a", "e", predicates=["knows"])) == []
+    with pytest.raises(KeyError):
+        skg.neighbors("nobody")
+    with pytest.raises(ValueError):
+        skg.neighbors("a", level=1, predicates=["knows"])
+    skg.add_triples([("c", "knows", "f")])     # new version – filtered adjacency rebuilt
+    assert "f" in _reached(skg.neighbors("a", hops=3, predicates=["knows"]))
+
+
+def test_http_neighbors_and_paths_stream_ndjson(skg, monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+    import skg_api
+    monkeypatch.setattr(skg_api, "skg_core", skg)
+    client = TestClient(skg_api.app)
+    skg.add_triples([("a", "r", "b"), ("b", "r", "c"), ("a", "s", "c")])
+
+    resp = client.get("/neighbors", params={"node": "a", "hops": 2, "predicates": "r"})
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(l) for l in resp.text.splitlines()]
+    assert [(l["hop"], l["nodes"], l["via"]) for l in lines[:-1]] == [(1, ["b"], ["a"]), (2, ["c"], ["b"])]
+    assert lines[-1]["done"] and lines[-1]["reached"] == 2 and lines[-1]["truncated"] is None
+
+    lines = [json.loads(l) for l in client.get("/paths", params={"source": "a", "target": "c"}).text.splitlines()]
+    assert lines[0] == {"path": ["a", "c"], "length": 1} and lines[-1]["paths"] == 1
+    assert client.get("/neighbors", params={"node": "zz"}).status_code == 404
+    assert client.get("/neighbors", params={"node": "a", "direction": "up"}).status_code == 400